@@ -33,6 +33,15 @@ class Conf(_config.ConfigNamespace):
         '',
         'Optional default username for CASDA archive.'
     )
+    download_threads = _config.ConfigItem(
+        4,
+        'Number of files to download in parallel in download_files.'
+    )
+    download_retries = _config.ConfigItem(
+        2,
+        'Number of times a download is retried when it fails checksum verification, or with a '
+        'connection or server error.'
+    )
 
 
 conf = Conf()
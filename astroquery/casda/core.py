@@ -1,16 +1,22 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
 from io import BytesIO
 import os
 from urllib.parse import unquote, urlparse
 import time
+import warnings
+import zlib
 from xml.etree import ElementTree
 from datetime import datetime, timezone
 import keyring
+import requests
 
 import astropy.units as u
 import astropy.coordinates as coord
 from astropy.table import Table
+import astropy.utils.data
 from astropy.io.votable import parse
 from astroquery import log
 import numpy as np
@@ -19,7 +25,7 @@ from ..query import QueryWithLogin
 from ..utils import commons
 from ..utils import async_to_sync
 from . import conf
-from ..exceptions import LoginError
+from ..exceptions import LoginError, CorruptDataWarning
 
 
 __all__ = ['Casda', 'CasdaClass']
@@ -39,6 +45,8 @@ class CasdaClass(QueryWithLogin):
     TIMEOUT = conf.timeout
     POLL_INTERVAL = conf.poll_interval
     USERNAME = conf.username
+    DOWNLOAD_THREADS = conf.download_threads
+    DOWNLOAD_RETRIES = conf.download_retries
     _soda_base_url = conf.soda_base_url
     _login_url = conf.login_url
     _uws_ns = {'uws': 'http://www.ivoa.net/xml/UWS/v1.0'}
@@ -241,7 +249,7 @@ class CasdaClass(QueryWithLogin):
         now = str(datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%f'))
         return table[(table['obs_release_date'] != '') & (table['obs_release_date'] < now)]
 
-    def _create_job(self, table, service_name, verbose):
+    def _get_soda_tokens(self, table, service_name):
         # Use datalink to get authenticated access for each file
         tokens = []
         soda_url = None
@@ -260,6 +268,11 @@ class CasdaClass(QueryWithLogin):
         if not soda_url:
             raise ValueError('You do not have access to any of the requested data files.')
 
+        return soda_url, tokens
+
+    def _create_job(self, table, service_name, verbose):
+        soda_url, tokens = self._get_soda_tokens(table, service_name)
+
         # Create job to stage all files
         job_url = self._create_soda_job(tokens, soda_url=soda_url)
         if verbose:
@@ -268,21 +281,27 @@ class CasdaClass(QueryWithLogin):
         return job_url
 
     def _complete_job(self, job_url, verbose):
-        # Wait for job to be complete
-        final_status = self._run_job(job_url, verbose, poll_interval=self.POLL_INTERVAL)
-        if final_status != 'COMPLETED':
-            if verbose:
-                log.info("Job ended with status " + final_status)
-            raise ValueError('Data staging job did not complete successfully. Status was ' + final_status)
+        for _, fileurls in self._complete_jobs([job_url], verbose):
+            return fileurls
+
+    def _complete_jobs(self, job_urls, verbose):
+        """
+        Run a set of jobs, yielding the job url and list of result file urls for each job as soon as it completes.
+        """
+        for job_url, final_status in self._run_jobs(job_urls, verbose, poll_interval=self.POLL_INTERVAL):
+            if final_status != 'COMPLETED':
+                if verbose:
+                    log.info("Job ended with status " + final_status)
+                raise ValueError('Data staging job did not complete successfully. Status was ' + final_status)
 
-        # Build list of result file urls
-        job_details = self._get_job_details_xml(job_url)
-        fileurls = []
-        for result in job_details.find("uws:results", self._uws_ns).findall("uws:result", self._uws_ns):
-            file_location = unquote(result.get("{http://www.w3.org/1999/xlink}href"))
-            fileurls.append(file_location)
+            # Build list of result file urls
+            job_details = self._get_job_details_xml(job_url)
+            fileurls = []
+            for result in job_details.find("uws:results", self._uws_ns).findall("uws:result", self._uws_ns):
+                file_location = unquote(result.get("{http://www.w3.org/1999/xlink}href"))
+                fileurls.append(file_location)
 
-        return fileurls
+            yield job_url, fileurls
 
     def stage_data(self, table, *, verbose=False):
         """
@@ -330,7 +349,8 @@ class CasdaClass(QueryWithLogin):
             access_url column.
         coordinates : str or `astropy.coordinates`, optional
             coordinates around which to produce a cutout, the radius will be 1 arcmin if no radius, height or width is
-            provided.
+            provided. If multiple coordinates are given, a cutout job is submitted for each of them and the jobs are
+            run concurrently.
         radius : str or `astropy.units.Quantity`, optional
             the radius of the cutout
         height : str or `astropy.units.Quantity`, optional
@@ -355,48 +375,260 @@ class CasdaClass(QueryWithLogin):
         if table is None or len(table) == 0:
             return []
 
-        job_url = self._create_job(table, 'cutout_service', verbose)
+        job_urls = self._create_cutout_jobs(table, coordinates=coordinates, radius=radius, height=height,
+                                            width=width, band=band, channel=channel, verbose=verbose)
+
+        results = dict(self._complete_jobs(job_urls, verbose))
+        return [fileurl for job_url in job_urls for fileurl in results[job_url]]
+
+    def download_cutouts(self, table, *, coordinates=None, radius=1*u.arcmin, height=None,
+                         width=None, band=None, channel=None, savedir='', verbose=False):
+        """
+        Produce and download cutouts from each selected file. This behaves as `cutout` followed by `download_files`,
+        except that the files produced by each cutout job start downloading as soon as that job completes, while the
+        remaining jobs are still running.
+
+        Parameters
+        ----------
+        table: `astropy.table.Table`
+            A table describing the files to be staged, such as produced by query_region. It must include an
+            access_url column.
+        coordinates : str or `astropy.coordinates`, optional
+            coordinates around which to produce a cutout. If multiple coordinates are given, a cutout job is submitted
+            for each of them.
+        radius : str or `astropy.units.Quantity`, optional
+            the radius of the cutout
+        height : str or `astropy.units.Quantity`, optional
+            the height for a box cutout
+        width : str or `astropy.units.Quantity`, optional
+            the width for a box cutout
+        band : list of `astropy.units.Quantity` with two elements, optional
+            the spectral range to be included, may be low and high wavelengths in metres or low and high frequencies in
+            Hertz. Use None for an open bound.
+        channel : list of int with two elements, optional
+            the spectral range to be included, the low and high channels (i.e. planes of a cube) inclusive
+        savedir: str, optional
+            The directory in which to save the files.
+        verbose: bool, optional
+            Should status messages be logged periodically, defaults to False
+
+        Returns
+        -------
+        A list of the full filenames of the downloaded files.
+        """
+        if not self._authenticated:
+            raise ValueError("Credentials must be supplied to download CASDA image data")
 
-        cutout_spec = self._args_to_payload(radius=radius, coordinates=coordinates, height=height, width=width,
-                                            band=band, channel=channel, verbose=verbose)
+        if table is None or len(table) == 0:
+            return []
 
-        if not cutout_spec:
-            raise ValueError("Please provide cutout parameters such as coordinates, band or channel.")
+        job_urls = self._create_cutout_jobs(table, coordinates=coordinates, radius=radius, height=height,
+                                            width=width, band=band, channel=channel, verbose=verbose)
 
-        self._add_cutout_params(job_url, verbose, cutout_spec)
+        downloads = {}
+        with ThreadPoolExecutor(1) as executor:
+            for job_url, fileurls in self._complete_jobs(job_urls, verbose):
+                downloads[job_url] = executor.submit(self.download_files, fileurls, savedir=savedir)
+            return [filename for job_url in job_urls for filename in downloads[job_url].result()]
 
-        return self._complete_job(job_url, verbose)
+    def _create_cutout_jobs(self, table, *, coordinates, radius, height, width, band, channel, verbose):
+        """
+        Create a cutout job for each of the coordinates, sharing a single datalink lookup of the files in the table.
+
+        Returns
+        -------
+        A list of the urls of the created jobs, in the order of the coordinates.
+        """
+        if coordinates is not None and not isinstance(coordinates, (str, coord.SkyCoord)):
+            coordinates = commons.parse_coordinates(coordinates)
+        if isinstance(coordinates, coord.SkyCoord) and not coordinates.isscalar:
+            positions = coordinates
+        else:
+            positions = [coordinates]
+
+        soda_url, tokens = self._get_soda_tokens(table, 'cutout_service')
+
+        cutout_specs = []
+        for position in positions:
+            cutout_spec = self._args_to_payload(radius=radius, coordinates=position, height=height, width=width,
+                                                band=band, channel=channel, verbose=verbose)
+            if not cutout_spec:
+                raise ValueError("Please provide cutout parameters such as coordinates, band or channel.")
+            cutout_specs.append(cutout_spec)
+
+        job_urls = []
+        for cutout_spec in cutout_specs:
+            job_url = self._create_soda_job(tokens, soda_url=soda_url)
+            if verbose:
+                log.info("Created cutout job " + job_url)
+            self._add_cutout_params(job_url, verbose, cutout_spec)
+            job_urls.append(job_url)
+
+        return job_urls
 
-    def download_files(self, urls, *, savedir=''):
+    def download_files(self, urls, *, savedir='', verify=True, max_workers=None, manifest=None):
         """
         Download a series of files
 
+        Data files are downloaded in parallel. Where the list also contains the ``.checksum`` file
+        for a data file, as returned by `stage_data` and `cutout`, the checksum is fetched first and
+        the data file is verified while it is being written. Files failing verification, or whose
+        download fails with a connection or server error, are downloaded again up to
+        ``DOWNLOAD_RETRIES`` times. Data files whose checksum file could not be read are downloaded
+        without verification.
+
         Parameters
         ----------
         urls: list of strings
             The list of URLs of the files to be downloaded.
         savedir: str, optional
             The directory in which to save the files.
+        verify: bool, optional
+            Verify each data file against its checksum file, if present in ``urls``. Defaults to True.
+        max_workers: int, optional
+            The number of files to download at once. Defaults to ``DOWNLOAD_THREADS``.
+        manifest: str, optional
+            If provided, the name of a file to which a manifest of the downloaded files, their
+            sizes, digests and verification status is written in ECSV format.
 
         Returns
         -------
         A list of the full filenames of the downloaded files.
         """
-        # for each url in list, download file and checksum
-        filenames = []
-        for url in urls:
-            parseResult = urlparse(url)
-            local_filename = unquote(os.path.basename(parseResult.path))
-            if os.name == 'nt':
-                # Windows doesn't allow special characters in filenames like
-                # ":" so replace them with an underscore
-                local_filename = local_filename.replace(':', '_')
-            local_filepath = os.path.join(savedir or self.cache_location or '.', local_filename)
-            self._download_file(url, local_filepath, timeout=self.TIMEOUT, cache=False)
-            filenames.append(local_filepath)
+        filenames = [self._get_local_filepath(url, savedir) for url in urls]
+
+        # Pair each data file with its checksum companion, if one was requested
+        checksum_files = {}
+        data_indices = []
+        for idx, filename in enumerate(filenames):
+            if filename.endswith('.checksum'):
+                checksum_files[filename[:-len('.checksum')]] = idx
+            else:
+                data_indices.append(idx)
+
+        # The checksum files are tiny, so fetch them before starting on the data files
+        for idx in checksum_files.values():
+            self._download_file(urls[idx], filenames[idx], timeout=self.TIMEOUT, cache=False)
+
+        def download(idx):
+            checksum_idx = checksum_files.get(filenames[idx])
+            if verify and checksum_idx is not None:
+                try:
+                    expected = self._read_checksum_file(filenames[checksum_idx])
+                except ValueError as ex:
+                    log.warning("{0} Downloading {1} without verification.".format(ex, filenames[idx]))
+                else:
+                    return self._download_verified_file(urls[idx], filenames[idx], expected)
+            self._download_file(urls[idx], filenames[idx], timeout=self.TIMEOUT, cache=False)
+            return None
+
+        with ThreadPoolExecutor(max_workers or self.DOWNLOAD_THREADS) as executor:
+            results = list(executor.map(download, data_indices))
+
+        if manifest:
+            rows = []
+            for idx, result in zip(data_indices, results):
+                size, sha1, verified = result if result else (-1, '', False)
+                rows.append((filenames[idx], urls[idx], size, sha1, verified))
+            Table(rows=rows, names=('filename', 'url', 'size', 'sha1', 'verified'),
+                  dtype=(str, str, np.int64, str, bool)).write(manifest, format='ascii.ecsv',
+                                                               overwrite=True)
 
         return filenames
 
+    def _get_local_filepath(self, url, savedir):
+        parseResult = urlparse(url)
+        local_filename = unquote(os.path.basename(parseResult.path))
+        if os.name == 'nt':
+            # Windows doesn't allow special characters in filenames like
+            # ":" so replace them with an underscore
+            local_filename = local_filename.replace(':', '_')
+        return os.path.join(savedir or self.cache_location or '.', local_filename)
+
+    @staticmethod
+    def _read_checksum_file(filename):
+        """
+        Read a CASDA checksum file, which holds the CRC32 checksum, the SHA-1 digest and the size of the data file,
+        the checksum and size being in hexadecimal.
+
+        Parameters
+        ----------
+        filename: str
+            The name of the downloaded checksum file.
+
+        Returns
+        -------
+        A tuple of the crc32 checksum, sha1 digest and file size.
+
+        Raises
+        ------
+        ValueError
+            If the checksum file is missing or cannot be read.
+        """
+        if not os.path.isfile(filename):
+            raise ValueError("Checksum file {0} was not downloaded.".format(filename))
+        with open(filename, 'r') as checksum_file:
+            parts = checksum_file.read().split()
+        if len(parts) != 3:
+            raise ValueError("Unable to read checksum file {0}.".format(filename))
+        return int(parts[0], 16), parts[1].lower(), int(parts[2], 16)
+
+    def _download_verified_file(self, url, local_filepath, expected):
+        """
+        Download a file, computing its checksum and digest as it is streamed to disk, and retry the download if it
+        does not match the expected values or fails with a connection error or a server error.
+
+        Parameters
+        ----------
+        url: str
+            The URL of the file to be downloaded.
+        local_filepath: str
+            The name of the file to write.
+        expected: tuple
+            The crc32 checksum, sha1 digest and size the file should have, as returned by `_read_checksum_file`.
+
+        Returns
+        -------
+        A tuple of the size and sha1 digest of the downloaded file and whether it matched the expected values.
+        """
+        blocksize = astropy.utils.data.conf.download_block_size
+        attempts = self.DOWNLOAD_RETRIES + 1
+        for attempt in range(attempts):
+            crc = 0
+            sha1 = hashlib.sha1()
+            size = 0
+            response = None
+            try:
+                response = self._session.request('GET', url, timeout=self.TIMEOUT, stream=True)
+                response.raise_for_status()
+                with open(local_filepath, 'wb') as f:
+                    for block in response.iter_content(blocksize):
+                        f.write(block)
+                        crc = zlib.crc32(block, crc)
+                        sha1.update(block)
+                        size += len(block)
+            except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError,
+                    requests.HTTPError) as ex:
+                # client errors, such as an expired link, are not transient
+                status = getattr(ex.response, 'status_code', None)
+                if attempt + 1 == attempts or (status is not None and status < 500):
+                    raise
+                log.warning("Download of {0} failed on attempt {1} of {2}: {3}".format(
+                    local_filepath, attempt + 1, attempts, ex))
+                continue
+            finally:
+                if response is not None:
+                    response.close()
+
+            if (crc, sha1.hexdigest(), size) == expected:
+                log.info("Downloaded and verified {0}".format(local_filepath))
+                return size, sha1.hexdigest(), True
+            log.warning("Checksum mismatch for {0} on attempt {1} of {2}".format(
+                local_filepath, attempt + 1, attempts))
+
+        warnings.warn("File {0} failed checksum verification".format(local_filepath), CorruptDataWarning)
+        return size, sha1.hexdigest(), False
+
     def _parse_datalink_for_service_and_id(self, response, service_name):
         """
         Parses a datalink file into a vo table, and returns the async service url and the authenticated id token.
@@ -499,32 +731,58 @@ class CasdaClass(QueryWithLogin):
         verbose: bool
             Should progress be logged periodically
         poll_interval: int, optional
-            The number of seconds to wait between checks on the status of the job.
+            The maximum number of seconds to wait between checks on the status of the job.
 
         Returns
         -------
         The single word final status of the job. Normally COMPLETED or ERROR
         """
-        # Start the async job
+        for _, status in self._run_jobs([job_location], verbose, poll_interval=poll_interval):
+            return status
+
+    def _run_jobs(self, job_locations, verbose, *, poll_interval=20):
+        """
+        Start a set of async jobs (e.g. TAP or SODA) and poll them together until they have all finished. The time
+        between polls starts at one second and doubles each time up to ``poll_interval``.
+
+        Parameters
+        ----------
+        job_locations: list of str
+            The urls to query the status and details of each job
+        verbose: bool
+            Should progress be logged periodically
+        poll_interval: int, optional
+            The maximum number of seconds to wait between checks on the status of the jobs.
+
+        Yields
+        ------
+        The url and single word final status of each job, in the order in which the jobs finish.
+        """
+        # Start the async jobs
         if verbose:
-            log.info("Starting the retrieval job...")
-        self._request('POST', job_location + "/phase", data={'phase': 'RUN'}, cache=False)
-
-        # Poll until the async job has finished
-        prev_status = None
-        count = 0
-        job_details = self._get_job_details_xml(job_location)
-        status = self._read_job_status(job_details, verbose)
-        while status == 'EXECUTING' or status == 'QUEUED' or status == 'PENDING':
-            count += 1
-            if verbose and (status != prev_status or count > 10):
-                log.info("Job is %s, polling every %d seconds." % (status, poll_interval))
-                count = 0
-                prev_status = status
-            time.sleep(poll_interval)
-            job_details = self._get_job_details_xml(job_location)
-            status = self._read_job_status(job_details, verbose)
-        return status
+            log.info("Starting {0} retrieval job(s)...".format(len(job_locations)))
+        for job_location in job_locations:
+            self._request('POST', job_location + "/phase", data={'phase': 'RUN'}, cache=False)
+
+        # Poll until all of the async jobs have finished
+        pending = list(job_locations)
+        interval = min(1, poll_interval)
+        while True:
+            still_running = []
+            for job_location in pending:
+                job_details = self._get_job_details_xml(job_location)
+                status = self._read_job_status(job_details, verbose)
+                if status == 'EXECUTING' or status == 'QUEUED' or status == 'PENDING':
+                    still_running.append(job_location)
+                else:
+                    yield job_location, status
+            pending = still_running
+            if not pending:
+                return
+            if verbose:
+                log.info("%d job(s) still running, polling again in %d seconds." % (len(pending), interval))
+            time.sleep(interval)
+            interval = min(interval * 2, poll_interval)
 
     def _get_soda_url(self):
         return self._soda_base_url + "data/async"
@@ -2,9 +2,14 @@
 
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 
+import hashlib
 import pytest
 import requests
 import os
+import time
+import zlib
+from xml.etree import ElementTree
+from urllib.parse import urlparse
 import keyring
 
 from astropy.coordinates import SkyCoord
@@ -16,7 +21,7 @@ from astroquery import log
 import numpy as np
 
 from astroquery.casda import Casda
-from astroquery.exceptions import LoginError
+from astroquery.exceptions import LoginError, CorruptDataWarning
 
 try:
     from unittest.mock import Mock, MagicMock
@@ -574,3 +579,236 @@ def test_download_file(patch_get):
     assert filenames[0].endswith('askap_img.fits')
     assert filenames[1].endswith('askap_img.fits.checksum')
     assert filenames[2].endswith('RACS-DR1_0000+18A.fits')
+
+
+class MockDownloadResponse:
+
+    def __init__(self, content):
+        self.content = content
+        self.headers = {}
+
+    def raise_for_status(self):
+        return
+
+    def iter_content(self, blocksize):
+        for i in range(0, len(self.content), blocksize):
+            yield self.content[i:i + blocksize]
+
+    def close(self):
+        return
+
+
+def make_checksum(content):
+    return '{0:x} {1} {2:x}'.format(zlib.crc32(content), hashlib.sha1(content).hexdigest(),
+                                    len(content)).encode()
+
+
+@pytest.fixture
+def patch_download(monkeypatch):
+    content = b'SIMPLE  = T' * 1000
+    files = {'askap_img.fits': [content],
+             'askap_img.fits.checksum': [make_checksum(content)]}
+    requested = []
+
+    def download_mockreturn(self, method, url, **kwargs):
+        name = os.path.basename(urlparse(url).path)
+        requested.append(name)
+        contents = files[name]
+        content = contents.pop(0) if len(contents) > 1 else contents[0]
+        if isinstance(content, Exception):
+            raise content
+        return MockDownloadResponse(content)
+
+    monkeypatch.setattr(requests.Session, 'request', download_mockreturn)
+    return files, requested
+
+
+def test_download_files_verified(patch_download, tmp_path):
+    files, requested = patch_download
+    urls = ['http://casda.csiro.au/download/web/111-000-111-000/askap_img.fits.checksum',
+            'http://casda.csiro.au/download/web/111-000-111-000/askap_img.fits']
+    manifest = str(tmp_path / 'manifest.ecsv')
+
+    filenames = Casda.download_files(urls, savedir=str(tmp_path), manifest=manifest)
+    assert filenames == [str(tmp_path / 'askap_img.fits.checksum'), str(tmp_path / 'askap_img.fits')]
+    assert requested == ['askap_img.fits.checksum', 'askap_img.fits']
+    with open(filenames[1], 'rb') as f:
+        assert f.read() == files['askap_img.fits'][0]
+
+    result = Table.read(manifest, format='ascii.ecsv')
+    assert len(result) == 1
+    assert result['filename'][0] == filenames[1]
+    assert result['size'][0] == len(files['askap_img.fits'][0])
+    assert result['verified'][0]
+
+
+def test_download_files_retry(patch_download, tmp_path):
+    files, requested = patch_download
+    files['askap_img.fits'].insert(0, b'corrupt')
+    urls = ['http://casda.csiro.au/download/web/111-000-111-000/askap_img.fits',
+            'http://casda.csiro.au/download/web/111-000-111-000/askap_img.fits.checksum']
+
+    Casda.download_files(urls, savedir=str(tmp_path))
+    assert requested == ['askap_img.fits.checksum', 'askap_img.fits', 'askap_img.fits']
+    with open(tmp_path / 'askap_img.fits', 'rb') as f:
+        assert f.read() == files['askap_img.fits'][0]
+
+
+def test_download_files_corrupt(patch_download, tmp_path):
+    files, requested = patch_download
+    files['askap_img.fits'] = [b'corrupt']
+    urls = ['http://casda.csiro.au/download/web/111-000-111-000/askap_img.fits.checksum',
+            'http://casda.csiro.au/download/web/111-000-111-000/askap_img.fits']
+    manifest = str(tmp_path / 'manifest.ecsv')
+
+    casda = Casda()
+    casda.DOWNLOAD_RETRIES = 1
+    with pytest.warns(CorruptDataWarning, match='failed checksum verification'):
+        casda.download_files(urls, savedir=str(tmp_path), manifest=manifest)
+    assert requested.count('askap_img.fits') == 2
+    assert not Table.read(manifest, format='ascii.ecsv')['verified'][0]
+
+
+class MockJobServer:
+    """Tracks the phase of several SODA jobs, each completing after a given number of polls."""
+
+    def __init__(self, polls_until_complete):
+        self.polls_until_complete = polls_until_complete
+        self.created = []
+        self.started = []
+        self.params = {}
+
+    def create_soda_job(self, tokens, *, soda_url=None):
+        job_url = soda_url + '/job-{}'.format(len(self.created))
+        self.created.append(job_url)
+        return job_url
+
+    def add_cutout_params(self, job_url, verbose, cutout_spec):
+        self.params[job_url] = cutout_spec
+
+    def request(self, method, url, **kwargs):
+        assert method == 'POST' and url.endswith('/phase')
+        self.started.append(url[:-len('/phase')])
+
+    def get_job_details_xml(self, job_url):
+        job_index = self.created.index(job_url)
+        remaining = self.polls_until_complete[job_index]
+        self.polls_until_complete[job_index] = remaining - 1
+        phase = 'EXECUTING' if remaining > 0 else 'COMPLETED'
+        results = ''.join('<uws:result id="{0}" xlink:href="http%3A%2F%2Fcasda%2F{1}%2F{0}" />'.format(
+            name, job_url.rsplit('/', 1)[-1]) for name in ('cutout.fits.checksum', 'cutout.fits'))
+        return ElementTree.fromstring(
+            '<uws:job xmlns:uws="http://www.ivoa.net/xml/UWS/v1.0" xmlns:xlink="http://www.w3.org/1999/xlink">'
+            '<uws:phase>{0}</uws:phase><uws:results>{1}</uws:results></uws:job>'.format(phase, results))
+
+
+@pytest.fixture
+def patch_jobs(monkeypatch):
+    casda = Casda()
+    fake_login(casda, USERNAME, PASSWORD)
+    server = MockJobServer([2, 0, 1])
+    monkeypatch.setattr(casda, '_get_soda_tokens',
+                        lambda table, service_name: ('https://casda/data/async', ['token']))
+    monkeypatch.setattr(casda, '_create_soda_job', server.create_soda_job)
+    monkeypatch.setattr(casda, '_add_cutout_params', server.add_cutout_params)
+    monkeypatch.setattr(casda, '_request', server.request)
+    monkeypatch.setattr(casda, '_get_job_details_xml', server.get_job_details_xml)
+    sleeps = []
+    monkeypatch.setattr(time, 'sleep', sleeps.append)
+    return casda, server, sleeps
+
+
+def test_cutout_multiple_coordinates(patch_jobs):
+    casda, server, sleeps = patch_jobs
+    table = Table([Column(data=['https://somewhere/casda/datalink/links?cube-244'], name='access_url')])
+    centres = SkyCoord([333.9, 334.0, 334.1]*u.deg, [-45.8, -45.9, -46.0]*u.deg)
+
+    urls = casda.cutout(table, coordinates=centres, radius=30*u.arcmin)
+
+    assert server.started == server.created
+    assert len(server.created) == 3
+    assert [server.params[job_url]['POS'].split()[1][:5] for job_url in server.created] == \
+        ['333.9', '334.0', '334.1']
+    # results are returned in coordinate order, regardless of the order in which the jobs finished
+    assert urls == ['http://casda/job-{}/cutout.fits{}'.format(i, ext) for i in range(3) for ext in ('.checksum', '')]
+    # all jobs are polled together, backing off between polls
+    assert sleeps == [1, 2]
+
+
+def test_download_cutouts(patch_jobs, monkeypatch):
+    casda, server, sleeps = patch_jobs
+    table = Table([Column(data=['https://somewhere/casda/datalink/links?cube-244'], name='access_url')])
+    centres = SkyCoord([333.9, 334.0, 334.1]*u.deg, [-45.8, -45.9, -46.0]*u.deg)
+    downloaded = []
+
+    def download_files(urls, *, savedir=''):
+        downloaded.append([url.split('/')[-2] for url in urls])
+        return [os.path.join(savedir, url.split('/')[-2], url.split('/')[-1]) for url in urls]
+
+    monkeypatch.setattr(casda, 'download_files', download_files)
+
+    filenames = casda.download_cutouts(table, coordinates=centres, radius=30*u.arcmin, savedir='/tmp')
+
+    # downloads start in the order the jobs finish
+    assert downloaded == [['job-1', 'job-1'], ['job-2', 'job-2'], ['job-0', 'job-0']]
+    assert filenames == ['/tmp/job-{}/cutout.fits{}'.format(i, ext) for i in range(3) for ext in ('.checksum', '')]
+
+
+def test_download_file_verified(patch_download, tmp_path):
+    files, requested = patch_download
+    files['RACS-DR1_0000%2B18A.fits'] = [b'SIMPLE  = T']
+    urls = [
+        'https://ingest.pawsey.org/bucket_name/path/askap_img.fits?security=stuff',
+        'http://casda.csiro.au/download/web/111-000-111-000/askap_img.fits.checksum',
+        'https://ingest.pawsey.org.au/casda-prd-as110-01/dc52217/primary_images/RACS-DR1_0000%2B18A.fits?security=stuff'
+    ]
+    manifest = str(tmp_path / 'manifest.ecsv')
+
+    casda = Casda()
+    filenames = casda.download_files(urls, savedir=str(tmp_path), manifest=manifest)
+    assert filenames[0].endswith('askap_img.fits')
+    assert filenames[1].endswith('askap_img.fits.checksum')
+    assert filenames[2].endswith('RACS-DR1_0000+18A.fits')
+
+    # only the data file with a checksum file is verified
+    result = Table.read(manifest, format='ascii.ecsv')
+    assert list(result['filename']) == [filenames[0], filenames[2]]
+    assert list(result['verified']) == [True, False]
+
+
+def test_download_files_missing_checksum(patch_download, tmp_path):
+    files, requested = patch_download
+    files['askap_img.fits.checksum'] = [b'']
+    urls = ['http://casda.csiro.au/download/web/111-000-111-000/askap_img.fits.checksum',
+            'http://casda.csiro.au/download/web/111-000-111-000/askap_img.fits']
+    manifest = str(tmp_path / 'manifest.ecsv')
+
+    Casda.download_files(urls, savedir=str(tmp_path), manifest=manifest)
+    with open(tmp_path / 'askap_img.fits', 'rb') as f:
+        assert f.read() == files['askap_img.fits'][0]
+    assert not Table.read(manifest, format='ascii.ecsv')['verified'][0]
+
+
+def test_download_files_transient_error(patch_download, tmp_path):
+    files, requested = patch_download
+    files['askap_img.fits'].insert(0, requests.ConnectionError('Connection reset by peer'))
+    urls = ['http://casda.csiro.au/download/web/111-000-111-000/askap_img.fits.checksum',
+            'http://casda.csiro.au/download/web/111-000-111-000/askap_img.fits']
+
+    Casda.download_files(urls, savedir=str(tmp_path))
+    assert requested == ['askap_img.fits.checksum', 'askap_img.fits', 'askap_img.fits']
+    with open(tmp_path / 'askap_img.fits', 'rb') as f:
+        assert f.read() == files['askap_img.fits'][0]
+
+
+def test_download_files_client_error(patch_download, tmp_path):
+    files, requested = patch_download
+    response = requests.Response()
+    response.status_code = 403
+    files['askap_img.fits'].insert(0, requests.HTTPError('Forbidden', response=response))
+    urls = ['http://casda.csiro.au/download/web/111-000-111-000/askap_img.fits.checksum',
+            'http://casda.csiro.au/download/web/111-000-111-000/askap_img.fits']
+
+    with pytest.raises(requests.HTTPError):
+        Casda.download_files(urls, savedir=str(tmp_path))
+    assert requested == ['askap_img.fits.checksum', 'askap_img.fits']
@@ -1,5 +1,8 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import os
+import time
+import tracemalloc
+import warnings
 from pathlib import Path
 
 import pytest
@@ -58,6 +61,21 @@ def pytest_addoption(parser):
         help='ALMA site (almascience.nrao.edu, almascience.eso.org or '
              'almascience.nao.ac.jp for example)'
     )
+    parser.addoption(
+        '--run-benchmarks',
+        action='store_true',
+        default=False,
+        help='Run the benchmarks, which are marked with "benchmark"'
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption('--run-benchmarks'):
+        return
+    skip_benchmark = pytest.mark.skip(reason='need --run-benchmarks option to run')
+    for item in items:
+        if item.get_closest_marker('benchmark') is not None:
+            item.add_marker(skip_benchmark)
 
 
 @pytest.fixture(scope='function')
@@ -69,3 +87,34 @@ def tmp_cwd(tmp_path):
         yield tmp_path
     finally:
         os.chdir(old_dir)
+
+
+@pytest.fixture(scope='function')
+def measure(request, record_property):
+    """
+    Benchmark a function: return a function calling it, which reports the
+    best of ``repeat`` run times and the peak memory allocated by a traced run.
+
+    Warnings are ignored while the function runs, as recording them for
+    pytest would dominate the run times.
+    """
+    def run(function, *args, repeat=3, **kwargs):
+        times = []
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            for _ in range(repeat):
+                start = time.perf_counter()
+                function(*args, **kwargs)
+                times.append(time.perf_counter() - start)
+            tracemalloc.start()
+            try:
+                result = function(*args, **kwargs)
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+        record_property('time', min(times))
+        record_property('peak_memory', peak)
+        print(f"\n{request.node.name}: {min(times) * 1e3:.1f} ms, "
+              f"{peak / 2**20:.1f} MiB")
+        return result
+    return run
@@ -6,6 +6,8 @@ import shutil
 from email.message import Message
 from pathlib import Path
 
+from requests import HTTPError
+
 from astropy import units as u
 from astroquery.utils import commons
 from astroquery import log
@@ -360,17 +362,15 @@ class HSAClass(BaseQuery):
         -------
         A list of columns
         """
-        tables = self._tap.load_tables(verbose=verbose)
-
-        columns = None
-        for t in tables:
-            if str(t.name) == str(table_name):
-                columns = t.columns
-                break
-
-        if columns is None:
+        # only the metadata of the table is loaded
+        try:
+            table = self._tap.load_table(table_name, verbose=verbose)
+        except HTTPError:
+            table = None
+        if table is None or str(table.name) != str(table_name):
             raise ValueError("table name specified was not found in "
                              "HSA TAP service")
+        columns = table.columns
 
         if only_names:
             return [c.name for c in columns]
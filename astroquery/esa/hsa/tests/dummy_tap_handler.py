@@ -73,3 +73,10 @@ class DummyHSATapHandler:
         table = TapTableMeta()
         table.name = "table"
         return [table]
+
+    def load_table(self, table, verbose=False):
+        if table != "table":
+            return None
+        tap_table = TapTableMeta()
+        tap_table.name = "table"
+        return tap_table
@@ -10,6 +10,8 @@ European Space Agency (ESA)
 """
 from urllib.parse import urlencode
 
+from requests import HTTPError
+
 from astropy import units
 from astropy.coordinates import SkyCoord
 from astropy.coordinates import Angle
@@ -788,18 +790,15 @@ class ESAHubbleClass(BaseQuery):
         A list of columns
         """
 
-        tables = self._tap.load_tables(only_names=False,
-                                       include_shared_tables=False,
-                                       verbose=verbose)
-        columns = None
-        for t in tables:
-            if str(t.name) == str(table_name):
-                columns = t.columns
-                break
-
-        if columns is None:
+        # only the metadata of the table is loaded
+        try:
+            table = self._tap.load_table(table_name, verbose=verbose)
+        except HTTPError:
+            table = None
+        if table is None or str(table.name) != str(table_name):
             raise ValueError("table name specified is not found in "
                              "EHST TAP service")
+        columns = table.columns
 
         if only_names is True:
             column_names = []
@@ -70,6 +70,13 @@ class DummyHubbleTapHandler:
         table.name = "table"
         return [table]
 
+    def load_table(self, table, verbose=False):
+        if table != "table":
+            return None
+        tap_table = TapTableMeta()
+        tap_table.name = "table"
+        return tap_table
+
     def load_data(self, params_dict, output_file=None, verbose=False):
         self.__invokedMethod = 'load_data'
         self._parameters['params_dict'] = params_dict
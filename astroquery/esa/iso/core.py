@@ -301,18 +301,15 @@ class ISOClass(BaseQuery):
         A list of columns
         """
 
-        tables = self._tap.load_tables(only_names=False,
-                                       include_shared_tables=False,
-                                       verbose=verbose)
-        columns = None
-        for table in tables:
-            if str(table.name) == str(table_name):
-                columns = table.columns
-                break
-
-        if columns is None:
+        # only the metadata of the table is loaded
+        try:
+            table = self._tap.load_table(table_name, verbose=verbose)
+        except HTTPError:
+            table = None
+        if table is None or str(table.name) != str(table_name):
             raise ValueError("table name specified is not found in "
                              "IDA TAP service")
+        columns = table.columns
 
         if only_names:
             return [c.name for c in columns]
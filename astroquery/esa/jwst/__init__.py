@@ -45,6 +45,14 @@ class Conf(_config.ConfigNamespace):
                                                     "Name of Dec parameter "
                                                     "in table")
 
+    query_chunk_size = _config.ConfigItem(200,
+                                          "Maximum number of values in the IN lists of a "
+                                          "single ADQL query of the batch methods.")
+
+    max_concurrent_downloads = _config.ConfigItem(4,
+                                                  "Maximum number of products downloaded "
+                                                  "concurrently by get_obs_products_batch.")
+
 
 conf = Conf()
 
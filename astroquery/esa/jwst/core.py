@@ -15,6 +15,7 @@ import os
 import shutil
 import tarfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from urllib.parse import urlencode
 
@@ -58,6 +59,8 @@ class JwstClass(BaseQuery):
     TARGET_RESOLVERS = ['ALL', 'SIMBAD', 'NED', 'VIZIER']
     CAL_LEVELS = ['ALL', 1, 2, 3, -1]
     REQUESTED_OBSERVATION_ID = "Missing required argument: 'observation_id'"
+    QUERY_CHUNK_SIZE = conf.query_chunk_size
+    MAX_CONCURRENT_DOWNLOADS = conf.max_concurrent_downloads
 
     def __init__(self, *, tap_plus_handler=None, data_handler=None, show_messages=True):
         if tap_plus_handler is None:
@@ -748,25 +751,38 @@ class JwstClass(BaseQuery):
     def _get_associated_planes(self, plane_ids, cal_level,
                                max_cal_level, is_url):
         if (cal_level == max_cal_level):
-            if (not is_url):
-                list = "('{}')".format("', '".join(plane_ids))
-            else:
-                list = "{}".format(",".join(plane_ids))
-            return list
+            plane_list = plane_ids
         else:
-            plane_list = []
-            for plane_id in plane_ids:
-                siblings = self.__get_sibling_planes(planeid=plane_id, cal_level=cal_level)
-                members = self.__get_member_planes(planeid=plane_id, cal_level=cal_level)
-                plane_id_table = vstack([siblings, members])
-                plane_list.extend(plane_id_table['product_planeid'].pformat(
-                    show_name=False))
-            if (not is_url):
-                list = "('{}')".format("', '".join(plane_list))
-            else:
-                list = "{}".format(",".join(plane_list))
+            associated = self._get_associated_plane_ids(plane_ids=plane_ids,
+                                                        cal_level=cal_level)
+            plane_list = [product_planeid for plane_id in plane_ids
+                          for product_planeid in associated[plane_id]]
+        if (not is_url):
+            list = self.__get_in_list(plane_list)
+        else:
+            list = "{}".format(",".join(plane_list))
         return list
 
+    def _get_associated_plane_ids(self, plane_ids, cal_level):
+        """Get the sibling and member planes of many planes with a few
+        queries.
+
+        Returns
+        -------
+        A dictionary with the list of associated plane ids of each plane id.
+        """
+        associated = {plane_id: [] for plane_id in plane_ids}
+        for chunk in self.__get_chunks(list(associated)):
+            siblings = self.__get_sibling_planes(planeids=chunk,
+                                                 cal_level=cal_level)
+            members = self.__get_member_planes(planeids=chunk,
+                                               cal_level=cal_level)
+            for row in vstack([siblings, members]):
+                plane_id = str(JwstClass.get_decoded_string(row['planeid']))
+                associated[plane_id].append(
+                    str(JwstClass.get_decoded_string(row['product_planeid'])))
+        return associated
+
     def _get_plane_id(self, observation_id):
         try:
             planeids = []
@@ -786,14 +802,49 @@ class JwstClass(BaseQuery):
             raise ValueError("This observation_id does not exist in "
                              "JWST database")
 
-    def __get_sibling_planes(self, planeid, *, cal_level='ALL'):
+    def _get_plane_ids(self, observation_ids):
+        """Get the plane ids of the highest calibration level of many
+        observations with a few queries.
+
+        Returns
+        -------
+        A dictionary with a tuple (list of plane ids, maximum calibration
+        level) for each observation_id.
+        """
+        levels = {}
+        for chunk in self.__get_chunks(observation_ids):
+            query_plane = (f"select distinct m.observationid, m.planeid, "
+                           f"m.calibrationlevel "
+                           f"from {conf.JWST_MAIN_TABLE} m where "
+                           f"m.observationid IN {self.__get_in_list(chunk)}")
+            job = self.__jwsttap.launch_job(query=query_plane)
+            for row in job.get_results():
+                observation_id = str(JwstClass.get_decoded_string(
+                    row["observationid"]))
+                levels.setdefault(observation_id, []).append(
+                    (row["calibrationlevel"],
+                     str(JwstClass.get_decoded_string(row["planeid"]))))
+
+        missing = [obs_id for obs_id in observation_ids if obs_id not in levels]
+        if missing:
+            raise ValueError("These observation_ids do not exist in JWST "
+                             "database: " + ", ".join(missing))
+        planes = {}
+        for observation_id in observation_ids:
+            max_cal_level = max(level for level, _ in levels[observation_id])
+            planes[observation_id] = (
+                [plane_id for level, plane_id in levels[observation_id]
+                 if level == max_cal_level], max_cal_level)
+        return planes
+
+    def __get_sibling_planes(self, planeids, *, cal_level='ALL'):
         where_clause = ""
         if (cal_level == "ALL"):
             where_clause = "WHERE sp.calibrationlevel<=p.calibrationlevel "\
-                           "AND p.planeid ="
+                           "AND p.planeid IN "
         else:
             where_clause = (f"WHERE sp.calibrationlevel={cal_level} AND "
-                            f"p.planeid =")
+                            f"p.planeid IN ")
         try:
             query_siblings = (f"SELECT o.observationuri, p.planeid, "
                               f"p.calibrationlevel, sp.planeid as "
@@ -803,19 +854,20 @@ class JwstClass(BaseQuery):
                               f"{conf.JWST_PLANE_TABLE} p ON "
                               f"p.obsid=o.obsid JOIN "
                               f"{conf.JWST_PLANE_TABLE} sp ON "
-                              f"sp.obsid=o.obsid {where_clause}'{planeid}'")
+                              f"sp.obsid=o.obsid {where_clause}"
+                              f"{self.__get_in_list(planeids)}")
             job = self.__jwsttap.launch_job(query=query_siblings)
             return job.get_results()
         except Exception as e:
             raise ValueError(e)
 
-    def __get_member_planes(self, planeid, *, cal_level='ALL'):
+    def __get_member_planes(self, planeids, *, cal_level='ALL'):
         where_clause = ""
         if (cal_level == "ALL"):
-            where_clause = "WHERE p.planeid ="
+            where_clause = "WHERE p.planeid IN "
         else:
             where_clause = (f"WHERE mp.calibrationlevel={cal_level} AND "
-                            f"p.planeid =")
+                            f"p.planeid IN ")
         try:
             query_members = (f"SELECT o.observationuri, p.planeid, "
                              f"p.calibrationlevel, mp.planeid as "
@@ -830,7 +882,8 @@ class JwstClass(BaseQuery):
                              f"mo on m.memberid=mo.observationuri JOIN "
                              f"{conf.JWST_PLANE_TABLE} mp on "
                              f"mo.obsid=mp.obsid "
-                             f"{where_clause}'{planeid}'")
+                             f"{where_clause}"
+                             f"{self.__get_in_list(planeids)}")
             job = self.__jwsttap.launch_job(query=query_members)
             return job.get_results()
         except Exception as e:
@@ -1019,6 +1072,168 @@ class JwstClass(BaseQuery):
 
         return files
 
+    def get_obs_products_batch(self, *, observation_ids=None, cal_level="ALL",
+                               product_type=None, output_dir=None,
+                               max_workers=None):
+        """Get the products of many JWST observations.
+
+        The planes of all observations and their associated planes are
+        resolved with a few queries, the products of the observations are
+        downloaded concurrently, and only the files of the requested product
+        types are extracted from the downloaded archives, which are then
+        removed.
+
+        Parameters
+        ----------
+        observation_ids : list of str, mandatory
+            Observation identifiers.
+        cal_level : str or int, optional
+            Calibration level. Default value is 'ALL'. See get_obs_products.
+            Possible values: 'ALL', 3, 2, 1, -1
+        product_type : str or list of str, optional, default None
+            Get only products of the given type(s). If None, all products
+            are retrieved. Possible values: 'thumbnail', 'preview', 'info',
+            'auxiliary', 'science'.
+        output_dir : str, optional
+            Output directory, where the products of each observation are
+            saved in a subdirectory named after its observation_id. If no
+            value is provided, a temporary one is created.
+        max_workers : int, optional
+            Number of products downloaded at the same time. Default value is
+            ``conf.max_concurrent_downloads``.
+
+        Returns
+        -------
+        A dictionary with the list of local paths of the products of each
+        observation_id.
+        """
+        if not observation_ids:
+            raise ValueError("Missing required argument: 'observation_ids'")
+        if isinstance(observation_ids, str):
+            observation_ids = [observation_ids]
+        observation_ids = list(dict.fromkeys(observation_ids))
+        self.__validate_cal_level(cal_level=cal_level)
+        if isinstance(product_type, str):
+            product_type = [product_type]
+        for value in product_type or []:
+            self.__get_artifact_producttype_condition(product_type=value)
+
+        planes = self._get_plane_ids(observation_ids)
+        if cal_level == 3:
+            for plane_ids, max_cal_level in planes.values():
+                if cal_level > max_cal_level:
+                    raise ValueError("Requesting upper levels is not allowed")
+
+        # plane ids to be retrieved for each observation
+        plane_ids = {}
+        pending = [plane_id for ids, max_cal_level in planes.values()
+                   if cal_level != max_cal_level for plane_id in ids]
+        associated = self._get_associated_plane_ids(plane_ids=pending,
+                                                    cal_level=cal_level)
+        for observation_id, (ids, max_cal_level) in planes.items():
+            if cal_level == max_cal_level:
+                plane_ids[observation_id] = ids
+            else:
+                plane_ids[observation_id] = list(dict.fromkeys(
+                    product_planeid for plane_id in ids
+                    for product_planeid in associated[plane_id]))
+
+        file_names = None
+        if product_type is not None and len(product_type) > 1:
+            # several types cannot be requested at once; the archives hold
+            # all types and only the files of the requested ones are kept
+            file_names = self._get_artifact_file_names(
+                plane_ids=[plane_id for ids in plane_ids.values()
+                           for plane_id in ids],
+                product_types=product_type)
+
+        if output_dir is None:
+            now = datetime.now()
+            output_dir = os.getcwd() + os.sep + "temp_" + \
+                now.strftime("%Y%m%d_%H%M%S")
+
+        def retrieve(observation_id):
+            params_dict = {}
+            params_dict['RETRIEVAL_TYPE'] = 'OBSERVATION'
+            params_dict['TAPCLIENT'] = 'ASTROQUERY'
+            params_dict['planeid'] = ",".join(plane_ids[observation_id])
+            self.__set_additional_parameters(
+                param_dict=params_dict, cal_level=cal_level,
+                max_cal_level=planes[observation_id][1],
+                product_type=(product_type[0] if file_names is None
+                              and product_type else None))
+            output_file_full_path, obs_dir = self.__set_dirs(
+                output_file=os.path.join(output_dir, observation_id,
+                                         observation_id + "_all_products"),
+                observation_id=observation_id)
+            try:
+                self.__jwsttap.load_data(params_dict=params_dict,
+                                         output_file=output_file_full_path)
+            except Exception as exx:
+                raise ValueError('Cannot retrieve products for observation '
+                                 + observation_id + ': %s' % str(exx))
+            return self.__extract_members(
+                output_file_full_path=output_file_full_path,
+                output_dir=obs_dir, observation_id=observation_id,
+                file_names=file_names)
+
+        if max_workers is None:
+            max_workers = self.MAX_CONCURRENT_DOWNLOADS
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            files = list(executor.map(retrieve, observation_ids))
+        return dict(zip(observation_ids, files))
+
+    def _get_artifact_file_names(self, plane_ids, product_types):
+        """Get the names of the files of the given product types in many
+        planes with a few queries."""
+        condition = " OR ".join(f"a.producttype ILIKE '%{product_type}%'"
+                                for product_type in product_types)
+        file_names = set()
+        for chunk in self.__get_chunks(plane_ids):
+            query = (f"select distinct a.filename FROM "
+                     f"{conf.JWST_ARTIFACT_TABLE} a WHERE a.planeid IN "
+                     f"{self.__get_in_list(chunk)} AND ({condition})")
+            job = self.__jwsttap.launch_job(query=query)
+            file_names.update(str(JwstClass.get_decoded_string(file_name))
+                              for file_name in job.get_results()['filename'])
+        return file_names
+
+    def __extract_members(self, output_file_full_path, output_dir,
+                          observation_id, file_names=None):
+        """Extract the files of a tar or zip archive, only those named in
+        file_names if given, and remove the archive. Other files are renamed
+        after the observation_id."""
+        files = []
+        if tarfile.is_tarfile(output_file_full_path):
+            # read the archive as a stream, extracting one member at a time
+            with tarfile.open(output_file_full_path, 'r|*') as tar_ref:
+                for member in tar_ref:
+                    name = os.path.basename(member.name)
+                    if not member.isfile() or (file_names is not None
+                                               and name not in file_names):
+                        continue
+                    files.append(os.path.join(output_dir, name))
+                    with open(files[-1], 'wb') as f_out:
+                        shutil.copyfileobj(tar_ref.extractfile(member), f_out)
+        elif zipfile.is_zipfile(output_file_full_path):
+            with zipfile.ZipFile(output_file_full_path, 'r') as zip_ref:
+                for member in zip_ref.infolist():
+                    name = os.path.basename(member.filename)
+                    if member.is_dir() or (file_names is not None
+                                           and name not in file_names):
+                        continue
+                    files.append(os.path.join(output_dir, name))
+                    with zip_ref.open(member) as f_in, \
+                            open(files[-1], 'wb') as f_out:
+                        shutil.copyfileobj(f_in, f_out)
+        else:
+            # single file
+            files.append(os.path.join(output_dir, observation_id))
+            os.replace(output_file_full_path, files[-1])
+            return files
+        os.remove(output_file_full_path)
+        return files
+
     def __check_file_number(self, output_dir, output_file_name,
                             output_file_full_path, files):
         num_files_in_dir = len(os.listdir(output_dir))
@@ -1182,6 +1397,13 @@ class JwstClass(BaseQuery):
                 condition = " AND proposal_id ILIKE '%"+value+"%' "
         return condition
 
+    def __get_in_list(self, values):
+        return "('{}')".format("', '".join(values))
+
+    def __get_chunks(self, values):
+        return [values[i:i + self.QUERY_CHUNK_SIZE]
+                for i in range(0, len(values), self.QUERY_CHUNK_SIZE)]
+
     def __get_artifact_producttype_condition(self, *, product_type=None):
         condition = ""
         if (product_type is not None):
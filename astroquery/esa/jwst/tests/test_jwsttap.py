@@ -824,6 +824,61 @@ class TestTap:
             # self.__remove_folder_contents(folder=output_file_full_path_dir)
             shutil.rmtree(output_file_full_path_dir)
 
+    def test_get_obs_products_batch(self, tmp_path):
+        queries = []
+        downloads = []
+
+        def launch_job(query):
+            queries.append(query)
+            if 'm.observationid IN' in query:
+                results = Table({'observationid': ['obs1', 'obs1', 'obs2'],
+                                 'planeid': ['p1', 'p1-low', 'p2'],
+                                 'calibrationlevel': [3, 2, 3]})
+            elif 'a.filename' in query:
+                results = Table({'filename': ['single_product_retrieval_1.fits',
+                                              'single_product_retrieval_3.fits.zip']})
+            elif 'sp.planeid' in query:
+                results = Table({'planeid': ['p1', 'p2'],
+                                 'product_planeid': ['s1', 's2']})
+            else:
+                results = Table({'planeid': ['p1', 'p2', 'p2'],
+                                 'product_planeid': ['m1', 'm2', 'm3']})
+            job = MagicMock()
+            job.get_results.return_value = results
+            return job
+
+        def load_data(params_dict, output_file):
+            downloads.append(params_dict)
+            shutil.copy(data_path('three_products_retrieval.tar'), output_file)
+
+        tap = MagicMock(launch_job=launch_job, load_data=load_data)
+        jwst = JwstClass(tap_plus_handler=tap, show_messages=False)
+
+        with pytest.raises(ValueError, match='product_type must be one of'):
+            jwst.get_obs_products_batch(observation_ids=['obs1'],
+                                        product_type=['science', 'bad'])
+
+        files = jwst.get_obs_products_batch(
+            observation_ids=['obs1', 'obs2'], cal_level=2,
+            product_type=['science', 'preview'], output_dir=str(tmp_path))
+
+        # planes, siblings, members and artifacts of all observations
+        assert len(queries) == 4
+        assert "IN ('obs1', 'obs2')" in queries[0]
+        assert "IN ('p1', 'p2')" in queries[1]
+        assert sorted(params['planeid'] for params in downloads) == ['s1,m1', 's2,m2,m3']
+        assert all('product_type' not in params for params in downloads)
+        for obs_id in ('obs1', 'obs2'):
+            assert files[obs_id] == [
+                str(tmp_path / obs_id / 'single_product_retrieval_1.fits'),
+                str(tmp_path / obs_id / 'single_product_retrieval_3.fits.zip')]
+            assert sorted(os.listdir(tmp_path / obs_id)) == [
+                'single_product_retrieval_1.fits',
+                'single_product_retrieval_3.fits.zip']
+
+        with pytest.raises(ValueError, match='do not exist'):
+            jwst.get_obs_products_batch(observation_ids=['obs1', 'obs3'])
+
     def test_gunzip_file(self):
         output_file_full_path_dir = (os.getcwd() + os.sep + "temp_test_jwsttap_gunzip")
         try:
@@ -16,6 +16,8 @@ import os
 import configparser
 from email.message import Message
 
+from requests import HTTPError
+
 from astropy.io import fits
 from astroquery import log
 from astropy.coordinates import SkyCoord
@@ -264,17 +266,14 @@ class XMMNewtonClass(BaseQuery):
         A list of columns
         """
 
-        tables = self._tap.load_tables(only_names=False,
-                                       include_shared_tables=False,
-                                       verbose=verbose)
-        columns = None
-        for table in tables:
-            if str(table.name) == str(table_name):
-                columns = table.columns
-                break
-
-        if columns is None:
+        # only the metadata of the table is loaded
+        try:
+            table = self._tap.load_table(table_name, verbose=verbose)
+        except HTTPError:
+            table = None
+        if table is None or str(table.name) != str(table_name):
             raise ValueError("table name specified is not found in XSA TAP service")
+        columns = table.columns
 
         if only_names:
             return [c.name for c in columns]
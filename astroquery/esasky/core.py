@@ -166,16 +166,15 @@ class ESASkyClass(BaseQuery):
         A list of columns
         """
 
-        tables = self.get_tables(only_names=False, verbose=verbose)
-        columns = None
-        for table in tables:
-            if str(table.name) == str(table_name):
-                columns = table.columns
-                break
-
-        if columns is None:
+        # only the metadata of the table is loaded
+        try:
+            table = self._tap.load_table(table_name, verbose=verbose)
+        except HTTPError:
+            table = None
+        if table is None or str(table.name) != str(table_name):
             raise ValueError("table name specified is not found in "
                              "ESASky TAP service")
+        columns = table.columns
 
         if only_names:
             return [c.name for c in columns]
@@ -27,6 +27,10 @@ class Conf(_config.ConfigNamespace):
         30,
         'Time limit for connecting to HEASARC server.')
 
+    max_concurrent_queries = _config.ConfigItem(
+        4,
+        'Maximum number of requests sent concurrently by query_regions.')
+
 
 conf = Conf()
 
@@ -2,8 +2,10 @@
 
 from typing import Union
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO, BytesIO
-from astropy.table import Table
+import numpy as np
+from astropy.table import Table, vstack
 from astropy.io import fits
 from astropy import coordinates
 from astropy import units as u
@@ -35,6 +37,7 @@ class HeasarcClass(BaseQuery):
 
     URL = conf.server
     TIMEOUT = conf.timeout
+    MAX_CONCURRENT_QUERIES = conf.max_concurrent_queries
     coord_systems = ['fk5', 'fk4', 'equatorial', 'galactic']
 
     def query_async(self, request_payload, *, cache=True, url=None):
@@ -185,6 +188,93 @@ class HeasarcClass(BaseQuery):
         # Submit the request
         return self.query_async(request_payload, cache=cache)
 
+    def query_regions(self, positions, mission, radius, *, cache=True,
+                      get_query_payload=False, **kwargs):
+        """
+        Query around each of an array of coordinates within a given mission
+        catalog, sending at most ``MAX_CONCURRENT_QUERIES`` requests at a
+        time. The request parameters shared by all the positions are only
+        worked out once, and the results are always requested and parsed
+        as FITS.
+
+        Parameters
+        ----------
+        positions : `astropy.coordinates.SkyCoord`
+            The positions around which to search. They are converted to
+            the FK5 reference frame.
+        mission : str
+            Mission table to search from
+        radius :
+            Astropy Quantity object, or a string that can be parsed into one.
+            e.g., '1 degree' or 1*u.degree.
+        **kwargs :
+            see `~astroquery.heasarc.HeasarcClass._args_to_payload` for list
+            of additional parameters that can be used to refine search query
+
+        Returns
+        -------
+        table : `~astropy.table.Table`
+            The results for all the positions, with a ``SEARCH_INDEX``
+            column holding the index of the position each row was found
+            around.
+        """
+        c = commons.parse_coordinates(positions).transform_to(coordinates.FK5)
+        kwargs['coordsys'] = 'fk5'
+        kwargs['equinox'] = 2000
+        kwargs['displaymode'] = 'FitsDisplay'
+
+        base_payload = self._args_to_payload(mission=mission, radius=u.Quantity(radius),
+                                             **kwargs)
+        entries = np.char.add(np.char.add(np.char.mod('%.10f', np.atleast_1d(c.ra.degree)), ','),
+                              np.char.mod('%.10f', np.atleast_1d(c.dec.degree)))
+        payloads = [dict(base_payload, Entry=entry) for entry in entries.tolist()]
+
+        if get_query_payload:
+            return payloads
+
+        def query(payload):
+            return self._parse_fits_result(self.query_async(payload, cache=cache))
+
+        with ThreadPoolExecutor(max(1, self.MAX_CONCURRENT_QUERIES)) as executor:
+            results = list(executor.map(query, payloads))
+
+        tables = []
+        for index, table in enumerate(results):
+            if table is not None and len(table) > 0:
+                table['SEARCH_INDEX'] = np.full(len(table), index)
+                tables.append(table)
+
+        if not tables:
+            warnings.warn(NoResultsWarning("No matching rows were found in the query."))
+            return Table()
+        return vstack(tables, metadata_conflicts='silent')
+
+    def _check_errors(self, content):
+        """
+        Raise `~astroquery.exceptions.InvalidQueryError` for error replies,
+        searching the raw bytes of the response.
+        """
+        if b"BATCH_RETRIEVAL_MSG ERROR:" in content:
+            raise InvalidQueryError("One or more inputs is not recognized by HEASARC. "
+                                    "Check that the object name is in GRB, SIMBAD+Sesame, or "
+                                    "NED format and that the mission name is as listed in "
+                                    "query_mission_list().")
+        elif b"Software error:" in content:
+            raise InvalidQueryError("Unspecified error from HEASARC database. "
+                                    "\nCheck error message: \n{!s}".format(
+                                        content.decode(errors='replace')))
+
+    def _parse_fits_result(self, response):
+        """
+        Parse the response of a query sent with the ``FitsDisplay`` mode,
+        returning `None` if no rows matched.
+        """
+        content = response.content
+        self._check_errors(content)
+        if b"NO MATCHING ROWS" in content or b"XTENSION= 'IMAGE   '" in content:
+            return None
+        return Table_read(BytesIO(content), hdu=1)
+
     def _old_w3query_fallback(self, content):
         # old w3query (such as that used in ISDC) return very strange fits, with all ints
 
@@ -250,15 +340,8 @@ class HeasarcClass(BaseQuery):
         if not verbose:
             commons.suppress_vo_warnings()
 
-        if "BATCH_RETRIEVAL_MSG ERROR:" in response.text:
-            raise InvalidQueryError("One or more inputs is not recognized by HEASARC. "
-                                    "Check that the object name is in GRB, SIMBAD+Sesame, or "
-                                    "NED format and that the mission name is as listed in "
-                                    "query_mission_list().")
-        elif "Software error:" in response.text:
-            raise InvalidQueryError("Unspecified error from HEASARC database. "
-                                    "\nCheck error message: \n{!s}".format(response.text))
-        elif "NO MATCHING ROWS" in response.text:
+        self._check_errors(response.content)
+        if "NO MATCHING ROWS" in response.text:
             warnings.warn(NoResultsWarning("No matching rows were found in the query."))
             return Table()
 
@@ -0,0 +1,81 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+
+from io import BytesIO
+
+import numpy as np
+import pytest
+from astropy import units as u
+from astropy.coordinates import SkyCoord
+from astropy.table import Table
+
+from ...exceptions import InvalidQueryError, NoResultsWarning
+from ...heasarc import Heasarc
+from .conftest import MockResponse
+
+
+@pytest.fixture
+def patch_get(monkeypatch):
+    # the tests of this module mock the individual queries, so the saved
+    # responses of the conftest fixture are not needed
+    return monkeypatch
+
+
+class MockFitsResponse:
+    def __init__(self, content):
+        self.content = content
+
+
+def fits_response(nrows):
+    table = Table({'NAME': [f'src{i}' for i in range(nrows)],
+                   'RA': np.arange(nrows, dtype=float)})
+    content = BytesIO()
+    table.write(content, format='fits')
+    return MockFitsResponse(content.getvalue())
+
+
+@pytest.fixture
+def positions():
+    return SkyCoord([10, 20, 30] * u.deg, [-5, 1, 5] * u.deg, frame='fk5')
+
+
+def test_query_regions_payload(positions):
+    payloads = Heasarc.query_regions(positions, mission='rosmaster', radius='1 degree',
+                                     get_query_payload=True)
+    assert len(payloads) == 3
+    assert [payload['Entry'] for payload in payloads] == [
+        '10.0000000000,-5.0000000000',
+        '20.0000000000,1.0000000000',
+        '30.0000000000,5.0000000000']
+    for payload in payloads:
+        assert payload['tablehead'] == 'name=BATCHRETRIEVALCATALOG_2.0 rosmaster'
+        assert payload['displaymode'] == 'FitsDisplay'
+        assert payload['Coordinates'] == 'Equatorial: R.A. Dec'
+        assert payload['Radius'] == '60.0 arcmin'
+
+
+def test_query_regions(monkeypatch, positions):
+    responses = {'10.0000000000,-5.0000000000': fits_response(2),
+                 '20.0000000000,1.0000000000': MockResponse('NO MATCHING ROWS'),
+                 '30.0000000000,5.0000000000': fits_response(1)}
+    monkeypatch.setattr(Heasarc, 'query_async',
+                        lambda payload, cache=True: responses[payload['Entry']])
+
+    table = Heasarc.query_regions(positions, mission='rosmaster', radius='1 degree')
+    assert len(table) == 3
+    assert table['SEARCH_INDEX'].tolist() == [0, 0, 2]
+    assert table['NAME'].tolist() == ['src0', 'src1', 'src0']
+
+
+def test_query_regions_no_results(monkeypatch, positions):
+    monkeypatch.setattr(Heasarc, 'query_async',
+                        lambda payload, cache=True: MockResponse('NO MATCHING ROWS'))
+    with pytest.warns(NoResultsWarning):
+        table = Heasarc.query_regions(positions, mission='rosmaster', radius='1 degree')
+    assert len(table) == 0
+
+
+def test_query_regions_error(monkeypatch, positions):
+    monkeypatch.setattr(Heasarc, 'query_async',
+                        lambda payload, cache=True: MockResponse('BATCH_RETRIEVAL_MSG ERROR: bad'))
+    with pytest.raises(InvalidQueryError):
+        Heasarc.query_regions(positions, mission='rosmaster', radius='1 degree')
@@ -123,6 +123,10 @@ class IrsaClass(BaseQuery):
     TIMEOUT = conf.timeout
     ROW_LIMIT = conf.row_limit
 
+    # Error messages are sent as short replies, so only the beginning of a
+    # response needs to be searched for them.
+    _ERROR_SNIFF_BYTES = 65536
+
     def query_region_async(self, coordinates=None, *, catalog=None,
                            spatial='Cone', radius=10 * u.arcsec, width=None,
                            polygon=None, get_query_payload=False,
@@ -309,23 +313,25 @@ class IrsaClass(BaseQuery):
         if not verbose:
             commons.suppress_vo_warnings()
 
-        content = response.text
+        content = response.content
+        head = content[:self._ERROR_SNIFF_BYTES]
 
         # Check if results were returned
-        if 'The catalog is not on the list' in content:
+        if b'The catalog is not on the list' in head:
             raise ValueError("Invalid Catalog specified")
 
         # Check that object name was not malformed
-        if 'Either wrong or missing coordinate/object name' in content:
+        if b'Either wrong or missing coordinate/object name' in head:
             raise ValueError("Malformed coordinate/object name")
 
-        # Check to see that output table size limit hasn't been exceeded
-        if 'Exceeding output table size limit' in content:
+        # Check to see that output table size limit hasn't been exceeded;
+        # this comes with large truncated results, so it can be anywhere
+        if b'Exceeding output table size limit' in content:
             raise TableParseError("Exceeded output table size - reduce number "
                                   "of output columns and/or limit search area")
 
         # Check to see that the query engine is working
-        if 'SQLConnect failed' in content:
+        if b'SQLConnect failed' in head:
             raise TimeoutError("The IRSA server is currently down")
 
         # Check that the results are not of length zero
@@ -335,7 +341,7 @@ class IrsaClass(BaseQuery):
 
         # Read it in using the astropy VO table reader
         try:
-            first_table = votable.parse(BytesIO(response.content),
+            first_table = votable.parse(BytesIO(content),
                                         verify='warn').get_first_table()
         except Exception as ex:
             self.response = response
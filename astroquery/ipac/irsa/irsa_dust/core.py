@@ -89,7 +89,7 @@ class IrsaDustClass(BaseQuery):
         readable_objs = self.get_images_async(
             coordinate, radius=radius, image_type=image_type, timeout=timeout,
             get_query_payload=get_query_payload, show_progress=show_progress)
-        return [obj.get_fits() for obj in readable_objs]
+        return commons.get_fits_files(readable_objs, show_progress=show_progress)
 
     def get_images_async(self, coordinate, *, radius=None, image_type=None,
                          timeout=TIMEOUT, get_query_payload=False,
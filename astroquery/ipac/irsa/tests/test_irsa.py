@@ -9,6 +9,7 @@ from astropy.coordinates import SkyCoord
 from astropy.table import Table
 import astropy.units as u
 
+from astroquery.exceptions import TableParseError
 from astroquery.utils.mocks import MockResponse
 from astroquery.ipac.irsa import Irsa, conf
 from astroquery.ipac import irsa
@@ -172,6 +173,25 @@ def test_spatial_invalid(spatial):
         Irsa._parse_spatial(spatial, coordinates='m31')
 
 
+@pytest.mark.parametrize(('message', 'error'),
+                         [(b'The catalog is not on the list', ValueError),
+                          (b'Either wrong or missing coordinate/object name', ValueError),
+                          (b'SQLConnect failed', TimeoutError)])
+def test_parse_result_errors(message, error):
+    response = MockResponse(b'[struct stat="ERROR", msg="' + message + b'"]')
+    with pytest.raises(error):
+        Irsa._parse_result(response)
+
+
+def test_parse_result_size_limit():
+    with open(data_path(DATA_FILES['Cone']), 'rb') as infile:
+        content = infile.read()
+    content += b' ' * Irsa._ERROR_SNIFF_BYTES
+    content += b'[struct stat="ERROR", msg="Exceeding output table size limit"]'
+    with pytest.raises(TableParseError, match='Exceeded output table size'):
+        Irsa._parse_result(MockResponse(content))
+
+
 def test_deprecated_namespace_import_warning():
     with pytest.warns(DeprecationWarning):
         import astroquery.irsa  # noqa: F401
@@ -0,0 +1,50 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+
+from io import BytesIO
+
+import numpy as np
+import pytest
+from astropy.io import votable
+from astropy.table import Table
+
+from astroquery.utils.mocks import MockResponse
+from astroquery.ipac.irsa import Irsa
+from astroquery.ipac.irsa.tests.test_irsa import data_path
+
+pytestmark = pytest.mark.benchmark
+
+# rows of the benchmarked results, made of repeated rows of a recorded reply
+N_ROWS = 10000
+
+
+@pytest.fixture(scope='module')
+def recorded_table():
+    table = votable.parse(data_path('Polygon.xml')).get_first_table().to_table()
+    table = table[np.resize(np.arange(len(table)), N_ROWS)]
+    # variable length strings, which FITS tables cannot hold
+    for name in table.colnames:
+        if table[name].dtype == object:
+            table[name] = table[name].astype(str)
+    return table
+
+
+@pytest.mark.parametrize('serialization', ['tabledata', 'binary', 'binary2'])
+def test_parse_votable(measure, recorded_table, serialization):
+    content = BytesIO()
+    recorded_table.write(content, format='votable',
+                         tabledata_format=serialization)
+    response = MockResponse(content.getvalue())
+
+    table = measure(Irsa._parse_result, response)
+
+    assert len(table) == N_ROWS
+
+
+def test_parse_fits(measure, recorded_table):
+    content = BytesIO()
+    recorded_table.write(content, format='fits')
+
+    table = measure(lambda: Table.read(BytesIO(content.getvalue()),
+                                       format='fits'))
+
+    assert len(table) == N_ROWS
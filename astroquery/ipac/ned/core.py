@@ -368,7 +368,7 @@ class NedClass(BaseQuery):
 
         if get_query_payload:
             return readable_objs
-        return [obj.get_fits() for obj in readable_objs]
+        return commons.get_fits_files(readable_objs, show_progress=show_progress)
 
     def get_images_async(self, object_name, *, get_query_payload=False,
                          show_progress=True):
@@ -421,7 +421,7 @@ class NedClass(BaseQuery):
 
         if get_query_payload:
             return readable_objs
-        return [obj.get_fits() for obj in readable_objs]
+        return commons.get_fits_files(readable_objs, show_progress=show_progress)
 
     def get_spectra_async(self, object_name, *, get_query_payload=False,
                           show_progress=True):
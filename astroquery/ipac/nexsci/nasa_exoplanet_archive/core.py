@@ -2,6 +2,7 @@
 
 # Basic imports
 import copy
+import functools
 import io
 import re
 import warnings
@@ -16,7 +17,7 @@ import numpy as np
 from astropy.coordinates import SkyCoord
 from astropy.io import ascii
 from astropy.io.votable import parse_single_table
-from astropy.table import QTable
+from astropy.table import Column, QTable
 from astropy.utils.exceptions import AstropyWarning
 
 # Import astroquery utilities
@@ -510,9 +511,10 @@ class NasaExoplanetArchiveClass(BaseQuery):
         message = "\n".join(line for line in (error_type, error_message) if line is not None)
         raise RemoteServiceError(message)
 
-    def _fix_units(self, data):
+    def _get_unit_plan(self, data):
         """
-        Fix any undefined units using a set of hacks
+        Work out the unit of each column of ``data`` and which columns must be converted to
+        strings, reusing the result for tables with the same columns
 
         Parameters
         ----------
@@ -521,29 +523,35 @@ class NasaExoplanetArchiveClass(BaseQuery):
 
         Returns
         -------
-        new_data : `~astropy.table.QTable` or `~astropy.table.Table`
-            The original ``data`` table with units applied where possible.
+        plan : tuple
+            The ``(unit, to_str)`` tuple of each column of ``data``, and the ``(unit, column
+            name)`` tuples of the units that are not recognized.
         """
-
-        # To deal with masked data and quantities properly, we need to construct the QTable
-        # manually so we'll loop over the columns and process each one independently
-        column_names = list(data.columns)
-        column_data = []
-        column_masks = dict()
-        for col in column_names:
-            unit = data[col].unit
-            unit = UNIT_MAPPER.get(str(unit), unit)
-            try:
-                data[col].mask = False
-            except AttributeError:
-                pass
+        # units are keyed by their string, as unrecognized units cannot be hashed
+        return self._make_unit_plan(
+            tuple((col.info.name, None if col.unit is None else str(col.unit), col.dtype == object)
+                  for col in data.itercols()))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _make_unit_plan(key):
+        """
+        Work out the plan of `_get_unit_plan` from the ``(name, unit string, is_object)`` tuple
+        of each column. The plans of the most recently used table layouts are kept.
+        """
+        columns = []
+        unrecognized = []
+        for col, unit_str, is_object in key:
+            if unit_str in UNIT_MAPPER:
+                unit = UNIT_MAPPER[unit_str]
+            elif unit_str is not None:
+                unit = u.Unit(unit_str, parse_strict='silent')
+            else:
+                unit = None
             # Columns with dtype==object/str can't have units according to astropy
             # Set unit to None
-            if data[col].dtype == object and unit is not None:
+            if is_object:
                 unit = None
-                data[col] = data[col].astype(str)
-            if data[col].dtype == object and unit is None:
-                data[col] = data[col].astype(str)
             if isinstance(unit, u.UnrecognizedUnit):
                 # some special cases
                 unit_str = str(unit).lower()
@@ -562,20 +570,46 @@ class NasaExoplanetArchiveClass(BaseQuery):
                     unit = u.mag
 
                 else:  # pragma: nocover
-                    warnings.warn(f"Unrecognized unit: '{unit}' for column {col}.", AstropyWarning)
+                    unrecognized.append((unit, col))
+            columns.append((unit, is_object))
 
-            # Unmask since astropy doesn't like masked values in columns with units
-            try:
-                column_masks[col] = data[col].mask
-            except AttributeError:
-                pass
-            else:
-                column_masks[col] = False
+        return tuple(columns), tuple(unrecognized)
+
+    def _fix_units(self, data):
+        """
+        Fix any undefined units using a set of hacks
+
+        Parameters
+        ----------
+        data : `~astropy.table.Table`
+            The original data table without units.
 
-            data[col].unit = unit
-            column_data.append(data[col])
+        Returns
+        -------
+        new_data : `~astropy.table.QTable` or `~astropy.table.Table`
+            The original ``data`` table with units applied where possible.
+        """
+        plan, unrecognized = self._get_unit_plan(data)
+        # The plan is shared by the queries of a table, the warnings are not
+        for unit, col in unrecognized:  # pragma: nocover
+            warnings.warn(f"Unrecognized unit: '{unit}' for column {col}.", AstropyWarning)
+
+        # Astropy doesn't like masked values in columns with units, so the QTable is built in
+        # a single pass from unmasked columns sharing the data of the original ones, with the
+        # units of the plan
+        columns = []
+        for column, (unit, to_str) in zip(data.itercols(), plan):
+            values = column.data
+            if isinstance(values, np.ma.MaskedArray):
+                values = values.data
+            # Columns with dtype==object/str can't have units according to astropy
+            if to_str:
+                values = values.astype(str)
+            columns.append(Column(values, name=column.info.name, unit=unit,
+                                  description=column.info.description, format=column.info.format,
+                                  meta=column.info.meta, copy=False))
 
-        # Build the new `QTable` and copy over the data masks if there are any
+        # Build the new `QTable`, whose masks are all unset if there are masked columns
         # Some units cannot be used for MaskedQuantities, we catch the specific UserWarning
         # about them here as the end user can do nothing about this
         with warnings.catch_warnings():
@@ -584,10 +618,7 @@ class NasaExoplanetArchiveClass(BaseQuery):
             for column in colnames_to_ignore:
                 warnings.filterwarnings('ignore', message=f'column {column} has a unit but',
                                         category=UserWarning)
-            result = QTable(column_data, names=column_names, masked=len(column_masks) > 0)
-
-        for key, mask in column_masks.items():
-            result[key].mask = mask
+            result = QTable(columns, masked=data.has_masked_columns, copy=False)
 
         return result
 
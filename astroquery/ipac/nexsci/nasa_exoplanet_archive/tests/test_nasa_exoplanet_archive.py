@@ -5,11 +5,14 @@ import sys
 from urllib.parse import urlencode
 
 import astropy.units as u
+import numpy as np
 import pkg_resources
 import pytest
 import requests
 
 from astropy.coordinates import SkyCoord
+from astropy.table import Column, MaskedColumn, QTable, Table
+from astropy.utils.exceptions import AstropyWarning
 from astroquery.utils.mocks import MockResponse
 from astroquery.ipac.nexsci.nasa_exoplanet_archive.core import NasaExoplanetArchiveClass, conf, get_access_url
 try:
@@ -311,6 +314,40 @@ def test_get_tap_tables():
     assert 'pscomppars' in result
 
 
+def test_fix_units():
+    def make_table():
+        return Table([MaskedColumn([1.0, 2.0], unit="days", mask=[False, True]),
+                      MaskedColumn([1.0, 2.0], unit="earth"),
+                      MaskedColumn(np.array(["a", "b"], dtype=object))],
+                     names=["pl_orbper", "koi_prad", "pl_name"])
+
+    nea = NasaExoplanetArchiveClass()
+    nea._make_unit_plan.cache_clear()
+    result = nea._fix_units(make_table())
+    assert isinstance(result, QTable)
+    assert result["pl_orbper"].unit == u.day
+    assert result["koi_prad"].unit == u.R_earth
+    assert result["pl_name"].dtype.kind == "U"
+    assert not result["pl_orbper"].mask.any()
+
+    # tables with the same columns reuse the same plan
+    plan = nea._get_unit_plan(make_table())
+    assert nea._make_unit_plan.cache_info().currsize == 1
+    assert nea._make_unit_plan.cache_info().maxsize is not None
+    assert nea._fix_units(make_table())["koi_prad"].unit == u.R_earth
+    assert nea._get_unit_plan(make_table()) is plan
+
+
+def test_fix_units_unrecognized():
+    nea = NasaExoplanetArchiveClass()
+
+    # the warnings are issued for each query, not only when the plan is made
+    for _ in range(2):
+        with pytest.warns(AstropyWarning, match="Unrecognized unit: 'spam' for column eggs"):
+            result = nea._fix_units(Table([Column([1.0, 2.0], unit="spam")], names=["eggs"]))
+        assert isinstance(result["eggs"].unit, u.UnrecognizedUnit)
+
+
 def test_deprecated_namespace_import_warning():
     with pytest.warns(DeprecationWarning):
         import astroquery.nasa_exoplanet_archive  # noqa: F401
@@ -0,0 +1,30 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+import os
+
+import numpy as np
+import pytest
+from astropy.io import ascii
+
+from astroquery.ipac.nexsci.nasa_exoplanet_archive.core import CONVERTERS, NasaExoplanetArchiveClass
+
+pytestmark = pytest.mark.benchmark
+
+# rows of the benchmarked table, about the size of the ``ps`` table, made of repeated rows
+# of a recorded response
+N_ROWS = 30000
+
+
+@pytest.fixture(scope='module')
+def recorded_table():
+    with open(os.path.join(os.path.dirname(__file__), "data", "koi_expect_0.txt"), "r") as f:
+        table = ascii.read(f.read(), format="ipac", fast_reader=False, converters=CONVERTERS)
+    return table[np.resize(np.arange(len(table)), N_ROWS)]
+
+
+def test_fix_units(measure, recorded_table):
+    nea = NasaExoplanetArchiveClass()
+
+    result = measure(nea._fix_units, recorded_table)
+
+    assert len(result) == N_ROWS
+    assert len(result.colnames) == len(recorded_table.colnames)
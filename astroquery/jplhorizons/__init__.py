@@ -26,6 +26,16 @@ class Conf(_config.ConfigNamespace):
         30,
         'Time limit for connecting to JPL servers.')
 
+    max_uri_length = _config.ConfigItem(
+        2000,
+        'Maximum length of a query URL; longer lists of epochs are split '
+        'into several queries by `HorizonsClass.query_batch`.')
+
+    max_concurrent_queries = _config.ConfigItem(
+        2,
+        'Maximum number of queries `HorizonsClass.query_batch` sends to the '
+        'JPL servers at the same time.')
+
     # JPL Horizons settings
 
     # quantities queried in ephemerides query (see
@@ -219,7 +229,8 @@ class Conf(_config.ConfigNamespace):
 conf = Conf()
 
 from .core import Horizons, HorizonsClass
+from .interpolation import ChebyshevVectors
 
-__all__ = ['Horizons', 'HorizonsClass',
+__all__ = ['Horizons', 'HorizonsClass', 'ChebyshevVectors',
            'Conf', 'conf',
            ]
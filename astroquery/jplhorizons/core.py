@@ -2,15 +2,21 @@
 
 # 1. standard library imports
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import pickle
+import threading
 from typing import Mapping
+from urllib.parse import quote_plus, urlencode
 import warnings
 
 # 2. third party imports
 from requests.exceptions import HTTPError
+import numpy as np
 from numpy import nan
 from numpy import isnan
 from numpy import ndarray
-from astropy.table import Table, Column
+from astropy.table import Table, vstack
 from astropy.io import ascii
 from astropy.time import Time
 from astropy.utils.exceptions import AstropyDeprecationWarning
@@ -19,15 +25,39 @@ from astropy.utils.decorators import deprecated_renamed_argument, deprecated_att
 # 3. local imports - use relative imports
 # commonly required local imports shown below as example
 # all Query classes should inherit from BaseQuery.
+from .. import log
 from ..query import BaseQuery
 # async_to_sync generates the relevant query tools from _async methods
 from ..utils import async_to_sync
 # import configurable items declared in __init__.py
 from . import conf
+from .interpolation import ChebyshevVectors, VECTOR_COLUMNS, fit_segment
 
 __all__ = ['Horizons', 'HorizonsClass']
 
 
+def _line_end(text, pos):
+    """Return the index of the end of the line containing ``pos``."""
+    end = text.find('\n', pos)
+    return len(text) if end < 0 else end
+
+
+def _line_at(text, pos, offset=0):
+    """Return the line containing ``pos``, or the ``offset``-th line after it."""
+    start = text.rfind('\n', 0, pos) + 1
+    for _ in range(offset):
+        start = text.find('\n', start) + 1
+        if start == 0:
+            return ''
+    return text[start:_line_end(text, start)]
+
+
+def _field_after(text, label):
+    """Return the value following ``label`` in the last line containing it."""
+    pos = text.rfind(label)
+    return _line_at(text, pos)[18:50].strip() if pos >= 0 else ''
+
+
 @async_to_sync
 class HorizonsClass(BaseQuery):
     """
@@ -35,6 +65,8 @@ class HorizonsClass(BaseQuery):
     """
 
     TIMEOUT = conf.timeout
+    MAX_URI_LENGTH = conf.max_uri_length
+    MAX_CONCURRENT_QUERIES = conf.max_concurrent_queries
 
     raw_response = deprecated_attribute(
         'raw_response', '0.4.7',
@@ -653,7 +685,7 @@ class HorizonsClass(BaseQuery):
         self.uri = response.url
 
         # check length of uri
-        if len(self.uri) >= 2000:
+        if len(self.uri) >= self.MAX_URI_LENGTH:
             warnings.warn(('The uri used in this query is very long '
                            'and might have been truncated. The results of '
                            'the query might be compromised. If you queried '
@@ -876,7 +908,7 @@ class HorizonsClass(BaseQuery):
         self.uri = response.url
 
         # check length of uri
-        if len(self.uri) >= 2000:
+        if len(self.uri) >= self.MAX_URI_LENGTH:
             warnings.warn(('The uri used in this query is very long '
                            'and might have been truncated. The results of '
                            'the query might be compromised. If you queried '
@@ -1125,7 +1157,7 @@ class HorizonsClass(BaseQuery):
         self.uri = response.url
 
         # check length of uri
-        if len(self.uri) >= 2000:
+        if len(self.uri) >= self.MAX_URI_LENGTH:
             warnings.warn(('The uri used in this query is very long '
                            'and might have been truncated. The results of '
                            'the query might be compromised. If you queried '
@@ -1133,6 +1165,279 @@ class HorizonsClass(BaseQuery):
 
         return response
 
+    def vectors_interpolator(self, start, stop, *, degree=12, tolerance=1e-9,
+                             segment_length=16, cache=True, **kwargs):
+        """
+        Approximate the state vectors of the target between ``start`` and
+        ``stop`` by piecewise Chebyshev polynomials.
+
+        The time span is divided into segments of ``segment_length`` days and
+        the state vectors are queried at ``4 * degree + 1`` equally spaced
+        epochs per segment, with a single query for all segments. Positions
+        and velocities are fit in each segment, and the fit is checked
+        against samples left out of it; segments whose positions deviate by
+        more than ``tolerance`` are halved and queried again. The returned
+        `~astroquery.jplhorizons.ChebyshevVectors` evaluates the state vectors
+        at any number of epochs without further queries.
+
+
+        Parameters
+        ----------
+
+        start, stop : float or `~astropy.time.Time`
+            Time span, in JD (TDB) if given as floats.
+
+        degree : int, optional
+            Degree of the Chebyshev polynomials. Default: 12
+
+        tolerance : float, optional
+            Maximum deviation of the approximated positions in AU.
+            Default: 1e-9 (about 150 m)
+
+        segment_length : float, optional
+            Initial length of the segments in days; it is reduced to fit the
+            time span into a whole number of segments. Default: 16
+
+        cache : bool, optional
+            Defaults to True. If set, the queries are cached and so are the
+            fitted polynomials, which are then reused for identical arguments.
+
+        **kwargs
+            Passed on to `~HorizonsClass.vectors`, e.g., ``refplane`` or
+            ``aberrations``.
+
+
+        Returns
+        -------
+
+        interpolator : `~astroquery.jplhorizons.ChebyshevVectors`
+
+
+        Examples
+        --------
+
+        >>> import numpy as np
+        >>> from astroquery.jplhorizons import Horizons
+        >>> ceres = Horizons(id='Ceres', location='500@10')
+        >>> vec = ceres.vectors_interpolator(2458000.5, 2458365.5)  # doctest: +REMOTE_DATA
+        >>> tab = vec(np.linspace(2458000.5, 2458365.5, 1000000))  # doctest: +REMOTE_DATA
+        >>> tab.colnames  # doctest: +REMOTE_DATA
+        ['datetime_jd', 'x', 'y', 'z', 'vx', 'vy', 'vz']
+
+        """
+
+        if isinstance(start, Time):
+            start = start.tdb.jd
+        if isinstance(stop, Time):
+            stop = stop.tdb.jd
+        start, stop = float(start), float(stop)
+        if not stop > start:
+            raise ValueError("'stop' has to be later than 'start'")
+
+        key = hashlib.sha224(repr(
+            (self.id, self.location, self.id_type, start, stop, degree,
+             tolerance, segment_length, sorted(kwargs.items()))
+        ).encode()).hexdigest()
+        fit_file = self.cache_location.joinpath(
+            "chebyshev_{0}.pickle".format(key))
+        if cache and fit_file.is_file():
+            try:
+                with open(fit_file, 'rb') as f:
+                    return pickle.load(f)
+            except Exception as ex:
+                log.warning("Could not read the cached Chebyshev fit {0}: "
+                            "{1}".format(fit_file, ex))
+
+        # every entry is a time span to be queried and divided into the
+        # given number of segments
+        pending = [(start, stop, max(int(np.ceil((stop - start)
+                                                 / segment_length)), 1))]
+        # segments are not halved below this length
+        min_length = (stop - start) / pending[0][2] / 2 ** 10
+        segments = []
+        targetname = None
+        while pending:
+            refine = []
+            for span_start, span_stop, count in pending:
+                vec = self._query_interpolation_samples(
+                    span_start, span_stop, count * 4 * degree, cache, kwargs)
+                targetname = vec['targetname'][0]
+                jd = np.asarray(vec['datetime_jd'], dtype=float)
+                vectors = np.column_stack([np.asarray(vec[col], dtype=float)
+                                           for col in VECTOR_COLUMNS])
+                bounds = np.linspace(span_start, span_stop, count + 1)
+                for seg_start, seg_stop in zip(bounds[:-1], bounds[1:]):
+                    length = seg_stop - seg_start
+                    inside = ((jd >= seg_start - 1e-6 * length)
+                              & (jd <= seg_stop + 1e-6 * length))
+                    coefficients, error = fit_segment(
+                        jd[inside], vectors[inside], seg_start, seg_stop,
+                        degree)
+                    if error > tolerance and length / 2 >= min_length:
+                        refine.append((seg_start, seg_stop, 2))
+                    else:
+                        segments.append((seg_start, seg_stop, coefficients,
+                                         error))
+            pending = refine
+
+        segments.sort(key=lambda segment: segment[0])
+        interpolator = ChebyshevVectors(
+            [segment[0] for segment in segments] + [segments[-1][1]],
+            [segment[2] for segment in segments],
+            [segment[3] for segment in segments],
+            targetname=targetname)
+        if interpolator.max_error.max() > tolerance:
+            warnings.warn('The Chebyshev approximation deviates by up to '
+                          '{:.3g} AU, more than the requested tolerance.'
+                          .format(interpolator.max_error.max()))
+
+        if cache:
+            fit_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(fit_file, 'wb') as f:
+                pickle.dump(interpolator, f, protocol=4)
+
+        return interpolator
+
+    def _query_interpolation_samples(self, start, stop, intervals, cache,
+                                     kwargs):
+        """
+        Query the state vectors at ``intervals + 1`` equally spaced epochs
+        from ``start`` to ``stop``.
+        """
+        obj = HorizonsClass(id=self.id, location=self.location,
+                            epochs={'start': 'JD {!r}'.format(start),
+                                    'stop': 'JD {!r}'.format(stop),
+                                    'step': str(intervals)},
+                            id_type=self.id_type)
+        obj._cache_location = self._cache_location
+        obj._session = self._session
+        return obj.vectors(cache=cache, **kwargs)
+
+    def query_batch(self, ids, *, query_type='ephemerides', cache=True,
+                    max_workers=None, **kwargs):
+        """
+        Query several targets at the ``location`` and ``epochs`` of this
+        instance and stack the results in a single table.
+
+        Lists of epochs that do not fit into a single query URL (see
+        ``conf.max_uri_length``) are split into several queries.  The
+        queries run concurrently, at most ``max_workers`` at a time, and each
+        query is cached separately, so that repeating a batch with more
+        targets only sends the queries for the new targets.
+
+
+        Parameters
+        ----------
+
+        ids : str, dict, or list-like
+            Targets, each given in any of the forms accepted for the ``id`` of
+            `HorizonsClass`. The ``location``, ``epochs``, and ``id_type`` of
+            this instance apply to all of them.
+
+        query_type : str, optional
+            Either ``'ephemerides'``, ``'elements'``, or ``'vectors'``.
+            Default: ``'ephemerides'``
+
+        cache : bool, optional
+            Defaults to True. If set overrides global caching behavior.
+            See :ref:`caching documentation <astroquery_cache>`.
+
+        max_workers : int, optional
+            Maximum number of queries sent at the same time. Default:
+            ``conf.max_concurrent_queries``
+
+        **kwargs
+            Passed on to the query method selected by ``query_type``, e.g.,
+            ``quantities`` or ``refplane``.
+
+
+        Returns
+        -------
+
+        table : `~astropy.table.Table`
+            Results of all queries, ordered by target and epoch, with an
+            additional first column ``target_id`` holding the target as given
+            in ``ids``.
+
+
+        Examples
+        --------
+
+        >>> from astroquery.jplhorizons import Horizons
+        >>> obj = Horizons(location='568',
+        ...                epochs=[2458133.33546, 2458133.5, 2458134.5])
+        >>> eph = obj.query_batch(['433', '1', '2'])  # doctest: +REMOTE_DATA
+        >>> len(eph)  # doctest: +REMOTE_DATA
+        9
+        >>> print(eph['target_id'][::3])  # doctest: +REMOTE_DATA
+        target_id
+        ---------
+              433
+                1
+                2
+
+        """
+
+        if query_type not in ('ephemerides', 'elements', 'vectors'):
+            raise ValueError('query_type ({:s}) not allowed'.format(
+                str(query_type)))
+        if isinstance(ids, (str, Mapping)) or not hasattr(ids, '__iter__'):
+            ids = [ids]
+        queries = [(target, epochs) for target in ids
+                   for epochs in self._split_epochs(target, query_type,
+                                                    kwargs)]
+        if not queries:
+            raise ValueError("'ids' is empty. Query aborted.")
+
+        # every worker thread reuses its own session across its queries
+        local = threading.local()
+
+        def query(target_epochs):
+            target, epochs = target_epochs
+            obj = HorizonsClass(id=target, location=self.location,
+                                epochs=epochs, id_type=self.id_type)
+            obj._cache_location = self._cache_location
+            if not hasattr(local, 'session'):
+                local.session = obj._session
+            obj._session = local.session
+            table = getattr(obj, query_type)(cache=cache, **kwargs)
+            table.add_column(str(target), name='target_id', index=0)
+            return table
+
+        if max_workers is None:
+            max_workers = self.MAX_CONCURRENT_QUERIES
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            tables = list(executor.map(query, queries))
+
+        return vstack(tables, metadata_conflicts='silent')
+
+    def _split_epochs(self, target, query_type, kwargs):
+        """
+        Split the list of epochs of this instance into chunks that keep the
+        query URL for ``target`` shorter than ``MAX_URI_LENGTH``.
+        """
+        if (not isinstance(self.epochs, (list, tuple, ndarray))
+                or len(self.epochs) == 0):
+            return [self.epochs]
+
+        obj = HorizonsClass(id=target, location=self.location, epochs=[],
+                            id_type=self.id_type)
+        payload = getattr(obj, query_type + '_async')(get_query_payload=True,
+                                                      **kwargs)
+        base_length = len(conf.horizons_server) + 1 + len(urlencode(payload))
+
+        chunks = [[]]
+        length = base_length
+        for epoch in self.epochs:
+            # each epoch adds an encoded newline to TLIST
+            size = len(quote_plus(str(epoch))) + 3
+            if chunks[-1] and length + size >= self.MAX_URI_LENGTH:
+                chunks.append([])
+                length = base_length
+            chunks[-1].append(epoch)
+            length += size
+        return chunks
+
     # ---------------------------------- parser functions
     @staticmethod
     def _prep_loc_dict(loc_dict, attr_name):
@@ -1159,6 +1464,90 @@ class HorizonsClass(BaseQuery):
         loc_dict["SITE_COORD"] = f"'{loc_dict['SITE_COORD']}'"
         return loc_dict
 
+    def _check_errors(self, text):
+        """
+        Raise a `ValueError` if the response ``text`` holds an error message
+        of Horizons.
+        """
+        # catch unknown target
+        pos = text.find('Matching small-bodies')
+        if pos >= 0 and 'No matches found' in _line_at(text, pos, 1):
+            raise ValueError(('Unknown target ({:s}). Maybe try '
+                              'different id_type?').format(self.id))
+        # catch unambiguous names
+        for key in ('Multiple major-bodies match string',
+                    'Matching small-bodies:'):
+            pos = text.find(key)
+            if pos < 0 or 'No matches found' in _line_at(text, pos, 1):
+                continue
+            src = text[text.rfind('\n', 0, pos) + 1:].split('\n')
+            end_idx = len(src)
+            for i in range(2, len(src)):
+                if (('To SELECT, enter record' in src[i])
+                        or ('make unique selection.' in src[i])):
+                    end_idx = i
+                    break
+            raise ValueError(('Ambiguous target name; provide '
+                              'unique id:\n%s' %
+                              '\n'.join(src[2:end_idx])))
+
+        # catch any unavailability of ephemeris data, elements errors, and
+        # date errors
+        for message in ('No ephemeris for target', 'Cannot output elements',
+                        'Cannot interpret date'):
+            pos = text.find(message)
+            if pos >= 0:
+                raise ValueError('Horizons Error: {:s}'.format(
+                    text[pos:_line_end(text, pos)]))
+
+    @staticmethod
+    def _physical_properties(header):
+        """
+        Read H and G, or M1, M2, k1, k2, and the phase coefficient, from the
+        response ``header``.
+
+        Returns
+        -------
+        properties : list of tuple
+            Column name, value (nan if unavailable), and column index.
+        """
+        H, G = nan, nan
+        M1, M2, k1, k2, phcof = nan, nan, nan, nan, nan
+
+        pos = header.rfind('rotational period in hours)')
+        if pos >= 0:
+            HGline = _line_at(header, pos, 2).split('=')
+            if len(HGline) > 2 and 'B-V' in HGline[2] and 'G' in HGline[1]:
+                try:
+                    H = float(HGline[1].rstrip('G'))
+                    G = float(HGline[2].rstrip('B-V'))
+                except ValueError:
+                    H = nan
+                    G = nan
+
+        pos = header.rfind('Comet physical')
+        if pos >= 0:
+            HGline = _line_at(header, pos, 2).split('=')
+            try:
+                M1 = float(HGline[1].rstrip('M2'))
+                k1 = float(HGline[3].rstrip('k2'))
+            except (ValueError, IndexError):
+                M1 = nan
+                k1 = nan
+            try:
+                M2 = float(HGline[2].rstrip('k1'))
+                k2 = float(HGline[4].rstrip('PHCOF'))
+            except (ValueError, IndexError):
+                M2 = nan
+                k2 = nan
+            try:
+                phcof = float(HGline[5])
+            except (ValueError, IndexError):
+                phcof = nan
+
+        return [('H', H, 3), ('G', G, 4), ('M1', M1, 3), ('M2', M2, 4),
+                ('k1', k1, 5), ('k2', k2, 6), ('phasecoeff', phcof, 7)]
+
     def _parse_result(self, response, verbose=None):
         """
         Parse query result to a `~astropy.table.Table` object.
@@ -1199,109 +1588,42 @@ class HorizonsClass(BaseQuery):
             self.return_raw = False
             return self._raw_response
 
-        # split response by line break
-        src = response.text.split('\n')
+        text = response.text
+
+        # nothing after an input error is parsed
+        input_error = text.find('INPUT ERROR')
+        if input_error >= 0:
+            text = text[:_line_end(text, input_error)]
+
+        # locate the data block; the header precedes it
+        data_start = text.rfind('$$SOE')
+        data_start = 0 if data_start < 0 else _line_end(text, data_start) + 1
+        data_end = text.rfind('$$EOE')
+        data_end = 0 if data_end < 0 else text.rfind('\n', 0, data_end) + 1
+        header = text[:data_start] if data_start else text
+
+        self._check_errors(text)
 
-        data_start_idx = 0
-        data_end_idx = 0
-        H, G = nan, nan
-        M1, M2, k1, k2, phcof = nan, nan, nan, nan, nan
         headerline = []
-        centername = ''
-        for idx, line in enumerate(src):
-            # read in ephemerides header line; replace some field names
-            if (self.query_type == 'ephemerides' and "Date__(UT)__HR:MN" in line):
-                headerline = str(line).split(',')
-                headerline[2] = 'solar_presence'
-                headerline[3] = "lunar_presence" if "Earth" in centername else "interfering_body"
+        if input_error < 0:
+            # read in the column header line; replace some field names
+            key = {'ephemerides': 'Date__(UT)__HR:MN',
+                   'elements': 'JDTDB,',
+                   'vectors': 'JDTDB,'}.get(self.query_type)
+            if key is not None and key in header:
+                headerline = _line_at(header, header.rfind(key)).split(',')
                 headerline[-1] = '_dump'
-                if isinstance(self.id, dict) or str(self.id).startswith('g:'):
-                    headerline[4] = 'nearside_flag'
-                    headerline[5] = 'illumination_flag'
-            # read in elements header line
-            elif (self.query_type == 'elements' and "JDTDB," in line):
-                headerline = str(line).split(',')
-                headerline[-1] = '_dump'
-            # read in vectors header line
-            elif (self.query_type == 'vectors' and "JDTDB," in line):
-                headerline = str(line).split(',')
-                headerline[-1] = '_dump'
-            # identify end of data block
-            if "$$EOE" in line:
-                data_end_idx = idx
-            # identify start of data block
-            if "$$SOE" in line:
-                data_start_idx = idx + 1
-            # read in targetname
-            if "Target body name" in line:
-                targetname = line[18:50].strip()
-            # read in center body name
-            if "Center body name" in line:
-                centername = line[18:50].strip()
-            # read in H and G (if available)
-            if "rotational period in hours)" in line:
-                HGline = src[idx + 2].split('=')
-                if 'B-V' in HGline[2] and 'G' in HGline[1]:
-                    try:
-                        H = float(HGline[1].rstrip('G'))
-                        G = float(HGline[2].rstrip('B-V'))
-                    except ValueError:
-                        H = nan
-                        G = nan
-            # read in M1, M2, k1, k2, and phcof (if available)
-            if "Comet physical" in line:
-                HGline = src[idx + 2].split('=')
-                try:
-                    M1 = float(HGline[1].rstrip('M2'))
-                    k1 = float(HGline[3].rstrip('k2'))
-                except ValueError:
-                    M1 = nan
-                    k1 = nan
-                try:
-                    M2 = float(HGline[2].rstrip('k1'))
-                    k2 = float(HGline[4].rstrip('PHCOF'))
-                except ValueError:
-                    M2 = nan
-                    k2 = nan
-                try:
-                    phcof = float(HGline[5])
-                except ValueError:
-                    phcof = nan
-            # catch unambiguous names
-            if (("Multiple major-bodies match string" in line or "Matching small-bodies:" in line)
-                    and ("No matches found" not in src[idx + 1])):
-                for i in range(idx + 2, len(src), 1):
-                    if (('To SELECT, enter record' in src[i]) or ('make unique selection.' in src[i])):
-                        end_idx = i
-                        break
-                raise ValueError(('Ambiguous target name; provide '
-                                  'unique id:\n%s' %
-                                  '\n'.join(src[idx + 2:end_idx])))
-            # catch unknown target
-            if ("Matching small-bodies" in line and "No matches found" in src[idx + 1]):
-                raise ValueError(('Unknown target ({:s}). Maybe try '
-                                  'different id_type?').format(self.id))
-            # catch any unavailability of ephemeris data
-            if "No ephemeris for target" in line:
-                errormsg = line[line.find('No ephemeris for target'):]
-                errormsg = errormsg[:errormsg.find('\n')]
-                raise ValueError('Horizons Error: {:s}'.format(errormsg))
-            # catch elements errors
-            if "Cannot output elements" in line:
-                errormsg = line[line.find('Cannot output elements'):]
-                errormsg = errormsg[:errormsg.find('\n')]
-                raise ValueError('Horizons Error: {:s}'.format(errormsg))
-            # catch date error
-            if "Cannot interpret date" in line:
-                errormsg = line[line.find('Cannot interpret date'):]
-                errormsg = errormsg[:errormsg.find('\n')]
-                raise ValueError('Horizons Error: {:s}'.format(errormsg))
-            if 'INPUT ERROR' in line:
-                headerline = []
-                break
+        centername = _field_after(header, 'Center body name')
+        if self.query_type == 'ephemerides' and headerline:
+            headerline[2] = 'solar_presence'
+            headerline[3] = ("lunar_presence" if "Earth" in centername
+                             else "interfering_body")
+            if isinstance(self.id, dict) or str(self.id).startswith('g:'):
+                headerline[4] = 'nearside_flag'
+                headerline[5] = 'illumination_flag'
 
         if headerline == []:
-            err_msg = "".join(src[data_start_idx:data_end_idx])
+            err_msg = text[data_start:data_end].replace('\n', '')
             if len(err_msg) > 0:
                 raise ValueError('Query failed with error message:\n'
                                  + err_msg)
@@ -1313,17 +1635,20 @@ class HorizonsClass(BaseQuery):
         headerline = [h.strip() for h in headerline]
 
         # remove all 'Cut-off' messages
-        raw_data = [line for line in src[data_start_idx:data_end_idx]
-                    if 'Cut-off' not in line]
-
-        # read in data
-        data = ascii.read(raw_data,
-                          names=headerline,
+        raw_data = text[data_start:data_end]
+        if 'Cut-off' in raw_data:
+            raw_data = '\n'.join(line for line in raw_data.split('\n')
+                                 if 'Cut-off' not in line)
+
+        # read in data with the fast reader; the format is known, so there is
+        # no need to guess it
+        data = ascii.read(raw_data, format='no_header', delimiter=',',
+                          names=headerline, guess=False,
                           fill_values=[('.n.a.', '0'),
                                        ('n.a.', '0')],
-                          fast_reader=False)
+                          fast_reader=True)
         # force to a masked table
-        data = Table(data, masked=True)
+        data = Table(data, masked=True, copy=False)
 
         # convert data to QTable
         # from astropy.table import QTable
@@ -1335,30 +1660,15 @@ class HorizonsClass(BaseQuery):
         # remove last column as it is empty
         data.remove_column('_dump')
 
-        # add targetname and physical properties as columns
-        data.add_column(Column([targetname] * len(data),
-                               name='targetname'), index=0)
-        if not isnan(H):
-            data.add_column(Column([H] * len(data),
-                                   name='H'), index=3)
-        if not isnan(G):
-            data.add_column(Column([G] * len(data),
-                                   name='G'), index=4)
-        if not isnan(M1):
-            data.add_column(Column([M1] * len(data),
-                                   name='M1'), index=3)
-        if not isnan(M2):
-            data.add_column(Column([M2] * len(data),
-                                   name='M2'), index=4)
-        if not isnan(k1):
-            data.add_column(Column([k1] * len(data),
-                                   name='k1'), index=5)
-        if not isnan(k2):
-            data.add_column(Column([k2] * len(data),
-                                   name='k2'), index=6)
-        if not isnan(phcof):
-            data.add_column(Column([phcof] * len(data),
-                                   name='phasecoeff'), index=7)
+        # add targetname and physical properties as constant columns
+        constants = [('targetname', _field_after(header, 'Target body name'),
+                      0)]
+        constants += [(name, value, index) for name, value, index
+                      in self._physical_properties(header)
+                      if not isnan(value)]
+        for name, value, index in constants:
+            data.add_column(np.full(len(data), value), name=name,
+                            index=index)
 
         # replace missing airmass values with 999 (not observable)
         if self.query_type == 'ephemerides' and 'a-mass' in data.colnames:
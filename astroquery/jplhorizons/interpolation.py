@@ -0,0 +1,134 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""
+Piecewise Chebyshev approximation of JPL Horizons state vectors.
+"""
+
+import numpy as np
+from numpy.polynomial import chebyshev
+from astropy.table import Table
+from astropy.time import Time
+
+__all__ = ['ChebyshevVectors']
+
+# state vector columns of a vectors query, in the order of the coefficients
+VECTOR_COLUMNS = ('x', 'y', 'z', 'vx', 'vy', 'vz')
+VECTOR_UNITS = ('AU', 'AU', 'AU', 'AU/d', 'AU/d', 'AU/d')
+
+
+class ChebyshevVectors:
+    """
+    State vectors of a target approximated by Chebyshev polynomials.
+
+    The time span is split into segments and the positions and velocities in
+    each segment are approximated by Chebyshev polynomials of the same
+    degree.  Instances are created by
+    `~astroquery.jplhorizons.HorizonsClass.vectors_interpolator` and evaluated
+    by calling them with the epochs.
+
+    Parameters
+    ----------
+    breakpoints : `~numpy.ndarray`
+        Increasing epochs (JD, TDB) bounding the ``n`` segments, shape
+        ``(n + 1,)``.
+    coefficients : `~numpy.ndarray`
+        Chebyshev coefficients of ``x``, ``y``, ``z``, ``vx``, ``vy``, ``vz``
+        in each segment, shape ``(n, degree + 1, 6)``.
+    max_error : `~numpy.ndarray`
+        Largest deviation (AU) of the approximated positions from positions
+        computed by Horizons and left out of the fit, for each segment.
+    targetname : str, optional
+        Name of the target as resolved by Horizons.
+    """
+
+    def __init__(self, breakpoints, coefficients, max_error, targetname=None):
+        self.breakpoints = np.asarray(breakpoints, dtype=float)
+        self.coefficients = np.asarray(coefficients, dtype=float)
+        self.max_error = np.asarray(max_error, dtype=float)
+        self.targetname = targetname
+
+    def __repr__(self):
+        return ('<ChebyshevVectors "{}": JD {} to {}, {} segments of degree '
+                '{}, max error {:.3g} AU>'.format(
+                    self.targetname, self.breakpoints[0],
+                    self.breakpoints[-1], len(self.coefficients),
+                    self.degree, self.max_error.max()))
+
+    @property
+    def degree(self):
+        """Degree of the Chebyshev polynomials."""
+        return self.coefficients.shape[1] - 1
+
+    def __call__(self, epochs):
+        """
+        Evaluate the state vectors.
+
+        Parameters
+        ----------
+        epochs : scalar, list-like, or `~astropy.time.Time`
+            Epochs in JD (TDB) or as `~astropy.time.Time`.  They have to lie
+            between the first and last breakpoints.
+
+        Returns
+        -------
+        table : `~astropy.table.Table`
+            Columns ``datetime_jd``, ``x``, ``y``, ``z``, ``vx``, ``vy``,
+            ``vz``.
+        """
+        if isinstance(epochs, Time):
+            epochs = epochs.tdb.jd
+        jd = np.atleast_1d(np.asarray(epochs, dtype=float))
+        if jd.size and (jd.min() < self.breakpoints[0]
+                        or jd.max() > self.breakpoints[-1]):
+            raise ValueError('epochs have to be between JD {} and {}'.format(
+                self.breakpoints[0], self.breakpoints[-1]))
+
+        segment = np.searchsorted(self.breakpoints, jd, side='right') - 1
+        segment = np.clip(segment, 0, len(self.coefficients) - 1)
+        # evaluate the epochs of each segment together
+        order = np.argsort(segment, kind='stable')
+        segments, first = np.unique(segment[order], return_index=True)
+        values = np.empty((len(jd), len(VECTOR_COLUMNS)))
+        for seg, indices in zip(segments, np.split(order, first[1:])):
+            start, stop = self.breakpoints[seg:seg + 2]
+            t = (2 * jd[indices] - start - stop) / (stop - start)
+            values[indices] = chebyshev.chebval(t, self.coefficients[seg]).T
+
+        table = Table()
+        table['datetime_jd'] = jd
+        table['datetime_jd'].unit = 'd'
+        for ii, (name, unit) in enumerate(zip(VECTOR_COLUMNS, VECTOR_UNITS)):
+            table[name] = values[:, ii]
+            table[name].unit = unit
+        return table
+
+
+def fit_segment(jd, vectors, start, stop, degree):
+    """
+    Fit Chebyshev polynomials to the state vectors sampled within a segment.
+
+    The polynomials are first fit to every other sample and compared to the
+    remaining samples to estimate the error, then fit to all samples.
+
+    Parameters
+    ----------
+    jd : `~numpy.ndarray`
+        Increasing epochs of the samples, shape ``(m,)``.
+    vectors : `~numpy.ndarray`
+        State vectors at the epochs, shape ``(m, 6)``.
+    start, stop : float
+        Bounds of the segment.
+    degree : int
+        Degree of the polynomials.
+
+    Returns
+    -------
+    coefficients : `~numpy.ndarray`
+        Shape ``(degree + 1, 6)``.
+    error : float
+        Largest deviation of the positions left out of the first fit.
+    """
+    t = (2 * jd - start - stop) / (stop - start)
+    trial = chebyshev.chebfit(t[::2], vectors[::2], degree)
+    residuals = chebyshev.chebval(t[1::2], trial).T - vectors[1::2]
+    error = np.sqrt((residuals[:, :3] ** 2).sum(axis=1)).max()
+    return chebyshev.chebfit(t, vectors, degree), error
@@ -4,7 +4,10 @@ import pytest
 import os
 from collections import OrderedDict
 
+import numpy as np
+import requests
 from numpy.ma import is_masked
+from astropy.table import Table
 from astropy.tests.helper import assert_quantity_allclose
 from astropy.utils.exceptions import AstropyDeprecationWarning
 
@@ -279,6 +282,73 @@ def test_no_H(patch_request):
     assert 'H' not in res
 
 
+def test_parse_result_cut_off():
+    """'Cut-off' lines in the data block are skipped"""
+    with open(data_path(DATA_FILES['ephemerides-range']), 'rb') as f:
+        content = f.read().replace(
+            b'$$SOE\n', b'$$SOE\n Cut-off interval requested\n')
+    q = jplhorizons.Horizons(id='Ceres')
+    q.query_type = 'ephemerides'
+    res = q._parse_result(MockResponse(content=content))
+
+    assert len(res) == 4
+    assert res.colnames[:3] == ['targetname', 'datetime_str', 'datetime_jd']
+    assert all(res['targetname'] == "1 Ceres (A801 AA)")
+
+
+def test_parse_result_ambiguous():
+    content = b"""API VERSION: 1.1
+*******************************************************************************
+ Multiple major-bodies match string "Jup*"
+
+  ID#      Name                               Designation  IAU/aliases/other
+  -------  ---------------------------------- -----------  -------------------
+        5  Jupiter Barycenter
+      599  Jupiter
+
+   Number of matches =  2. Use ID# to make unique selection.
+*******************************************************************************
+"""
+    q = jplhorizons.Horizons(id='Jup*')
+    q.query_type = 'ephemerides'
+    with pytest.raises(ValueError, match='Ambiguous target name') as excinfo:
+        q._parse_result(MockResponse(content=content))
+    assert '599  Jupiter' in str(excinfo.value)
+
+
+def test_query_batch(patch_request):
+    res = jplhorizons.Horizons(location='500', epochs=2451544.5).query_batch(
+        ['Ceres', '1935 UZ'])
+
+    assert list(res['target_id']) == ['Ceres', '1935 UZ']
+    assert res['targetname'][0] == "1 Ceres (A801 AA)"
+    assert res.colnames[0] == 'target_id'
+
+
+def test_query_batch_split_epochs(patch_request):
+    params = []
+
+    def request(self, request_type, url, **kwargs):
+        params.append(kwargs['params'])
+        return nonremote_request(self, request_type, url, **kwargs)
+
+    patch_request.setattr(jplhorizons.core.HorizonsClass, '_request', request)
+
+    epochs = [2451544.5 + 0.001 * ii for ii in range(500)]
+    res = jplhorizons.Horizons(id='Ceres', location='500',
+                               epochs=epochs).query_batch(
+        'Ceres', query_type='vectors', max_workers=3)
+
+    assert len(params) == len(res) > 1
+    assert res['target_id'][0] == 'Ceres'
+    tlist = sorted((p['TLIST'] for p in params), key=lambda t: float(t.split()[0]))
+    assert '\n'.join(tlist).split('\n') == [str(epoch) for epoch in epochs]
+    for p in params:
+        uri = requests.Request('GET', jplhorizons.conf.horizons_server,
+                               params=p).prepare().url
+        assert len(uri) < jplhorizons.HorizonsClass.MAX_URI_LENGTH
+
+
 def test_id_type_deprecation():
     """Test deprecation warnings based on issue 1742.
 
@@ -291,3 +361,50 @@ def test_id_type_deprecation():
 
     with pytest.warns(AstropyDeprecationWarning):
         jplhorizons.Horizons(id='Ceres', id_type='majorbody')
+
+
+def test_vectors_interpolator(monkeypatch, tmp_path):
+    # circular orbit with a period of 20 days
+    omega = 2 * np.pi / 20
+    queries = []
+
+    def vectors(self, cache=True, **kwargs):
+        queries.append(self.epochs)
+        start = float(self.epochs['start'].split()[1])
+        stop = float(self.epochs['stop'].split()[1])
+        jd = np.linspace(start, stop, int(self.epochs['step']) + 1)
+        return Table({'targetname': ['circle'] * len(jd),
+                      'datetime_jd': jd,
+                      'x': np.cos(omega * jd), 'y': np.sin(omega * jd),
+                      'z': np.zeros_like(jd),
+                      'vx': -omega * np.sin(omega * jd),
+                      'vy': omega * np.cos(omega * jd),
+                      'vz': np.zeros_like(jd)})
+
+    monkeypatch.setattr(jplhorizons.HorizonsClass, 'vectors', vectors)
+
+    obj = jplhorizons.Horizons(id='circle', location='500@10')
+    obj.cache_location = tmp_path
+    interpolator = obj.vectors_interpolator(2451544.5, 2451644.5,
+                                            segment_length=50)
+
+    # the initial segments are too long for the tolerance
+    assert len(queries) > 1
+    assert len(interpolator.coefficients) > 2
+    assert interpolator.max_error.max() < 1e-9
+
+    jd = np.linspace(2451544.5, 2451644.5, 100001)
+    tab = interpolator(jd)
+    assert np.abs(tab['x'] - np.cos(omega * jd)).max() < 1e-9
+    assert np.abs(tab['vy'] - omega * np.cos(omega * jd)).max() < 1e-9
+    assert tab['vy'].unit == 'AU/d'
+
+    with pytest.raises(ValueError):
+        interpolator([2451544.0])
+
+    # the fit is cached
+    queries.clear()
+    cached = obj.vectors_interpolator(2451544.5, 2451644.5,
+                                      segment_length=50)
+    assert not queries
+    assert np.all(cached.coefficients == interpolator.coefficients)
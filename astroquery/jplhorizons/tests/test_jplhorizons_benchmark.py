@@ -0,0 +1,34 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+
+import pytest
+
+from astroquery.utils.mocks import MockResponse
+from ... import jplhorizons
+from .test_jplhorizons import data_path
+
+pytestmark = pytest.mark.benchmark
+
+# epochs of the benchmarked responses, made of repeated epochs of recorded
+# responses
+N_EPOCHS = 100000
+
+
+def recorded_response(filename):
+    with open(data_path(filename), 'rb') as f:
+        content = f.read()
+    start = content.index(b'$$SOE\n') + len(b'$$SOE\n')
+    end = content.index(b'$$EOE')
+    lines = content[start:end].splitlines(keepends=True)
+    lines = (lines * (N_EPOCHS // len(lines) + 1))[:N_EPOCHS]
+    return MockResponse(content=content[:start] + b''.join(lines) + content[end:])
+
+
+@pytest.mark.parametrize('query_type', ['ephemerides', 'elements', 'vectors'])
+def test_parse_result(measure, query_type):
+    response = recorded_response(f'ceres_{query_type}_range.txt')
+    horizons = jplhorizons.Horizons(id='Ceres')
+    horizons.query_type = query_type
+
+    table = measure(horizons._parse_result, response)
+
+    assert len(table) == N_EPOCHS
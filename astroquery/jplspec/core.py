@@ -104,7 +104,10 @@ class JPLSpecClass(BaseQuery):
 
         if molecule is not None:
             if parse_name_locally:
-                self.lookup_ids = build_lookup()
+                # building the lookup table is expensive and the species
+                # table does not change at runtime: do it once, lazily
+                if not hasattr(self, 'lookup_ids'):
+                    self.lookup_ids = build_lookup()
                 payload['Mol'] = tuple(self.lookup_ids.find(molecule, flags).values())
                 if len(molecule) == 0:
                     raise InvalidQueryError('No matching species found. Please '
@@ -1,8 +1,8 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
-import re
+from ..utils.lookup_table import IndexedLookuptable
 
 
-class Lookuptable(dict):
+class Lookuptable(IndexedLookuptable):
 
     def find(self, s, flags):
         """
@@ -26,13 +26,4 @@ class Lookuptable(dict):
 
         """
 
-        R = re.compile(s, flags)
-
-        out = {}
-
-        for k, v in self.items():
-            match = R.search(str(k))
-            if match:
-                out[k] = v
-
-        return out
+        return {k: self[k] for k in self._search_keys(s, flags)}
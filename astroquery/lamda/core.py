@@ -1,11 +1,14 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import os
+import hashlib
 import json
+import pickle
 import platform
 import re
 import warnings
 from urllib import parse as urlparse
 
+import numpy as np
 from astropy import table
 from astroquery import log
 from astropy.utils.console import ProgressBar
@@ -44,6 +47,8 @@ class LamdaClass(BaseQuery):
         super().__init__(**kwargs)
         self.moldict_path = os.path.join(self.cache_location,
                                          "molecules.json")
+        # parsed tables, keyed by the hash of the molecular datafile
+        self._parsed_tables = {}
 
     def _get_molfile(self, mol, *, cache=True, timeout=None):
         """
@@ -98,14 +103,47 @@ class LamdaClass(BaseQuery):
                  2     3     1 ...     1.8e-11     1.9e-11
         """
         # Send HTTP request to open URL
-        datafile = [s.strip() for s in
-                    self._get_molfile(mol, timeout=timeout,
-                                      cache=cache).text.splitlines()]
+        text = self._get_molfile(mol, timeout=timeout, cache=cache).text
         if return_datafile:
-            return datafile
+            return [s.strip() for s in text.splitlines()]
         # Parse datafile string list and return a table
-        tables = parse_lamda_lines(datafile)
-        return tables
+        return self._parse_molfile(text, cache=cache)
+
+    def _parse_molfile(self, text, *, cache=True):
+        """
+        Parse the text of a molecular datafile, reusing the tables parsed
+        from an identical datafile in this session or, if ``cache`` is set,
+        stored in the cache directory. Copies of the tables are returned so
+        that the cached ones cannot be modified.
+        """
+        key = hashlib.sha224(text.encode()).hexdigest()
+        parsed_file = self.cache_location.joinpath("parsed_{0}.pickle".format(key))
+
+        tables = self._parsed_tables.get(key) if cache else None
+        if tables is None and cache and parsed_file.is_file():
+            try:
+                with open(parsed_file, 'rb') as f:
+                    tables = pickle.load(f)
+            except Exception as ex:
+                log.warning("Could not read the parsed LAMDA datafile {0}: "
+                            "{1}".format(parsed_file, ex))
+        if tables is None:
+            tables = parse_lamda_lines(text.splitlines())
+            if cache:
+                with open(parsed_file, 'wb') as f:
+                    pickle.dump(tables, f, protocol=4)
+        if cache:
+            self._parsed_tables[key] = tables
+
+        collrates, radtransitions, enlevels = tables
+        return ({collname: coll_table.copy()
+                 for collname, coll_table in collrates.items()},
+                radtransitions.copy(), enlevels.copy())
+
+    def clear_cache(self):
+        """Removes all cache files, including the parsed datafiles."""
+        super().clear_cache()
+        self._parsed_tables.clear()
 
     def get_molecules(self, *, cache=True):
         """
@@ -275,112 +313,89 @@ def parse_lamda_lines(data):
     """
     Extract a LAMDA datafile into a dictionary of tables
 
-    (non-pythonic!  more like, fortranic)
+    The header values are read one at a time, while the energy level,
+    radiative transition and collision rate blocks are each sliced out of
+    the datafile and converted to arrays in one go.
     """
+    lines = [line for line in map(_cln, data) if line]
+    pos = 0
+
+    def next_line():
+        nonlocal pos
+        pos += 1
+        return lines[pos - 1]
+
+    def next_block(nrows):
+        nonlocal pos
+        pos += nrows
+        block = lines[pos - nrows:pos]
+        if len(block) < nrows:
+            raise ValueError("Unexpected end of the LAMDA datafile.")
+        return block
 
-    meta_rad = {}
     meta_mol = {}
-    meta_coll = {}
-    levels = []
-    radtrans = []
-    collider = None
-    ncolltrans = None
-    for ii, line in enumerate(data):
-        if line[0] == '!':
-            continue
-        if 'molecule' not in meta_mol:
-            meta_mol['molecule'] = _cln(line)
-            continue
-        if 'molwt' not in meta_mol:
-            meta_mol['molwt'] = float(_cln(line))
-            continue
-        if 'nenergylevels' not in meta_mol:
-            meta_mol['nenergylevels'] = int(_cln(line))
-            continue
-        if len(levels) < meta_mol['nenergylevels']:
-            lev, en, wt = _cln(line).split()[:3]
-            jul = " ".join(_cln(line).split()[3:])
-            levels.append([int(lev), float(en), int(float(wt)), jul])
-            continue
-        if 'radtrans' not in meta_rad:
-            meta_rad['radtrans'] = int(_cln(line))
-            continue
-        if len(radtrans) < meta_rad['radtrans']:
-            # Can have wavenumber at the end.  Ignore that.
-            trans, up, low, aval, freq, eu = _cln(line).split()[:6]
-            radtrans.append([int(trans), int(up), int(low), float(aval),
-                             float(freq), float(eu)])
-            continue
-        if 'ncoll' not in meta_coll:
-            meta_coll['ncoll'] = int(_cln(line))
-            collrates = {}
-            continue
-        if collider is None:
-            collider = int(line[0])
-            collname = collider_ids[collider]
-            collrates[collider] = []
-            meta_coll[collname] = {'collider': collname,
-                                   'collider_id': collider}
-            continue
-        if ncolltrans is None:
-            ncolltrans = int(_cln(line))
-            meta_coll[collname]['ntrans'] = ncolltrans
-            continue
-        if 'ntemp' not in meta_coll[collname]:
-            meta_coll[collname]['ntemp'] = int(_cln(line))
-            continue
-        if 'temperatures' not in meta_coll[collname]:
-            meta_coll[collname]['temperatures'] = [int(float(x)) for x in
-                                                   _cln(line).split()]
-            continue
-        if len(collrates[collider]) < meta_coll[collname]['ntrans']:
-            trans, up, low = [int(x) for x in _cln(line).split()[:3]]
-            temperatures = [float(x) for x in _cln(line).split()[3:]]
-            collrates[collider].append([trans, up, low] + temperatures)
-        if len(collrates[collider]) == meta_coll[collname]['ntrans']:
-            # meta_coll[collider_ids[collider]+'_collrates'] = collrates
-            log.debug("{ii} Finished loading collider {0:d}: "
-                      "{1}".format(collider, collider_ids[collider], ii=ii))
-            collider = None
-            ncolltrans = None
-            if len(collrates) == meta_coll['ncoll']:
-                # All done!
-                break
-
-    if len(levels[0]) == 4:
-        mol_table_names = ['Level', 'Energy', 'Weight', 'J']
-    elif len(levels[0]) == 5:
-        mol_table_names = ['Level', 'Energy', 'Weight', 'J', 'F']
-    else:
+    meta_mol['molecule'] = next_line()
+    meta_mol['molwt'] = float(next_line())
+    meta_mol['nenergylevels'] = int(next_line())
+
+    levels = next_block(meta_mol['nenergylevels'])
+    levels_fields = [line.split(None, 3) for line in levels]
+    if min(len(fields) for fields in levels_fields) < 3:
         raise ValueError("Unrecognized levels structure.")
-    mol_table_columns = [table.Column(name=name, data=data)
-                         for name, data in zip(mol_table_names,
-                                               zip(*levels))]
-    mol_table = table.Table(data=mol_table_columns, meta=meta_mol)
-
-    rad_table_names = ['Transition', 'Upper', 'Lower', 'EinsteinA',
-                       'Frequency', 'E_u(K)']
-    rad_table_columns = [table.Column(name=name, data=data)
-                         for name, data in zip(rad_table_names,
-                                               zip(*radtrans))]
-    rad_table = table.Table(data=rad_table_columns, meta=meta_rad)
-
-    coll_tables = {collider_ids[collider]: None for collider in collrates}
-    for collider in collrates:
+    levels_values = _block_to_array([" ".join(fields[:3]) for fields in levels_fields], 3)
+    mol_table = table.Table([levels_values[:, 0].astype(int),
+                             levels_values[:, 1],
+                             levels_values[:, 2].astype(int),
+                             [" ".join(fields[3:]) for fields in levels_fields]],
+                            names=['Level', 'Energy', 'Weight', 'J'],
+                            meta=meta_mol, copy=False)
+
+    meta_rad = {'radtrans': int(next_line())}
+    # Can have wavenumber at the end.  Ignore that.
+    radtrans = _block_to_array(next_block(meta_rad['radtrans']), 6)
+    rad_table = table.Table([radtrans[:, 0].astype(int),
+                             radtrans[:, 1].astype(int),
+                             radtrans[:, 2].astype(int),
+                             radtrans[:, 3], radtrans[:, 4], radtrans[:, 5]],
+                            names=['Transition', 'Upper', 'Lower', 'EinsteinA',
+                                   'Frequency', 'E_u(K)'],
+                            meta=meta_rad, copy=False)
+
+    coll_tables = {}
+    ncoll = int(next_line()) if pos < len(lines) else 0
+    while len(coll_tables) < ncoll:
+        collider = int(next_line()[0])
         collname = collider_ids[collider]
+        meta_coll = {'collider': collname, 'collider_id': collider}
+        meta_coll['ntrans'] = int(next_line())
+        meta_coll['ntemp'] = int(next_line())
+        meta_coll['temperatures'] = [int(float(x)) for x in next_line().split()]
+
+        ncols = 3 + len(meta_coll['temperatures'])
+        collrates = _block_to_array(next_block(meta_coll['ntrans']), ncols)
+        log.debug("{ii} Finished loading collider {0:d}: "
+                  "{1}".format(collider, collname, ii=pos))
+
         coll_table_names = (['Transition', 'Upper', 'Lower']
                             + ['C_ij(T={0:d})'.format(tem) for tem in
-                               meta_coll[collname]["temperatures"]])
-        coll_table_columns = [table.Column(name=name, data=data)
-                              for name, data in zip(coll_table_names,
-                                                    zip(*collrates[collider]))]
-        coll_table = table.Table(data=coll_table_columns,
-                                 meta=meta_coll[collname])
-        coll_tables[collname] = coll_table
+                               meta_coll["temperatures"]])
+        coll_table_columns = ([collrates[:, ii].astype(int) for ii in range(3)]
+                              + [collrates[:, ii] for ii in range(3, ncols)])
+        coll_tables[collname] = table.Table(coll_table_columns,
+                                            names=coll_table_names,
+                                            meta=meta_coll, copy=False)
 
     return coll_tables, rad_table, mol_table
 
 
+def _block_to_array(block, ncols):
+    """
+    Convert the leading ``ncols`` numeric columns of a block of datafile
+    lines into a 2D float array
+    """
+    return np.loadtxt(block, usecols=range(ncols), ndmin=2, comments=None)
+
+
 def _cln(s):
     """
     Clean a string of comments, newlines
@@ -38,3 +38,63 @@ def test_writer():
     for k in coll:
         np.testing.assert_almost_equal(coll[k]['C_ij(T=5)'],
                                        coll2[k]['C_ij(T=5)'])
+
+
+def test_parser_stripped_lines():
+    with open(data_path('co.txt')) as f:
+        lines = [line.strip() for line in f]
+    collrates, radtransitions, enlevels = core.parse_lamda_lines(lines)
+
+    assert enlevels.meta == {'molecule': 'CO', 'molwt': 28.0,
+                             'nenergylevels': 41}
+    assert enlevels['Level'].dtype.kind == 'i'
+    assert enlevels['J'][1] == '1'
+    assert radtransitions['Upper'][0] == 2
+    np.testing.assert_almost_equal(radtransitions['Frequency'][0], 115.2712018)
+    assert collrates['PH2'].meta['temperatures'][:3] == [2, 5, 10]
+    assert len(collrates['PH2'].colnames) == 3 + collrates['PH2'].meta['ntemp']
+    np.testing.assert_almost_equal(collrates['PH2']['C_ij(T=2)'][0], 2.954e-11)
+
+
+class MockMolfile:
+    def __init__(self, text):
+        self.text = text
+
+
+def test_query_parsed_cache(monkeypatch, tmp_path):
+    with open(data_path('co.txt')) as f:
+        text = f.read()
+
+    lamda = core.LamdaClass()
+    lamda.cache_location = tmp_path
+    monkeypatch.setattr(lamda, '_get_molfile',
+                        lambda mol, cache=True, timeout=None: MockMolfile(text))
+    calls = []
+    parse_lamda_lines = core.parse_lamda_lines
+    monkeypatch.setattr(core, 'parse_lamda_lines',
+                        lambda data: calls.append(data) or parse_lamda_lines(data))
+
+    collrates, radtransitions, enlevels = lamda.query('co')
+    enlevels['Energy'][:] = 0
+    assert len(calls) == 1
+    assert len(list(tmp_path.glob('parsed_*.pickle'))) == 1
+
+    # parsed tables are reused in the session, and copies are returned
+    collrates, radtransitions, enlevels = lamda.query('co')
+    assert len(calls) == 1
+    assert enlevels['Energy'][1] == 3.845033413
+
+    # a new instance reads the parsed tables from the cache directory
+    lamda2 = core.LamdaClass()
+    lamda2.cache_location = tmp_path
+    monkeypatch.setattr(lamda2, '_get_molfile', lamda._get_molfile)
+    assert len(lamda2.query('co')[0]['OH2']) == len(collrates['OH2'])
+    assert len(calls) == 1
+
+    lamda2.query('co', cache=False)
+    assert len(calls) == 2
+
+    lamda.clear_cache()
+    assert not list(tmp_path.glob('parsed_*.pickle'))
+    lamda.query('co')
+    assert len(calls) == 3
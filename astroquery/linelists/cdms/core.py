@@ -7,6 +7,7 @@ import astropy.units as u
 from astropy.io import ascii
 from astroquery.query import BaseQuery
 from astroquery.utils import async_to_sync
+from astroquery.utils.lookup_table import IndexedLookuptable
 # import configurable items declared in __init__.py
 from astroquery.linelists.cdms import conf
 from astroquery.exceptions import InvalidQueryError, EmptyResponseError
@@ -131,7 +132,10 @@ class CDMSClass(BaseQuery):
 
         if molecule is not None:
             if parse_name_locally:
-                self.lookup_ids = build_lookup()
+                # building the lookup table is expensive and the species
+                # table does not change at runtime: do it once, lazily
+                if not hasattr(self, 'lookup_ids'):
+                    self.lookup_ids = build_lookup()
                 luts = self.lookup_ids.find(molecule, flags)
                 if len(luts) == 0:
                     raise InvalidQueryError('No matching species found. Please '
@@ -351,7 +355,7 @@ def parse_letternumber(st):
     return int(newst)
 
 
-class Lookuptable(dict):
+class Lookuptable(IndexedLookuptable):
 
     def find(self, st, flags):
         """
@@ -375,16 +379,12 @@ class Lookuptable(dict):
 
         """
 
-        out = {}
+        # note that the string-match attempt here differs from the jplspec
+        # implementation
+        positions = (self._search_positions(re.escape(st))
+                     | self._search_positions(st, flags))
 
-        for kk, vv in self.items():
-            # note that the string-match attempt here differs from the jplspec
-            # implementation
-            match = (st in kk) or re.search(st, str(kk), flags=flags)
-            if match:
-                out[kk] = vv
-
-        return out
+        return {kk: self[kk] for kk in self._positions_to_keys(positions)}
 
 
 def build_lookup():
@@ -78,7 +78,7 @@ class NvasClass(BaseQuery):
         if get_query_payload:
             return readable_objs
 
-        filelist = [obj.get_fits() for obj in readable_objs]
+        filelist = commons.get_fits_files(readable_objs, show_progress=show_progress)
 
         return filelist
 
@@ -16,10 +16,23 @@ class Conf(_config.ConfigNamespace):
     sas_baseurl = _config.ConfigItem(
         'https://data.sdss.org/sas',
         'Base URL for downloading data products like spectra and images.')
+    sas_mirror = _config.ConfigItem(
+        '',
+        'Root directory of a local copy of the SAS file tree. Spectra and '
+        'images found there are read from disk instead of downloaded.')
     timeout = _config.ConfigItem(
         60,
         'Time limit for connecting to SDSS server.')
     default_release = _config.ConfigItem(17, 'Default SDSS data release.')
+    crossid_chunk_size = _config.ConfigItem(
+        1000,
+        'Maximum number of coordinates uploaded in a single cross-ID request.')
+    max_concurrent_queries = _config.ConfigItem(
+        2,
+        'Maximum number of cross-ID requests sent concurrently.')
+    max_concurrent_downloads = _config.ConfigItem(
+        4,
+        'Maximum number of spectra or images downloaded concurrently.')
 
 
 conf = Conf()
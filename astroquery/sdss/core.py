@@ -2,13 +2,17 @@
 """
 Access Sloan Digital Sky Survey database online.
 """
+import os
 import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 import numpy as np
 import sys
 
 from astropy import units as u
 from astropy.coordinates import Angle
-from astropy.table import Table, Column
+from astropy.table import Table, Column, vstack
+from astropy.utils.console import ProgressBar
 from astropy.utils.exceptions import AstropyWarning
 
 from ..query import BaseQuery
@@ -29,6 +33,9 @@ sdss_arcsec_per_pixel = 0.396 * u.arcsec / u.pixel
 class SDSSClass(BaseQuery):
     TIMEOUT = conf.timeout
     MAX_CROSSID_RADIUS = 3.0 * u.arcmin
+    CROSSID_CHUNK_SIZE = conf.crossid_chunk_size
+    MAX_CONCURRENT_QUERIES = conf.max_concurrent_queries
+    MAX_CONCURRENT_DOWNLOADS = conf.max_concurrent_downloads
     QUERY_URL_SUFFIX_DR_OLD = '/dr{dr}/en/tools/search/x_sql.asp'
     QUERY_URL_SUFFIX_DR_10 = '/dr{dr}/en/tools/search/x_sql.aspx'
     QUERY_URL_SUFFIX_DR_NEW = '/dr{dr}/en/tools/search/x_results.aspx'
@@ -152,25 +159,8 @@ class SDSSClass(BaseQuery):
         if radius > self.MAX_CROSSID_RADIUS.value:
             raise ValueError(f"radius must be less than {self.MAX_CROSSID_RADIUS}.")
 
-        if (not isinstance(coordinates, list) and not isinstance(coordinates, Column)
-                and not (isinstance(coordinates, commons.CoordClasses) and not coordinates.isscalar)):
-            coordinates = [coordinates]
-        if obj_names is None:
-            obj_names = [f'obj_{i:d}' for i in range(len(coordinates))]
-        elif len(obj_names) != len(coordinates):
-            raise ValueError("Number of coordinates and obj_names should "
-                             "be equal")
-        if region:
-            data = "ra dec \n"
-            data_format = '{ra} {dec}'
-        else:
-            # SDSS's own examples default to 'name'.  'obj_id' is too easy to confuse with 'objID'
-            data = "name ra dec \n"
-            data_format = '{obj} {ra} {dec}'
-        data += " \n ".join([data_format.format(obj=obj_names[i],
-                                                ra=coordinates[i].ra.deg,
-                                                dec=coordinates[i].dec.deg)
-                             for i in range(len(coordinates))])
+        coordinates, obj_names = self._crossid_targets(coordinates, obj_names)
+        data = self._crossid_upload(coordinates, obj_names, region=region)
 
         # firstcol is hardwired, as obj_names is always passed
         files = {'upload': ('astroquery', data)}
@@ -203,6 +193,86 @@ class SDSSClass(BaseQuery):
                                  timeout=timeout, cache=cache)
         return response
 
+    @prepend_docstr_nosections(query_crossid_async.__doc__)
+    def query_crossid(self, coordinates, *, radius=5. * u.arcsec, timeout=TIMEOUT,
+                      fields=None, photoobj_fields=None, specobj_fields=None, obj_names=None,
+                      spectro=False, region=False, field_help=False, get_query_payload=False,
+                      data_release=conf.default_release, cache=True):
+        """
+        Lists of more than ``CROSSID_CHUNK_SIZE`` coordinates are split into
+        chunks that are uploaded separately, at most
+        ``MAX_CONCURRENT_QUERIES`` at a time. The results are stacked in the
+        order of the coordinates.
+
+        Returns
+        -------
+        result : `~astropy.table.Table`
+            The result of the query as a `~astropy.table.Table` object.
+
+        """
+        kwargs = dict(radius=radius, timeout=timeout, fields=fields,
+                      photoobj_fields=photoobj_fields, specobj_fields=specobj_fields,
+                      spectro=spectro, region=region, field_help=field_help,
+                      get_query_payload=get_query_payload, data_release=data_release,
+                      cache=cache)
+
+        coordinates, obj_names = self._crossid_targets(coordinates, obj_names)
+        if field_help or get_query_payload or len(coordinates) <= self.CROSSID_CHUNK_SIZE:
+            response = self.query_crossid_async(coordinates, obj_names=obj_names, **kwargs)
+            if field_help or get_query_payload:
+                return response
+            return self._parse_result(response)
+
+        def query_chunk(start):
+            stop = start + self.CROSSID_CHUNK_SIZE
+            response = self.query_crossid_async(coordinates[start:stop],
+                                                obj_names=obj_names[start:stop], **kwargs)
+            return self._parse_result(response)
+
+        with ThreadPoolExecutor(max(1, self.MAX_CONCURRENT_QUERIES)) as executor:
+            results = list(executor.map(query_chunk,
+                                        range(0, len(coordinates), self.CROSSID_CHUNK_SIZE)))
+
+        results = [result for result in results if result is not None]
+        if not results:
+            return None
+        return vstack(results, metadata_conflicts='silent')
+
+    def _crossid_targets(self, coordinates, obj_names):
+        """
+        Return the cross-ID coordinates as a sequence and the array of
+        object names, generating unique names if none are given.
+        """
+        if (not isinstance(coordinates, list) and not isinstance(coordinates, Column)
+                and not (isinstance(coordinates, commons.CoordClasses) and not coordinates.isscalar)):
+            coordinates = [coordinates]
+        if obj_names is None:
+            obj_names = np.char.add('obj_', np.arange(len(coordinates)).astype(str))
+        elif len(obj_names) != len(coordinates):
+            raise ValueError("Number of coordinates and obj_names should "
+                             "be equal")
+        return coordinates, np.asarray(obj_names).astype(str)
+
+    def _crossid_upload(self, coordinates, obj_names, *, region=False):
+        """
+        Format the cross-ID upload from the whole arrays of coordinates
+        and object names at once.
+        """
+        if isinstance(coordinates, commons.CoordClasses):
+            ra, dec = coordinates.ra.deg, coordinates.dec.deg
+        else:
+            ra = np.array([coordinate.ra.deg for coordinate in coordinates])
+            dec = np.array([coordinate.dec.deg for coordinate in coordinates])
+
+        lines = np.char.add(np.char.add(ra.astype(str), ' '), dec.astype(str))
+        if region:
+            data = "ra dec \n"
+        else:
+            # SDSS's own examples default to 'name'.  'obj_id' is too easy to confuse with 'objID'
+            data = "name ra dec \n"
+            lines = np.char.add(np.char.add(obj_names, ' '), lines)
+        return data + " \n ".join(lines.tolist())
+
     def query_region_async(self, coordinates, *, radius=None,
                            width=None, height=None, timeout=TIMEOUT,
                            fields=None, photoobj_fields=None, specobj_fields=None, obj_names=None,
@@ -720,24 +790,8 @@ class SDSSClass(BaseQuery):
             raise TypeError("'matches' must be an astropy Table.")
 
         results = []
-        for row in matches:
-            linkstr = self.SPECTRA_URL_SUFFIX
-            # _parse_result returns bytes (requiring a decode) for
-            # - instruments
-            # - run2d sometimes (#739)
-            if isinstance(row['run2d'], bytes):
-                run2d = row['run2d'].decode()
-            elif isinstance(row['run2d'], (np.integer, int)):
-                run2d = str(row['run2d'])
-            else:
-                run2d = row['run2d']
-            if data_release > 15 and run2d not in ('26', '103', '104'):
-                linkstr = linkstr.replace('/spectra/', '/spectra/full/')
-            link = linkstr.format(
-                base=conf.sas_baseurl, dr=data_release,
-                run2d=run2d, plate=row['plate'],
-                fiber=row['fiberID'], mjd=row['mjd'])
-            results.append(commons.FileContainer(link,
+        for path in self._get_spectra_paths(matches, data_release):
+            results.append(commons.FileContainer(self._get_sas_target(path),
                                                  encoding='binary',
                                                  remote_timeout=timeout,
                                                  show_progress=show_progress))
@@ -773,7 +827,9 @@ class SDSSClass(BaseQuery):
             if isinstance(readable_objs, dict):
                 return readable_objs
             else:
-                return [obj.get_fits() for obj in readable_objs]
+                return commons.get_fits_files(readable_objs,
+                                              max_workers=self.MAX_CONCURRENT_DOWNLOADS,
+                                              show_progress=show_progress)
 
     def get_images_async(self, coordinates=None, radius=2. * u.arcsec,
                          matches=None, run=None, rerun=301, camcol=None,
@@ -889,21 +945,11 @@ class SDSSClass(BaseQuery):
             raise ValueError("'matches' must be an astropy Table")
 
         results = []
-        for row in matches:
-            for b in band:
-                # Download and read in image data
-                linkstr = self.IMAGING_URL_SUFFIX
-                instrument = 'boss'
-                if data_release > 12:
-                    instrument = 'eboss'
-                link = linkstr.format(base=conf.sas_baseurl, run=row['run'],
-                                      dr=data_release, instrument=instrument,
-                                      rerun=row['rerun'], camcol=row['camcol'],
-                                      field=row['field'], band=b)
-
-                results.append(commons.FileContainer(
-                    link, encoding='binary', remote_timeout=timeout,
-                    cache=cache, show_progress=show_progress))
+        for path in self._get_image_paths(matches, band, data_release):
+            # Download and read in image data
+            results.append(commons.FileContainer(
+                self._get_sas_target(path), encoding='binary',
+                remote_timeout=timeout, cache=cache, show_progress=show_progress))
 
         return results
 
@@ -941,7 +987,137 @@ class SDSSClass(BaseQuery):
             if isinstance(readable_objs, dict):
                 return readable_objs
             else:
-                return [obj.get_fits() for obj in readable_objs]
+                return commons.get_fits_files(readable_objs,
+                                              max_workers=self.MAX_CONCURRENT_DOWNLOADS,
+                                              show_progress=show_progress)
+
+    def download_products(self, matches, *, product='spectra', band='g', savedir=None,
+                          timeout=TIMEOUT, data_release=conf.default_release,
+                          show_progress=True):
+        """
+        Download the spectra or images of the objects in ``matches`` into a
+        local directory tree with the same layout as the SDSS Science Archive
+        Server (SAS).
+
+        At most ``MAX_CONCURRENT_DOWNLOADS`` files are downloaded at a time.
+        Files already present with the size of the remote file are not
+        downloaded again, and files found in the local SAS mirror set by
+        ``conf.sas_mirror`` are not downloaded at all: their paths in the
+        mirror are returned. The mirror is only read from, never written to.
+
+        Parameters
+        ----------
+        matches : `~astropy.table.Table`
+            Result of `query_region` or `query_crossid`, with the columns
+            needed by `get_spectra` or `get_images`.
+        product : str, optional
+            ``'spectra'`` or ``'images'``. Defaults to ``'spectra'``.
+        band : str or list, optional
+            Could be individual band, or list of bands, used for images.
+            Options: ``'u'``, ``'g'``, ``'r'``, ``'i'``, or ``'z'``.
+        savedir : str, optional
+            Root of the local SAS tree the files are downloaded into.
+            Defaults to the ``sas`` directory of the astroquery cache.
+        timeout : float, optional
+            Time limit (in seconds) for establishing successful connection with
+            remote server.  Defaults to `SDSSClass.TIMEOUT`.
+        data_release : int, optional
+            The data release of the SDSS to use.
+        show_progress : bool, optional
+            If False, do not display the number of files downloaded.
+
+        Returns
+        -------
+        list : List of the local paths of the files, in the order of
+            ``matches`` (and of ``band`` for images).
+
+        """
+        if not isinstance(matches, Table):
+            raise TypeError("'matches' must be an astropy Table.")
+        if product == 'spectra':
+            paths = self._get_spectra_paths(matches, data_release)
+        elif product == 'images':
+            paths = self._get_image_paths(matches, band, data_release)
+        else:
+            raise ValueError("product must be 'spectra' or 'images'.")
+
+        if savedir is None:
+            savedir = os.path.join(self.cache_location, 'sas')
+
+        def download(path):
+            target = self._get_sas_target(path)
+            if os.path.isfile(target):
+                return target
+            local_filepath = os.path.join(savedir, *path.split('/'))
+            os.makedirs(os.path.dirname(local_filepath), exist_ok=True)
+            self._download_file(target, local_filepath, timeout=timeout,
+                                continuation=False, cache=True)
+            return local_filepath
+
+        # several matches can share an image, which is only downloaded once
+        with ThreadPoolExecutor(max(1, self.MAX_CONCURRENT_DOWNLOADS)) as executor:
+            futures = {path: executor.submit(download, path) for path in dict.fromkeys(paths)}
+            progress = ProgressBar(len(futures)) if show_progress else nullcontext()
+            with progress as bar:
+                for future in as_completed(futures.values()):
+                    future.result()
+                    if bar is not None:
+                        bar.update()
+
+        return [futures[path].result() for path in paths]
+
+    def _get_spectra_paths(self, matches, data_release):
+        """
+        Return the paths of the spectra of ``matches``, relative to the root
+        of the SAS.
+        """
+        paths = []
+        for row in matches:
+            linkstr = self.SPECTRA_URL_SUFFIX
+            # _parse_result returns bytes (requiring a decode) for
+            # - instruments
+            # - run2d sometimes (#739)
+            if isinstance(row['run2d'], bytes):
+                run2d = row['run2d'].decode()
+            elif isinstance(row['run2d'], (np.integer, int)):
+                run2d = str(row['run2d'])
+            else:
+                run2d = row['run2d']
+            if data_release > 15 and run2d not in ('26', '103', '104'):
+                linkstr = linkstr.replace('/spectra/', '/spectra/full/')
+            paths.append(linkstr.format(
+                base='', dr=data_release,
+                run2d=run2d, plate=row['plate'],
+                fiber=row['fiberID'], mjd=row['mjd']).lstrip('/'))
+        return paths
+
+    def _get_image_paths(self, matches, band, data_release):
+        """
+        Return the paths of the images of ``matches`` in each of the bands,
+        relative to the root of the SAS.
+        """
+        instrument = 'boss'
+        if data_release > 12:
+            instrument = 'eboss'
+        paths = []
+        for row in matches:
+            for b in band:
+                paths.append(self.IMAGING_URL_SUFFIX.format(
+                    base='', run=row['run'], dr=data_release, instrument=instrument,
+                    rerun=row['rerun'], camcol=row['camcol'],
+                    field=row['field'], band=b).lstrip('/'))
+        return paths
+
+    def _get_sas_target(self, path):
+        """
+        Return the file of the local SAS mirror for ``path`` if it exists, or
+        its URL otherwise.
+        """
+        if conf.sas_mirror:
+            local_filepath = os.path.join(conf.sas_mirror, *path.split('/'))
+            if os.path.isfile(local_filepath):
+                return local_filepath
+        return f'{conf.sas_baseurl}/{path}'
 
     def get_spectral_template_async(self, kind='qso', *, timeout=TIMEOUT,
                                     show_progress=True):
@@ -1011,7 +1187,7 @@ class SDSSClass(BaseQuery):
             kind=kind, timeout=timeout, show_progress=show_progress)
 
         if readable_objs is not None:
-            return [obj.get_fits() for obj in readable_objs]
+            return commons.get_fits_files(readable_objs, show_progress=show_progress)
 
     def _parse_result(self, response, verbose=False):
         """
@@ -368,6 +368,76 @@ def test_images_timeout(patch_request, patch_get_readable_fileobj_slow):
         sdss.SDSS.get_images(run=1904, camcol=3, field=164)
 
 
+def test_get_spectra_sas_mirror(tmp_path):
+    matches = Table.read(data_path(DATA_FILES['spectra_id']),
+                         format='ascii.csv', comment='#')
+    path = 'dr17/sdss/spectro/redux/26/spectra/0751/spec-0751-52251-0160.fits'
+    (tmp_path / path).parent.mkdir(parents=True)
+    (tmp_path / path).write_bytes(b'')
+
+    with sdss.conf.set_temp('sas_mirror', str(tmp_path)):
+        spectra = sdss.SDSS.get_spectra_async(matches=matches, data_release=17)
+    assert spectra[0]._target == str(tmp_path / path)
+    assert all(spectrum._target.startswith('https://') for spectrum in spectra[1:])
+
+
+def test_download_products(monkeypatch, tmp_path):
+    matches = Table.read(data_path(DATA_FILES['images_id']),
+                         format='ascii.csv', comment='#')[:2]
+    downloaded = []
+
+    def download_file(url, local_filepath, **kwargs):
+        downloaded.append(url)
+        with open(local_filepath, 'wb') as f:
+            f.write(b'frame')
+
+    monkeypatch.setattr(sdss.SDSS, '_download_file', download_file)
+    mirror = tmp_path / 'mirror'
+    mirror_path = 'dr17/eboss/photoObj/frames/301/1904/3/frame-g-001904-3-0163.fits.bz2'
+    (mirror / mirror_path).parent.mkdir(parents=True)
+    (mirror / mirror_path).write_bytes(b'frame')
+
+    with sdss.conf.set_temp('sas_mirror', str(mirror)):
+        paths = sdss.SDSS.download_products(matches, product='images', band='gr',
+                                            savedir=str(tmp_path / 'sas'),
+                                            show_progress=False)
+
+    assert len(paths) == 4
+    assert paths[0] == str(mirror / mirror_path)
+    assert paths[1] == str(tmp_path / 'sas' / mirror_path.replace('frame-g', 'frame-r'))
+    # both matches are in the same frame, downloaded only once
+    assert paths[2:] == paths[:2]
+    assert len(downloaded) == 1
+    assert downloaded[0].startswith(sdss.conf.sas_baseurl + '/dr17/eboss/photoObj/')
+    assert all(os.path.isfile(path) for path in paths)
+
+    with pytest.raises(ValueError, match="product must be"):
+        sdss.SDSS.download_products(matches, product='cubes')
+
+
+def test_download_products_default_savedir(monkeypatch, tmp_path):
+    matches = Table.read(data_path(DATA_FILES['images_id']),
+                         format='ascii.csv', comment='#')[:1]
+
+    def download_file(url, local_filepath, **kwargs):
+        with open(local_filepath, 'wb') as f:
+            f.write(b'frame')
+
+    monkeypatch.setattr(sdss.SDSS, '_download_file', download_file)
+    monkeypatch.setattr(sdss.SDSSClass, 'cache_location', property(lambda self: tmp_path / 'cache'))
+    mirror = tmp_path / 'mirror'
+    mirror.mkdir()
+
+    with sdss.conf.set_temp('sas_mirror', str(mirror)):
+        paths = sdss.SDSS.download_products(matches, product='images', band='g',
+                                            show_progress=False)
+
+    # the files missing from the mirror are not written into it
+    assert paths[0].startswith(str(tmp_path / 'cache' / 'sas'))
+    assert os.path.isfile(paths[0])
+    assert not any(mirror.iterdir())
+
+
 @pytest.mark.parametrize("dr", dr_list)
 def test_query_crossid(patch_request, dr):
     xid = sdss.SDSS.query_crossid(coords_column, data_release=dr)
@@ -426,6 +496,42 @@ def test_query_crossid_explicit_angle_value(patch_request):
     assert query_payload['radius'] == 0.05
 
 
+def test_query_crossid_upload(patch_request):
+    """Test formatting the upload from an array of coordinates.
+    """
+    coords_array = SkyCoord([2.0234428, 10.5], [14.8398204, -3.25], unit='deg')
+    query_payload, files = sdss.SDSS.query_crossid(coords_array,
+                                                   obj_names=['A1', 'B2'],
+                                                   get_query_payload=True)
+    assert files['upload'][1] == "name ra dec \nA1 2.0234428 14.8398204 \n B2 10.5 -3.25"
+
+    query_payload, files = sdss.SDSS.query_crossid(coords_array, region=True,
+                                                   get_query_payload=True)
+    assert files['upload'][1] == "ra dec \n2.0234428 14.8398204 \n 10.5 -3.25"
+
+
+def test_query_crossid_chunked(patch_request):
+    """Test splitting a large cross-ID upload into chunks.
+    """
+    uploads = []
+    mockreturn = sdss.SDSS._request
+
+    def mockreturn_upload(method, url, **kwargs):
+        if 'files' in kwargs:
+            uploads.append(kwargs['files']['upload'][1])
+        return mockreturn(method, url, **kwargs)
+
+    patch_request.setattr(sdss.SDSS, '_request', mockreturn_upload)
+    patch_request.setattr(sdss.SDSS, 'CROSSID_CHUNK_SIZE', 2)
+    xid = sdss.SDSS.query_crossid(coords_list + [coords])
+
+    data = Table.read(data_path(DATA_FILES['images_id']),
+                      format='ascii.csv', comment='#')
+    assert len(xid) == 2 * len(data)
+    assert sorted(upload.count('obj_') for upload in uploads) == [1, 2]
+    assert any('obj_2' in upload for upload in uploads)
+
+
 # ===========
 # Payload tests
 
@@ -28,6 +28,31 @@ class Conf(_config.ConfigNamespace):
         0,
         'Maximum number of rows that will be fetched from the result.')
 
+    batch_size = _config.ConfigItem(
+        10000,
+        'Maximum number of queries sent in a single script; vectorized '
+        'queries with more entries are split into several scripts.')
+
+    max_concurrent_queries = _config.ConfigItem(
+        2,
+        'Maximum number of scripts sent to SIMBAD at the same time when '
+        'a vectorized query is split.')
+
+    max_requests_per_second = _config.ConfigItem(
+        5.0,
+        'Maximum rate of requests sent to each SIMBAD server. SIMBAD may '
+        'blacklist clients sending more than 6 queries per second. Set to 0 '
+        'to disable the limit.')
+
+    max_retries = _config.ConfigItem(
+        3,
+        'Number of times a request refused by SIMBAD with error 403 is retried.')
+
+    retry_backoff = _config.ConfigItem(
+        5.0,
+        'Number of seconds to wait before retrying a refused request; the '
+        'wait doubles for each subsequent retry.')
+
 
 conf = Conf()
 
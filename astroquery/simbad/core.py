@@ -7,17 +7,23 @@ import re
 import requests
 import json
 import os
+import threading
+import time
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
+from urllib.parse import urlparse
 import warnings
+import numpy as np
 import astropy.units as u
 from astropy.utils import isiterable
 from astropy.utils.data import get_pkg_data_filename
 import astropy.coordinates as coord
-from astropy.table import Table
+from astropy.table import Table, vstack
 import astropy.io.votable as votable
 
-from astroquery.query import BaseQuery
+from astroquery.query import BaseQuery, AstroQuery
+from astroquery import log, cache_conf
 from astroquery.utils import commons, async_to_sync
 from astroquery.exceptions import TableParseError, LargeQueryWarning, BlankResponseWarning
 from . import conf
@@ -226,37 +232,99 @@ class SimbadBaseQuery(BaseQuery):
     sometimes blacklist users for exceeding rate limits.  This warning results
     in a "connection refused" error (error 61) instead of a more typical "error
     8" that you would get from not having an internet connection at all.
+
+    To stay within the rate limits, requests to each host are spaced so that
+    no more than ``MAX_REQUESTS_PER_SECOND`` are sent, across all instances
+    and threads, not counting the responses read from the cache.  Requests
+    refused with error 403 are retried up to ``MAX_RETRIES`` times, waiting
+    ``RETRY_BACKOFF`` seconds before the first retry and twice as long before
+    each subsequent one.  Failed responses are never left in the cache.
     """
+    MAX_REQUESTS_PER_SECOND = conf.max_requests_per_second
+    MAX_RETRIES = conf.max_retries
+    RETRY_BACKOFF = conf.retry_backoff
 
-    def _request(self, *args, **kwargs):
-        try:
-            response = super()._request(*args, **kwargs)
-        except requests.exceptions.ConnectionError as ex:
-            if 'Errno 61' in str(ex):
-                extratext = ("\n\n"
-                             "************************* \n"
-                             "ASTROQUERY ADDED WARNING: \n"
-                             "************************* \n"
-                             "Error 61 received from SIMBAD server.  "
-                             "This may indicate that you have been "
-                             "blacklisted for exceeding the query rate limit."
-                             "  See the astroquery SIMBAD documentation.  "
-                             "Blacklists are generally cleared after ~1 hour.  "
-                             "Please reconsider your approach, you may want "
-                             "to use vectorized queries."
-                             )
-                ex.args[0].args = (ex.args[0].args[0] + extratext,)
-            raise ex
-
-        if response.status_code == 403:
-            errmsg = ("Error 403: Forbidden.  You may get this error if you "
-                      "exceed the SIMBAD server's rate limits.  Try again in "
-                      "a few seconds or minutes.")
-            raise requests.exceptions.HTTPError(errmsg)
-        else:
-            response.raise_for_status()
+    _next_request_time = {}
+    _rate_lock = threading.Lock()
 
-        return response
+    def _wait_for_request_budget(self, url):
+        if not self.MAX_REQUESTS_PER_SECOND or self.MAX_REQUESTS_PER_SECOND <= 0:
+            return
+        host = urlparse(url).netloc
+        with self._rate_lock:
+            now = time.monotonic()
+            request_time = max(now, self._next_request_time.get(host, now))
+            self._next_request_time[host] = request_time + 1 / self.MAX_REQUESTS_PER_SECOND
+        if request_time > now:
+            time.sleep(request_time - now)
+
+    def _remove_cached_response(self, method, url, params=None, data=None, headers=None,
+                                files=None, save=False, savedir='', timeout=None,
+                                json=None, **kwargs):
+        query = AstroQuery(method, url, params=params, data=data, headers=headers,
+                           files=files, timeout=timeout, json=json)
+        try:
+            query.remove_cache_file(self.cache_location)
+        except OSError:
+            # nothing was cached, e.g. because `cache` was False
+            pass
+
+    def _is_cached(self, method, url, params=None, data=None, headers=None,
+                   files=None, save=False, savedir='', timeout=None, cache=None,
+                   json=None, **kwargs):
+        # mirrors the cache lookup of `BaseQuery._request`
+        if cache is None:
+            cache = cache_conf.cache_active
+        if save or not cache or self.cache_location is None:
+            return False
+        query = AstroQuery(method, url, params=params, data=data, headers=headers,
+                           files=files, timeout=timeout, json=json)
+        try:
+            cache_time = query.request_file(self.cache_location).stat().st_mtime
+        except OSError:
+            return False
+        return (cache_conf.cache_timeout is None
+                or time.time() - cache_time <= cache_conf.cache_timeout)
+
+    def _request(self, method, url, *args, **kwargs):
+        for attempt in range(self.MAX_RETRIES + 1):
+            # responses read from the cache do not count against the rate limit
+            if not self._is_cached(method, url, *args, **kwargs):
+                self._wait_for_request_budget(url)
+            try:
+                response = super()._request(method, url, *args, **kwargs)
+            except requests.exceptions.ConnectionError as ex:
+                if 'Errno 61' in str(ex):
+                    extratext = ("\n\n"
+                                 "************************* \n"
+                                 "ASTROQUERY ADDED WARNING: \n"
+                                 "************************* \n"
+                                 "Error 61 received from SIMBAD server.  "
+                                 "This may indicate that you have been "
+                                 "blacklisted for exceeding the query rate limit."
+                                 "  See the astroquery SIMBAD documentation.  "
+                                 "Blacklists are generally cleared after ~1 hour.  "
+                                 "Please reconsider your approach, you may want "
+                                 "to use vectorized queries."
+                                 )
+                    ex.args[0].args = (ex.args[0].args[0] + extratext,)
+                raise ex
+
+            if response.status_code < 400:
+                return response
+
+            self._remove_cached_response(method, url, *args, **kwargs)
+            if response.status_code != 403:
+                response.raise_for_status()
+            if attempt < self.MAX_RETRIES:
+                delay = self.RETRY_BACKOFF * 2 ** attempt
+                log.warning("Error 403 received from SIMBAD, retrying in {0} seconds".format(delay))
+                time.sleep(delay)
+
+        errmsg = ("Error 403: Forbidden.  You may get this error if you "
+                  "exceed the SIMBAD server's rate limits.  Try again in "
+                  "a few seconds or minutes.")
+        raise requests.exceptions.HTTPError(errmsg)
 
 
 @async_to_sync
@@ -290,6 +358,8 @@ class SimbadClass(SimbadBaseQuery):
     }
 
     ROW_LIMIT = conf.row_limit
+    BATCH_SIZE = conf.batch_size
+    MAX_CONCURRENT_QUERIES = conf.max_concurrent_queries
 
     # also find a way to fetch the votable fields table from
     # <http://simbad.u-strasbg.fr/simbad/sim-help?Page=sim-fscript#VotableFields>
@@ -573,6 +643,13 @@ class SimbadClass(SimbadBaseQuery):
         results as a `~astropy.table.Table`. Object names may be specified
         with wildcards if desired.
 
+        Lists of more than ``BATCH_SIZE`` names are split into several
+        scripts, which are sent to SIMBAD at most ``MAX_CONCURRENT_QUERIES``
+        at a time. The results are stacked in the order of the input names.
+        Each part is cached separately, so if a long query fails part way
+        through, running it again only queries the parts that did not
+        complete.
+
         Parameters
         ----------
         object_names : sequence of strs
@@ -589,8 +666,16 @@ class SimbadClass(SimbadBaseQuery):
         table : `~astropy.table.Table`
             Query results table
         """
-        return self.query_object('\n'.join(object_names), wildcard=wildcard,
-                                 get_query_payload=get_query_payload)
+        response = self.query_objects_async(object_names, wildcard=wildcard,
+                                            get_query_payload=get_query_payload)
+        if get_query_payload:
+            return response
+        if isinstance(response, list):
+            payloads = self.query_objects_async(object_names, wildcard=wildcard,
+                                                get_query_payload=True)
+            return self._parse_batch_results(response, payloads, verbose=verbose)
+        return self._parse_result(response, SimbadVOTableResult,
+                                  verbose=verbose)
 
     def query_objects_async(self, object_names, *, wildcard=False, cache=True,
                             get_query_payload=False):
@@ -611,12 +696,72 @@ class SimbadClass(SimbadBaseQuery):
 
         Returns
         -------
-        response : `requests.Response`
-            Response of the query from the server
+        response : `requests.Response` or list of `requests.Response`
+            Response of the query from the server. Lists of more than
+            ``BATCH_SIZE`` names are split, and a list of the responses (or
+            payloads) of each part is returned.
+        """
+        object_names = list(object_names)
+        if not self.BATCH_SIZE or len(object_names) <= self.BATCH_SIZE:
+            return self.query_object_async('\n'.join(object_names),
+                                           wildcard=wildcard, cache=cache,
+                                           get_query_payload=get_query_payload)
+
+        payloads = [self._args_to_payload('\n'.join(object_names[i:i + self.BATCH_SIZE]),
+                                          wildcard=wildcard, caller='query_object_async')
+                    for i in range(0, len(object_names), self.BATCH_SIZE)]
+        if get_query_payload:
+            return payloads
+        return self._request_batches(payloads, cache=cache)
+
+    def query_region(self, coordinates, radius=2*u.arcmin, *,
+                     equinox=2000.0, epoch='J2000', cache=True,
+                     get_query_payload=False, verbose=False):
         """
-        return self.query_object_async('\n'.join(object_names),
-                                       wildcard=wildcard, cache=cache,
-                                       get_query_payload=get_query_payload)
+        Queries a region around the specified coordinates.
+
+        Queries with more than ``BATCH_SIZE`` coordinates are split into
+        several scripts, which are sent to SIMBAD at most
+        ``MAX_CONCURRENT_QUERIES`` at a time and then reassembled into a
+        single table.  The ``SCRIPT_NUMBER_ID`` column of the reassembled
+        table refers to the position of the coordinates in the whole input.
+
+        Parameters
+        ----------
+        coordinates : str or `astropy.coordinates` object
+            the identifier or coordinates around which to query.
+        radius : str or `~astropy.units.Quantity`
+            the radius of the region.  Defaults to 2 arcmin.
+        equinox : float, optional
+            the equinox of the coordinates. If missing set to
+            default 2000.0.
+        epoch : str, optional
+            the epoch of the input coordinates. Must be specified as
+            [J|B] <epoch>. If missing, set to default J2000.
+        get_query_payload : bool, optional
+            When set to `True` the method returns the HTTP request parameters.
+            Defaults to `False`.
+
+        Returns
+        -------
+        table : `~astropy.table.Table`
+            Query results table
+        """
+        response = self.query_region_async(coordinates, radius=radius,
+                                           equinox=equinox, epoch=epoch,
+                                           cache=cache,
+                                           get_query_payload=get_query_payload)
+        if get_query_payload:
+            return response
+        if isinstance(response, list):
+            payloads = self.query_region_async(coordinates, radius=radius,
+                                               equinox=equinox, epoch=epoch,
+                                               get_query_payload=True)
+            result = self._parse_batch_results(response, payloads, verbose=verbose)
+        else:
+            result = self._parse_result(response, verbose=verbose)
+        self.table = result
+        return result
 
     def query_region_async(self, coordinates, radius=2*u.arcmin, *,
                            equinox=2000.0, epoch='J2000', cache=True,
@@ -643,8 +788,10 @@ class SimbadClass(SimbadBaseQuery):
 
         Returns
         -------
-        response : `requests.Response`
-             Response of the query from the server.
+        response : `requests.Response` or list of `requests.Response`
+             Response of the query from the server. Queries with more than
+             ``BATCH_SIZE`` coordinates are split, and a list of the
+             responses (or payloads) of each part is returned.
         """
 
         if radius is None:
@@ -654,44 +801,52 @@ class SimbadClass(SimbadBaseQuery):
         equinox = validate_equinox(equinox)
         epoch = validate_epoch(epoch)
 
-        base_query_str = "query coo {ra} {dec} radius={rad} frame={frame} equi={equinox}"
-
         header = self._get_query_header()
         footer = self._get_query_footer()
 
         ra, dec, frame = _parse_coordinates(coordinates)
+        suffix = " frame={frame} equi={equinox}"
 
         # handle the vector case
-        if isinstance(ra, list):
-            if len(ra) > 10000:
+        if not isinstance(ra, str):
+            if not self.BATCH_SIZE and len(ra) > 10000:
                 warnings.warn("For very large queries, you may receive a "
                               "timeout error.  SIMBAD suggests splitting "
                               "queries with >10000 entries into multiple "
                               "threads", LargeQueryWarning)
 
-            if len(set(frame)) > 1:
-                raise ValueError("Coordinates have different frames")
-            else:
+            if not isinstance(frame, str):
+                if len(set(frame)) > 1:
+                    raise ValueError("Coordinates have different frames")
                 frame = frame[0]
 
             # `radius` as `str` is iterable, but contains only one value.
             if isiterable(radius) and not isinstance(radius, str):
                 if len(radius) != len(ra):
                     raise ValueError("Mismatch between radii and coordinates")
+                radius = np.array([_parse_radius(rad) for rad in radius])
             else:
-                radius = [_parse_radius(radius)] * len(ra)
+                radius = _parse_radius(radius)
 
-            query_str = "\n".join(base_query_str
-                                  .format(ra=ra_, dec=dec_, rad=rad_,
-                                          frame=frame, equinox=equinox)
-                                  for ra_, dec_, rad_ in zip(ra, dec, radius))
+            queries = np.char.add(np.char.add(np.char.add(np.char.add(
+                "query coo ", ra), " "), dec), " radius=")
+            queries = np.char.add(np.char.add(queries, radius),
+                                  suffix.format(frame=frame, equinox=equinox))
+
+            payloads = [{'script': "\n".join([header, "\n".join(queries[i:i + self.BATCH_SIZE]), footer])}
+                        for i in range(0, len(queries), self.BATCH_SIZE or len(queries) or 1)]
+            if len(payloads) == 1:
+                request_payload = payloads[0]
+            else:
+                if get_query_payload:
+                    return payloads
+                return self._request_batches(payloads, cache=cache)
 
         else:
             radius = _parse_radius(radius)
-            query_str = base_query_str.format(ra=ra, dec=dec, frame=frame,
-                                              rad=radius, equinox=equinox)
-
-        request_payload = {'script': "\n".join([header, query_str, footer])}
+            query_str = ("query coo {ra} {dec} radius={rad}" + suffix).format(
+                ra=ra, dec=dec, frame=frame, rad=radius, equinox=equinox)
+            request_payload = {'script': "\n".join([header, query_str, footer])}
 
         if get_query_payload:
             return request_payload
@@ -700,6 +855,56 @@ class SimbadClass(SimbadBaseQuery):
                                  timeout=self.TIMEOUT, cache=cache)
         return response
 
+    def _request_batches(self, payloads, *, cache=True):
+        """
+        Send several script payloads to SIMBAD, with at most
+        ``MAX_CONCURRENT_QUERIES`` requests in flight at once.
+
+        Returns
+        -------
+        responses : list of `requests.Response`
+            The responses, in the order of the payloads.
+        """
+        def request(payload):
+            return self._request("POST", self.SIMBAD_URL, data=payload,
+                                 timeout=self.TIMEOUT, cache=cache)
+
+        with ThreadPoolExecutor(max(1, self.MAX_CONCURRENT_QUERIES)) as executor:
+            return list(executor.map(request, payloads))
+
+    def _parse_batch_results(self, responses, payloads, *, verbose=False):
+        """
+        Parse the responses to a query split in parts of ``BATCH_SIZE``
+        queries and stack them into a single table, renumbering
+        ``SCRIPT_NUMBER_ID`` so that it refers to the position of each query
+        in the whole batch rather than in its part.
+
+        The cached response of a part that cannot be parsed is removed, so
+        that running the query again sends that part again.
+        """
+        tables = []
+        errors = []
+        for index, response in enumerate(responses):
+            try:
+                table = self._parse_result(response, verbose=verbose)
+            except TableParseError:
+                self._remove_cached_response('POST', self.SIMBAD_URL, data=payloads[index],
+                                             timeout=self.TIMEOUT)
+                raise
+            errors.extend(self.last_parsed_result.errors)
+            if table is not None:
+                if 'SCRIPT_NUMBER_ID' in table.colnames:
+                    table['SCRIPT_NUMBER_ID'] += index * self.BATCH_SIZE
+                tables.append(table)
+
+        if not tables:
+            return None
+        result = vstack(tables, metadata_conflicts='silent')
+        if self.ROW_LIMIT > 0:
+            result = result[:self.ROW_LIMIT]
+        result.errors = errors
+        return result
+
     def query_catalog(self, catalog, *, verbose=False, cache=True,
                       get_query_payload=False):
         """
@@ -1049,36 +1254,75 @@ def _parse_coordinates(coordinates):
 
 
 def _get_frame_coords(coordinates):
+    if isinstance(coordinates, coord.SkyCoord) and not coordinates.isscalar:
+        # vector coordinates share a frame, so can be formatted in one go
+        ra, dec, frame = _get_frame_coords_array(coordinates.ravel())
+        return (list(ra), list(dec), [frame] * len(ra))
     if isiterable(coordinates):
         # deal with vectors differently
         parsed = [_get_frame_coords(cc) for cc in coordinates]
         return ([ra for ra, dec, frame in parsed],
                 [dec for ra, dec, frame in parsed],
                 [frame for ra, dec, frame in parsed])
-    if coordinates.frame.name == 'icrs':
-        ra, dec = _to_simbad_format(coordinates.ra, coordinates.dec)
-        return (ra, dec, 'ICRS')
-    elif coordinates.frame.name == 'galactic':
-        lon, lat = (str(coordinates.l.degree), str(coordinates.b.degree))
-        if lat[0] not in ['+', '-']:
-            lat = '+' + lat
+    ra, dec, frame = _get_frame_coords_array(coordinates)
+    return (str(ra), str(dec), frame)
+
+
+def _get_frame_coords_array(coordinates):
+    if coordinates.frame.name == 'galactic':
+        lon = np.asarray(coordinates.l.degree).astype(str)
+        lat = np.asarray(coordinates.b.degree).astype(str)
+        signed = np.char.startswith(lat, '-') | np.char.startswith(lat, '+')
+        lat = np.where(signed, lat, np.char.add('+', lat))
         return (lon, lat, 'GAL')
-    elif coordinates.frame.name == 'fk4':
+    frames = {'icrs': 'ICRS', 'fk4': 'FK4', 'fk5': 'FK5'}
+    if coordinates.frame.name in frames:
         ra, dec = _to_simbad_format(coordinates.ra, coordinates.dec)
-        return (ra, dec, 'FK4')
-    elif coordinates.frame.name == 'fk5':
-        ra, dec = _to_simbad_format(coordinates.ra, coordinates.dec)
-        return (ra, dec, 'FK5')
-    else:
-        raise ValueError("%s is not a valid coordinate" % coordinates)
+        return (ra, dec, frames[coordinates.frame.name])
+    raise ValueError("%s is not a valid coordinate" % coordinates)
 
 
 def _to_simbad_format(ra, dec):
-    # This irrelevantly raises the exception
-    # "AttributeError: Angle instance has no attribute 'hour'"
-    ra = ra.to_string(u.hour, sep=':')
-    dec = dec.to_string(u.degree, sep=':', alwayssign='True')
-    return (ra.lstrip(), dec.lstrip())
+    ra = _sexagesimal_to_string(ra.hour)
+    dec = _sexagesimal_to_string(dec.degree, alwayssign=True)
+    if ra.ndim == 0:
+        return (str(ra), str(dec))
+    return (ra, dec)
+
+
+def _sexagesimal_to_string(values, alwayssign=False):
+    """
+    Format an array of angles, in hours or degrees, as ``:``-separated
+    sexagesimal strings.
+
+    This gives the same strings as `astropy.coordinates.Angle.to_string`
+    with ``sep=':'``, but formats the whole array at once rather than
+    element by element.
+    """
+    values = np.asarray(values, dtype=float)
+    sign = np.copysign(1.0, values)
+    values = np.abs(values)
+    whole = np.floor(values)
+    minutes = np.floor((values - whole) * 60)
+    seconds = ((values - whole) * 60 - minutes) * 60
+
+    # carry the seconds and minutes upwards when they round to 60
+    carry = seconds >= 60.0 - 1e-8
+    seconds = np.where(carry, 0.0, seconds)
+    minutes = minutes + carry
+    carry = minutes >= 60.0
+    minutes = np.where(carry, 0.0, minutes)
+    whole = whole + carry
+
+    whole = np.char.mod('%.0f', np.copysign(whole, sign))
+    if alwayssign:
+        whole = np.where(np.char.startswith(whole, '-'), whole, np.char.add('+', whole))
+    minutes = np.char.mod('%02d', minutes.astype(int))
+    seconds = np.char.rstrip(np.char.rstrip(np.char.mod('%.8f', seconds), '0'), '.')
+    short = (np.char.str_len(seconds) == 1) | (np.char.find(seconds, '.') == 1)
+    seconds = np.where(short, np.char.add('0', seconds), seconds)
+
+    return np.char.add(np.char.add(np.char.add(np.char.add(whole, ':'), minutes), ':'), seconds)
 
 
 def _parse_radius(radius):
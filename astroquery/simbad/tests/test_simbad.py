@@ -1,8 +1,10 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import os
 import re
+import warnings
 
 import pytest
+import requests
 import astropy.units as u
 from astropy.coordinates import SkyCoord
 from astropy.table import Table
@@ -11,7 +13,7 @@ import numpy as np
 from ... import simbad
 from astroquery.utils.mocks import MockResponse
 from ...query import AstroQuery
-from ...exceptions import TableParseError
+from ...exceptions import TableParseError, LargeQueryWarning
 from .test_simbad_remote import multicoords
 
 GALACTIC_COORDS = SkyCoord(l=-67.02084 * u.deg, b=-29.75447 * u.deg, frame="galactic")
@@ -442,3 +444,184 @@ def test_regression_issue388():
     truth = 'M   1'
     assert parsed_table['MAIN_ID'][0] == truth
     assert len(parsed_table) == 1
+
+
+def test_to_simbad_format_vector():
+    coords = SkyCoord(ra=[0, 83.82207, 266.835, 359.99999999999],
+                      dec=[-0.0, -5.391111, -28.38528, 89.999999999999],
+                      unit=u.deg)
+    ra, dec = simbad.core._to_simbad_format(coords.ra, coords.dec)
+    assert list(ra) == list(coords.ra.to_string(u.hour, sep=':'))
+    assert list(dec) == list(coords.dec.to_string(u.degree, sep=':', alwayssign=True))
+
+
+def test_get_frame_coordinates_vector():
+    coords = SkyCoord(l=[-67.02084, 10] * u.deg, b=[-29.75447, 5] * u.deg, frame="galactic")
+    l_gal, b_gal, frames = simbad.core._get_frame_coords(coords)
+    assert frames == ['GAL', 'GAL']
+    assert b_gal == ['-29.75447', '+5.0']
+    np.testing.assert_almost_equal([float(lon) for lon in l_gal], coords.l.degree)
+
+
+def test_query_region_batches(patch_post):
+    sb = simbad.SimbadClass()
+    sb.BATCH_SIZE = 2
+    coords = SkyCoord(ra=[10, 11, 12, 13, 14], dec=[10, 11, 12, 13, 14], unit=u.deg)
+
+    payloads = sb.query_region(coords, radius=0.1 * u.deg, get_query_payload=True)
+    assert len(payloads) == 3
+    assert [payload['script'].count('query coo') for payload in payloads] == [2, 2, 1]
+    assert all(payload['script'].endswith('votable close') for payload in payloads)
+
+    single = sb.query_region(coords[0], radius=0.1 * u.deg)
+    result = sb.query_region(coords, radius=0.1 * u.deg)
+    assert len(result) == 3 * len(single)
+
+
+def test_query_region_large_query_warning(patch_post):
+    coords = SkyCoord(ra=np.linspace(0, 10, 10001), dec=np.zeros(10001), unit=u.deg)
+    sb = simbad.SimbadClass()
+    sb.BATCH_SIZE = 0
+    with pytest.warns(LargeQueryWarning):
+        sb.query_region(coords, radius=0.1 * u.deg, get_query_payload=True)
+
+    sb.BATCH_SIZE = 1000
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', LargeQueryWarning)
+        sb.query_region(coords, radius=0.1 * u.deg, get_query_payload=True)
+
+
+def test_parse_batch_results_script_number(monkeypatch):
+    sb = simbad.SimbadClass()
+    sb.BATCH_SIZE = 2
+    parts = iter([Table({'MAIN_ID': ['a', 'b'], 'SCRIPT_NUMBER_ID': [1, 2]}),
+                  None,
+                  Table({'MAIN_ID': ['c'], 'SCRIPT_NUMBER_ID': [2]})])
+
+    def parse_result(response, verbose=False):
+        sb.last_parsed_result = simbad.core.SimbadResult('::error::\n')
+        return next(parts)
+
+    monkeypatch.setattr(sb, '_parse_result', parse_result)
+    result = sb._parse_batch_results([None, None, None], [None, None, None])
+    assert list(result['MAIN_ID']) == ['a', 'b', 'c']
+    assert list(result['SCRIPT_NUMBER_ID']) == [1, 2, 6]
+
+
+def test_parse_batch_results_bad_part(tmp_path):
+    sb = simbad.SimbadClass()
+    sb.cache_location = tmp_path
+    payloads = [{'script': f'query id M{index}'} for index in range(3)]
+    request_files = [AstroQuery('POST', sb.SIMBAD_URL, data=payload,
+                                timeout=sb.TIMEOUT).request_file(tmp_path)
+                     for payload in payloads]
+    for request_file in request_files:
+        request_file.write_bytes(b'cached')
+    # the last request sent is not the one of the part that fails
+    sb._last_query = AstroQuery('POST', sb.SIMBAD_URL, data=payloads[2], timeout=sb.TIMEOUT)
+    with open(data_path(DATA_FILES['id']), 'rb') as infile:
+        content = infile.read()
+    responses = [MockResponse(content), MockResponse(b'::data::\nnot a votable'),
+                 MockResponse(content)]
+
+    with pytest.raises(TableParseError):
+        sb._parse_batch_results(responses, payloads)
+    assert request_files[0].exists()
+    assert not request_files[1].exists()
+
+
+def test_query_objects_batches(patch_post):
+    sb = simbad.SimbadClass()
+    sb.BATCH_SIZE = 2
+    names = ['M1', 'M2', 'M3', 'M4', 'M5']
+
+    payloads = sb.query_objects(names, get_query_payload=True)
+    assert len(payloads) == 3
+    assert [re.findall(r'M\d', payload['script']) for payload in payloads] == [['M1', 'M2'], ['M3', 'M4'], ['M5']]
+
+    single = sb.query_objects(names[:1])
+    result = sb.query_objects(names)
+    assert len(result) == 3 * len(single)
+
+
+@pytest.fixture
+def patch_base_request(monkeypatch):
+    responses = []
+    requested = []
+    sleeps = []
+
+    def base_request(self, method, url, *args, **kwargs):
+        requested.append(url)
+        return responses.pop(0)
+
+    monkeypatch.setattr(simbad.core.BaseQuery, '_request', base_request)
+    monkeypatch.setattr(simbad.core.time, 'sleep', sleeps.append)
+    return responses, requested, sleeps
+
+
+def test_request_retry_on_403(patch_base_request, tmp_path):
+    responses, requested, sleeps = patch_base_request
+    responses.extend([MockResponse(b'', status_code=403), MockResponse(b'', status_code=403),
+                      MockResponse(b'ok', status_code=200)])
+    sb = simbad.SimbadClass()
+    sb.cache_location = tmp_path
+    sb.MAX_REQUESTS_PER_SECOND = 0
+    sb.RETRY_BACKOFF = 1
+
+    response = sb._request('POST', sb.SIMBAD_URL, data={'script': 'query id M1'}, timeout=1)
+    assert response.content == b'ok'
+    assert len(requested) == 3
+    assert sleeps == [1, 2]
+
+    responses.extend([MockResponse(b'', status_code=403)] * (sb.MAX_RETRIES + 1))
+    with pytest.raises(requests.exceptions.HTTPError, match='Error 403'):
+        sb._request('POST', sb.SIMBAD_URL, data={'script': 'query id M1'}, timeout=1)
+
+
+def test_request_failure_not_cached(patch_base_request, tmp_path):
+    responses, requested, sleeps = patch_base_request
+    responses.append(MockResponse(b'', status_code=403))
+    sb = simbad.SimbadClass()
+    sb.cache_location = tmp_path
+    sb.MAX_RETRIES = 0
+    request_file = AstroQuery('POST', sb.SIMBAD_URL, data={'script': 'query id M1'},
+                              timeout=1).request_file(tmp_path)
+    request_file.write_bytes(b'cached failure')
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        sb._request('POST', sb.SIMBAD_URL, data={'script': 'query id M1'}, timeout=1)
+    assert not request_file.exists()
+
+
+def test_request_rate_limit(patch_base_request):
+    responses, requested, sleeps = patch_base_request
+    responses.extend([MockResponse(b'ok')] * 3)
+    sb = simbad.SimbadClass()
+    sb.MAX_REQUESTS_PER_SECOND = 0.5
+    sb._next_request_time = {}
+
+    for _ in range(3):
+        sb._request('POST', sb.SIMBAD_URL, data={'script': 'query id M1'}, timeout=1)
+    assert len(sleeps) == 2
+    assert all(1 < delay <= 4 for delay in sleeps)
+
+
+def test_request_rate_limit_cached(patch_base_request, tmp_path):
+    responses, requested, sleeps = patch_base_request
+    responses.extend([MockResponse(b'ok')] * 5)
+    sb = simbad.SimbadClass()
+    sb.cache_location = tmp_path
+    sb.MAX_REQUESTS_PER_SECOND = 0.5
+    sb._next_request_time = {}
+    AstroQuery('POST', sb.SIMBAD_URL, data={'script': 'query id M1'},
+               timeout=1).request_file(tmp_path).write_bytes(b'cached')
+
+    for _ in range(3):
+        sb._request('POST', sb.SIMBAD_URL, data={'script': 'query id M1'}, timeout=1)
+    assert sleeps == []
+
+    # requests bypassing the cache still wait for their turn
+    for _ in range(2):
+        sb._request('POST', sb.SIMBAD_URL, data={'script': 'query id M1'}, timeout=1,
+                    cache=False)
+    assert len(sleeps) == 1
@@ -204,7 +204,7 @@ class SkyViewClass(BaseQuery):
                                                  lut=lut, grid=grid, gridlabels=gridlabels,
                                                  radius=radius, height=height, width=width,
                                                  cache=cache, show_progress=show_progress)
-        return [obj.get_fits() for obj in readable_objects]
+        return commons.get_fits_files(readable_objects, show_progress=show_progress)
 
     @prepend_docstr_nosections(get_images.__doc__)
     def get_images_async(self, position, survey, *, coordinates=None,
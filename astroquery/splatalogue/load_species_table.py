@@ -1,12 +1,12 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import json
-import re
 import os
 
 from astroquery.splatalogue.build_species_table import data_path, get_json_species_ids
+from astroquery.utils.lookup_table import IndexedLookuptable
 
 
-class SpeciesLookuptable(dict):
+class SpeciesLookuptable(IndexedLookuptable):
 
     def find(self, s, *, flags=0, return_dict=True,):
         """
@@ -27,10 +27,7 @@ class SpeciesLookuptable(dict):
         corresponding to matches
         """
 
-        R = re.compile(s, flags)
-
-        out = SpeciesLookuptable(dict((k, v) for k, v in self.items()
-                                      if R.search(k)))
+        out = SpeciesLookuptable((k, self[k]) for k in self._search_keys(s, flags))
 
         if return_dict:
             return out
@@ -8,18 +8,22 @@ import warnings
 import os
 import shutil
 import socket
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from io import BytesIO, StringIO
 from urllib.error import URLError
 
 import astropy.units as u
 from collections import OrderedDict
+from contextlib import nullcontext
 from astropy.utils import minversion
+from astropy.utils.console import ProgressBar
 import astropy.utils.data as aud
 from astropy.io import fits, votable
 
 from astropy.coordinates import BaseCoordinateFrame, SkyCoord
 
 from ..exceptions import TimeoutError, InputWarning
+from . import conf
 
 
 CoordClasses = (SkyCoord, BaseCoordinateFrame)
@@ -27,6 +31,7 @@ CoordClasses = (SkyCoord, BaseCoordinateFrame)
 
 __all__ = ['parse_coordinates',
            'TableList',
+           'get_fits_files',
            'suppress_vo_warnings',
            'validate_email',
            'ASTROPY_LT_4_3',
@@ -259,6 +264,7 @@ class FileContainer:
     def __init__(self, target, **kwargs):
         kwargs.setdefault('cache', True)
         self._target = target
+        self._kwargs = kwargs
         self._timeout = kwargs.get('remote_timeout', aud.conf.remote_timeout)
         if (os.path.splitext(target)[1] == '.fits' and not
                 ('encoding' in kwargs and kwargs['encoding'] == 'binary')):
@@ -266,12 +272,38 @@ class FileContainer:
                           "likely.", InputWarning)
         self._readable_object = get_readable_fileobj(target, **kwargs)
 
-    def get_fits(self):
+    def get_fits(self, *, memmap=False, show_progress=None):
         """
         Assuming the contained file is a FITS file, read it
         and return the file parsed as FITS HDUList
+
+        Parameters
+        ----------
+        memmap : bool
+            If True, download the file to the astropy cache (unless it is a
+            local file) and open it memory-mapped, instead of reading the
+            whole file in memory.
+        show_progress : bool or None
+            Show the progress of the download. If None, the ``show_progress``
+            option of the container is used.
         """
-        filedata = self.get_string()
+        if show_progress is None:
+            show_progress = self._kwargs.get('show_progress', True)
+
+        if memmap:
+            # kept apart from the HDUList read in memory, which may have been
+            # returned before
+            if not hasattr(self, '_memmap_fits'):
+                filename = str(self._target)
+                if not os.path.isfile(filename):
+                    filename = aud.download_file(
+                        filename, cache=self._kwargs['cache'],
+                        show_progress=show_progress, timeout=self._timeout)
+                self._memmap_fits = fits.open(filename, memmap=True)
+            self._fits = self._memmap_fits
+            return self._fits
+
+        filedata = self.get_string(show_progress=show_progress)
 
         if len(filedata) == 0:
             raise TypeError("The file retrieved was empty.")
@@ -312,13 +344,24 @@ class FileContainer:
         else:
             shutil.copy(target, savepath)
 
-    def get_string(self):
+    def get_string(self, *, show_progress=None):
         """
         Download the file as a string
+
+        Parameters
+        ----------
+        show_progress : bool or None
+            Show the progress of the download. If None, the ``show_progress``
+            option of the container is used.
         """
         if not hasattr(self, '_string'):
+            readable_object = self._readable_object
+            if (show_progress is not None
+                    and show_progress != self._kwargs.get('show_progress', True)):
+                readable_object = get_readable_fileobj(
+                    self._target, **dict(self._kwargs, show_progress=show_progress))
             try:
-                with self._readable_object as f:
+                with readable_object as f:
                     data = f.read()
                     self._string = data
             except URLError as e:
@@ -347,6 +390,51 @@ class FileContainer:
             return f"Downloaded object from URL {self._target} with ID {id(self._readable_object)}"
 
 
+def get_fits_files(file_containers, *, max_workers=None, memmap=False,
+                   show_progress=True):
+    """
+    Download the files of several `FileContainer` objects concurrently
+    and return them parsed as FITS HDUList
+
+    Parameters
+    ----------
+    file_containers : list of `FileContainer`
+        The files to download.
+    max_workers : int or None
+        Maximum number of files downloaded at the same time. If None,
+        ``astroquery.utils.conf.max_download_workers`` is used.
+    memmap : bool
+        If True, open the files memory-mapped from the astropy cache, see
+        `FileContainer.get_fits`.
+    show_progress : bool
+        Show a progress bar of the number of files downloaded. The progress
+        of the download of each file is not shown when they are downloaded
+        concurrently.
+
+    Returns
+    -------
+    A list of `~astropy.io.fits.HDUList` objects, in the order of
+    ``file_containers``.
+    """
+    if max_workers is None:
+        max_workers = conf.max_download_workers
+    file_containers = list(file_containers)
+    if max_workers <= 1 or len(file_containers) <= 1:
+        return [obj.get_fits(memmap=memmap) for obj in file_containers]
+
+    hdulists = [None] * len(file_containers)
+    with ThreadPoolExecutor(max_workers) as executor:
+        futures = {executor.submit(obj.get_fits, memmap=memmap, show_progress=False): index
+                   for index, obj in enumerate(file_containers)}
+        progress = ProgressBar(len(futures)) if show_progress else nullcontext()
+        with progress as bar:
+            for future in as_completed(futures):
+                hdulists[futures[future]] = future.result()
+                if bar is not None:
+                    bar.update()
+    return hdulists
+
+
 def get_readable_fileobj(*args, **kwargs):
     """
     Overload astropy's get_readable_fileobj so that we can safely monkeypatch
@@ -0,0 +1,183 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""
+Dictionary of species names that can be searched by regular expression
+without testing the expression against every name.
+"""
+import re
+
+__all__ = ['IndexedLookuptable']
+
+# an opening parenthesis or a vertical bar not escaped by a backslash
+_GROUP_OR_ALTERNATIVE = re.compile(r'(?:^|[^\\])(?:\\\\)*[(|]')
+# escapes matching a class of characters or an empty string
+_CLASS_OR_ZERO_WIDTH_ESCAPES = frozenset('AbBdDsSwWZ')
+
+
+class IndexedLookuptable(dict):
+    """
+    Dictionary whose keys can be searched by regular expression.
+
+    A trigram index of the keys is built on the first search and reused by
+    the later ones.  The literal substrings that any match must contain are
+    read from the expression, and the expression is only tested against the
+    keys that contain all of them.  Expressions with no such substring (e.g.
+    alternatives or groups) are tested against every key.  The index is
+    dropped whenever the dictionary is modified.
+    """
+
+    def _search_positions(self, pattern, flags=0):
+        """
+        Return the set of positions, in insertion order, of the keys matched
+        by the regular expression ``pattern``.
+        """
+        regex = re.compile(pattern, flags)
+        ignorecase = bool(regex.flags & re.IGNORECASE)
+        keys, trigrams, unindexed = self._get_index(ignorecase)
+
+        postings = []
+        for literal in _required_literals(regex.pattern, regex.flags):
+            if ignorecase:
+                # only ASCII substrings are lowered the way the regular
+                # expression engine folds their case
+                if not literal.isascii():
+                    continue
+                literal = literal.lower()
+            postings.extend(trigrams.get(literal[ii:ii + 3], set())
+                            for ii in range(len(literal) - 2))
+
+        if postings:
+            postings.sort(key=len)
+            candidates = postings[0].intersection(*postings[1:])
+            candidates.update(unindexed)
+        else:
+            candidates = range(len(keys))
+
+        return {ii for ii in candidates if regex.search(keys[ii])}
+
+    def _search_keys(self, pattern, flags=0):
+        """
+        Return the keys matched by the regular expression ``pattern``, in
+        insertion order.
+        """
+        return self._positions_to_keys(self._search_positions(pattern, flags))
+
+    def _positions_to_keys(self, positions):
+        index_cache = self.__dict__.setdefault('_index_cache', {})
+        if 'keys' not in index_cache:
+            index_cache['keys'] = list(self)
+        keys = index_cache['keys']
+        return [keys[ii] for ii in sorted(positions)]
+
+    def _get_index(self, ignorecase):
+        """
+        Return the keys as strings, the trigram index mapping each trigram
+        to the positions of the keys containing it, and the positions of the
+        keys left out of the index.
+        """
+        index_cache = self.__dict__.setdefault('_index_cache', {})
+        if ignorecase not in index_cache:
+            keys = [str(key) for key in self]
+            trigrams = {}
+            unindexed = []
+            for ii, key in enumerate(keys):
+                if ignorecase:
+                    if not key.isascii():
+                        unindexed.append(ii)
+                        continue
+                    key = key.lower()
+                for trigram in {key[jj:jj + 3] for jj in range(len(key) - 2)}:
+                    trigrams.setdefault(trigram, set()).add(ii)
+            index_cache[ignorecase] = keys, trigrams, unindexed
+        return index_cache[ignorecase]
+
+    def _clear_index(self):
+        self.__dict__.pop('_index_cache', None)
+
+    def __setitem__(self, key, value):
+        self._clear_index()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._clear_index()
+        super().__delitem__(key)
+
+    def __ior__(self, other):
+        self._clear_index()
+        return super().__ior__(other)
+
+    def clear(self):
+        self._clear_index()
+        super().clear()
+
+    def pop(self, *args):
+        self._clear_index()
+        return super().pop(*args)
+
+    def popitem(self):
+        self._clear_index()
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        self._clear_index()
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        self._clear_index()
+        super().update(*args, **kwargs)
+
+
+def _required_literals(pattern, flags):
+    """
+    Return substrings that any string matched by the regular expression
+    ``pattern`` contains.
+
+    Only the simple expressions used to look up species names are analyzed:
+    expressions with groups, alternatives or the verbose flag yield no
+    substrings.  Leaving a substring out is always safe, so anything unusual
+    simply ends the current substring.
+    """
+    if flags & re.VERBOSE or _GROUP_OR_ALTERNATIVE.search(pattern):
+        return []
+
+    literals = []
+    current = ''
+    ii = 0
+    while ii < len(pattern):
+        char = pattern[ii]
+        ii += 1
+        if char == '\\':
+            # escaped punctuation is literal and class and zero-width escapes
+            # end the substring, while other escaped letters and digits
+            # (e.g. character codes or references) are not analyzed
+            escaped = pattern[ii:ii + 1]
+            ii += 1
+            if escaped and not (escaped.isascii() and escaped.isalnum()):
+                current += escaped
+                continue
+            if escaped not in _CLASS_OR_ZERO_WIDTH_ESCAPES:
+                return []
+        elif char == '[':
+            # a closing bracket right after the opening one (or after the
+            # negation) is a member of the set
+            start = ii + 1 if pattern[ii:ii + 1] == '^' else ii
+            end = pattern.find(']', start + 1)
+            if end < 0 or '\\' in pattern[ii:end]:
+                return []
+            ii = end + 1
+        elif char in '*?{':
+            # the previous character is optional
+            current = current[:-1]
+            if char == '{':
+                end = pattern.find('}', ii)
+                ii = len(pattern) if end < 0 else end + 1
+        elif char not in '.^$+}':
+            current += char
+            continue
+
+        if current:
+            literals.append(current)
+        current = ''
+
+    if current:
+        literals.append(current)
+    return literals
@@ -15,9 +15,43 @@ Created on 30 jun. 2016
 
 """
 
+from astropy import config as _config
+
+
+class Conf(_config.ConfigNamespace):
+    """
+    Configuration parameters for `astroquery.utils.tap`.
+    """
+    result_cache = _config.ConfigItem(
+        False,
+        'Cache the results of TAP jobs on disk and reuse them for identical '
+        'queries.')
+    result_cache_timeout = _config.ConfigItem(
+        604800,
+        'Time in seconds after which cached TAP results expire.')
+    result_cache_max_size = _config.ConfigItem(
+        1024,
+        'Maximum total size in MB of the cached TAP results; the least '
+        'recently used results are removed first.')
+    schema_cache = _config.ConfigItem(
+        True,
+        'Cache the table metadata of TAP services on disk; the cached '
+        'metadata is revalidated with the service (ETag/Last-Modified) '
+        'before it is used, and expires and is evicted like the cached '
+        'results (result_cache_timeout, result_cache_max_size).')
+    dump_buffer_size = _config.ConfigItem(
+        1048576,
+        'Size in bytes of the buffer used to save TAP results to files.')
+
+
+conf = Conf()
+
 from astroquery.utils.tap.core import Tap
 from astroquery.utils.tap.core import TapPlus
 from astroquery.utils.tap.model.taptable import TapTableMeta
 from astroquery.utils.tap.model.tapcolumn import TapColumn
 
-__all__ = ['Tap', 'TapPlus', 'TapTableMeta', 'TapColumn']
+from astroquery.utils.tap.cache import TapResultCache, TapSchemaCache
+
+__all__ = ['Tap', 'TapPlus', 'TapTableMeta', 'TapColumn', 'TapResultCache',
+           'TapSchemaCache', 'Conf', 'conf']
@@ -0,0 +1,229 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""
+=============
+TAP plus
+=============
+
+Caches of TAP job results and table metadata
+
+"""
+import hashlib
+import io
+import os
+import pickle
+import re
+import time
+from pathlib import Path
+
+from astropy.config import paths
+from astropy.table import Table
+
+from astroquery import log
+
+__all__ = ['TapResultCache', 'TapSchemaCache']
+
+# ADQL string literals and delimited identifiers, whose whitespace matters
+_QUOTED = re.compile(r"""('(?:[^']|'')*'|"(?:[^"]|"")*")""")
+
+
+def normalize_query(query):
+    """Returns the query with runs of whitespace outside of string literals and
+    delimited identifiers collapsed, and without a trailing semicolon
+
+    Parameters
+    ----------
+    query : str, mandatory
+        ADQL query
+
+    Returns
+    -------
+    The normalized query
+    """
+    parts = _QUOTED.split(str(query))
+    parts[::2] = [re.sub(r'\s+', ' ', part) for part in parts[::2]]
+    return ''.join(parts).strip().rstrip(';').rstrip()
+
+
+class TapResultCache:
+    """Cache of the results of TAP jobs
+
+    The results are pickled in the cache directory, one file per job. Results
+    older than ``timeout`` are discarded, and the least recently used results
+    are removed when the files exceed ``max_size`` in total.
+    """
+
+    # directory in the astroquery cache directory
+    directory = 'TapResults'
+
+    def __init__(self, *, location=None, timeout=None, max_size=None):
+        """Constructor
+
+        Parameters
+        ----------
+        location : str or Path, optional, default None
+            cache directory. If not provided, the ``directory`` directory in
+            the astroquery cache directory is used
+        timeout : int, optional, default None
+            time in seconds after which results expire. If None, results do
+            not expire
+        max_size : int, optional, default None
+            maximum total size in bytes of the cached results. If None, the
+            size is not limited
+        """
+        if location is None:
+            location = Path(paths.get_cache_dir(), 'astroquery', self.directory)
+        self.location = Path(location)
+        self.timeout = timeout
+        self.max_size = max_size
+
+    @staticmethod
+    def get_key(url, query, *, output_format, upload_resource=None,
+                upload_table_name=None, maxrec=None, user=None):
+        """Returns the key of the results of a job
+
+        Parameters
+        ----------
+        url : str, mandatory
+            TAP service URL
+        query : str, mandatory
+            ADQL query, which is normalized
+        output_format : str, mandatory
+            results format
+        upload_resource : str or Table, optional, default None
+            uploaded resource, of which the contents are hashed
+        upload_table_name : str, optional, default None
+            name of the uploaded table
+        maxrec : int, optional, default None
+            maximum number of rows
+        user : str, optional, default None
+            logged in user
+
+        Returns
+        -------
+        A string
+        """
+        digest = hashlib.sha224()
+        for item in (url, normalize_query(query), output_format,
+                     upload_table_name, maxrec, user):
+            digest.update(repr(item).encode())
+            digest.update(b'\0')
+        if isinstance(upload_resource, Table):
+            buffer = io.BytesIO()
+            upload_resource.write(buffer, format='votable')
+            digest.update(buffer.getvalue())
+        elif upload_resource is not None:
+            with open(upload_resource, 'rb') as f:
+                digest.update(f.read())
+        return digest.hexdigest()
+
+    def get(self, key):
+        """Returns the cached results, or None if there are none
+
+        Parameters
+        ----------
+        key : str, mandatory
+            key returned by get_key
+        """
+        path = self.__get_path(key)
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        if self.timeout is not None and time.time() - stat.st_mtime > self.timeout:
+            self.__remove(path)
+            return None
+        try:
+            with open(path, 'rb') as f:
+                results = pickle.load(f)
+        except Exception as ex:
+            log.warning(f"Could not read the cached TAP results {path}: {ex}")
+            self.__remove(path)
+            return None
+        # the access time orders the eviction, the modification time the
+        # expiry
+        os.utime(path, (time.time(), stat.st_mtime))
+        return results
+
+    def put(self, key, results):
+        """Caches results
+
+        Parameters
+        ----------
+        key : str, mandatory
+            key returned by get_key
+        results : Table, mandatory
+            job results
+        """
+        self.location.mkdir(parents=True, exist_ok=True)
+        path = self.__get_path(key)
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp_path, 'wb') as f:
+            pickle.dump(results, f, protocol=4)
+        os.replace(temp_path, path)
+        self.__evict()
+
+    def clear(self):
+        """Removes all cached results"""
+        for path in self.location.glob('*.pickle'):
+            self.__remove(path)
+
+    def __get_path(self, key):
+        return self.location.joinpath(f"{key}.pickle")
+
+    def __evict(self):
+        if self.max_size is None:
+            return
+        files = []
+        for path in self.location.glob('*.pickle'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_atime, stat.st_size, path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_size:
+                break
+            self.__remove(path)
+            total -= size
+
+    @staticmethod
+    def __remove(path):
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+class TapSchemaCache(TapResultCache):
+    """Cache of the table metadata of TAP services
+
+    The parsed tables are stored together with the ETag and Last-Modified
+    headers of the response, which are used to revalidate them with the
+    service.
+    """
+
+    directory = 'TapSchemas'
+
+    @staticmethod
+    def get_key(url, subcontext, *, user=None):
+        """Returns the key of the tables of a VOSI request
+
+        Parameters
+        ----------
+        url : str, mandatory
+            TAP service URL
+        subcontext : str, mandatory
+            tables request, including its parameters
+        user : str, optional, default None
+            logged in user
+
+        Returns
+        -------
+        A string
+        """
+        digest = hashlib.sha224()
+        for item in (url, subcontext, user):
+            digest.update(repr(item).encode())
+            digest.update(b'\0')
+        return digest.hexdigest()
@@ -21,13 +21,17 @@ try:
 except ImportError:
     # python 2
     import httplib
+import contextlib
+import io
 import mimetypes
 import time
+import zlib
 from astroquery.utils.tap.xmlparser import utils
-from astroquery.utils.tap import taputils
+from astroquery.utils.tap import conf, taputils
 from astroquery import version
 
 import requests
+from astropy.utils.console import ProgressBarOrSpinner
 
 __all__ = ['TapConn']
 
@@ -169,7 +173,7 @@ class TapConn:
     def __get_server_context(self, subContext):
         return f"{self.__serverContext}/{subContext}"
 
-    def execute_tapget(self, subcontext, *, verbose=False):
+    def execute_tapget(self, subcontext, *, verbose=False, headers=None):
         """Executes a TAP GET request
         The connection is done through HTTP or HTTPS depending on the login
         status (logged in -> HTTPS)
@@ -181,6 +185,8 @@ class TapConn:
             TAP list name
         verbose : bool, optional, default 'False'
             flag to display information about the process
+        headers : dict, optional, default None
+            additional request headers (e.g. conditional request headers)
 
         Returns
         -------
@@ -188,10 +194,12 @@ class TapConn:
         """
         if subcontext.startswith("http"):
             # absolute url
-            return self.__execute_get(subcontext, verbose=verbose)
+            return self.__execute_get(subcontext, verbose=verbose,
+                                      headers=headers)
         else:
             context = self.__get_tap_context(subcontext)
-            return self.__execute_get(context, verbose=verbose)
+            return self.__execute_get(context, verbose=verbose,
+                                      headers=headers)
 
     def execute_dataget(self, query, *, verbose=False):
         """Executes a data GET request
@@ -233,12 +241,16 @@ class TapConn:
         context = self.__get_datalink_context(subcontext, query)
         return self.__execute_get(context, verbose)
 
-    def __execute_get(self, context, *, verbose=False):
+    def __execute_get(self, context, *, verbose=False, headers=None):
         conn = self.__get_connection(verbose=verbose)
         if verbose:
             print(f"host = {conn.host}:{conn.port}")
             print(f"context = {context}")
-        conn.request("GET", context, None, self.__getHeaders)
+        if headers:
+            headers = {**self.__getHeaders, **headers}
+        else:
+            headers = self.__getHeaders
+        conn.request("GET", context, None, headers)
         response = conn.getresponse()
         self.__currentReason = response.reason
         self.__currentStatus = response.status
@@ -487,23 +499,71 @@ class TapConn:
         """
         return taputils.taputil_find_header(headers, key)
 
-    def dump_to_file(self, output, response):
+    def dump_to_file(self, output, response, *, buffer_size=None,
+                     decompress=False, verbose=False):
         """Writes the connection response into the specified output
 
         Parameters
         ----------
         output : file, mandatory
             output file
-        response : HTTP(s) response object, mandatory
-            HTTP(s) response object
+        response : HTTP(s) response object, str or bytes, mandatory
+            HTTP(s) response object or its contents
+        buffer_size : int, optional, default None
+            size in bytes of the buffer the response is read into. If not
+            provided, ``astroquery.utils.tap.conf.dump_buffer_size`` is used
+        decompress : bool, optional, default False
+            if True, a gzip compressed response is decompressed while it is
+            written
+        verbose : bool, optional, default 'False'
+            flag to display the progress and the throughput
         """
-        with open(output, "wb") as f:
+        if isinstance(response, str):
+            response = response.encode('utf-8')
+        if isinstance(response, bytes):
+            response = io.BytesIO(response)
+        if buffer_size is None:
+            buffer_size = conf.dump_buffer_size
+        # HTTP responses are read into a single reusable buffer
+        readinto = getattr(response, 'readinto', None)
+        view = memoryview(bytearray(buffer_size))
+        decompressor = None
+        size = 0
+        start = time.perf_counter()
+        if verbose:
+            progress = ProgressBarOrSpinner(self.__get_content_length(response),
+                                            f"Saving results to {output} ...")
+        else:
+            progress = contextlib.nullcontext()
+        with open(output, "wb") as f, progress:
             while True:
-                data = response.read(4096)
+                if readinto is not None:
+                    data = view[:readinto(view)]
+                else:
+                    data = response.read(buffer_size)
                 if len(data) < 1:
                     break
+                if decompress and size == 0 and data[:2] == b'\x1f\x8b':
+                    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                size += len(data)
+                if decompressor is not None:
+                    data = decompressor.decompress(data)
                 f.write(data)
-            f.close()
+                if verbose:
+                    progress.update(size)
+            if decompressor is not None:
+                f.write(decompressor.flush())
+        if verbose:
+            elapsed = max(time.perf_counter() - start, 1e-9)
+            print(f"Saved {size} bytes in {elapsed:.2f} s "
+                  f"({size / elapsed / 2**20:.1f} MB/s)")
+
+    def __get_content_length(self, response):
+        headers = getattr(response, 'getheaders', None)
+        if headers is None or headers() is None:
+            return None
+        length = self.find_header(headers(), 'Content-Length')
+        return int(length) if length is not None else None
 
     def get_suitable_extension_by_format(self, output_format):
         """Returns the suitable extension for a file based on the output format
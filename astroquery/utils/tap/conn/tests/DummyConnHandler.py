@@ -31,6 +31,7 @@ class DummyConnHandler:
         self.verbose = None
         self.query = None
         self.fileOutput = None
+        self.requestHeaders = None
 
     def set_default_response(self, defaultResponse):
         self.defaultResponse = defaultResponse
@@ -41,7 +42,8 @@ class DummyConnHandler:
     def set_response(self, request, response):
         self.responses[str(request)] = response
 
-    def execute_tapget(self, request=None, verbose=False):
+    def execute_tapget(self, request=None, verbose=False, headers=None):
+        self.requestHeaders = headers
         return self.__execute_get(request, verbose)
 
     def execute_dataget(self, query, verbose=False):
@@ -82,7 +84,8 @@ class DummyConnHandler:
                 self.request = f"{subcontext}&{sortedKey}"
         return self.__get_response(self.request)
 
-    def dump_to_file(self, fileOutput, response):
+    def dump_to_file(self, fileOutput, response, *, buffer_size=None,
+                     decompress=False, verbose=False):
         print(f"DummyConnHandler - dump to file: file: '{fileOutput}', \
         response status: {response.status}, response msg: {response.reason}")
 
@@ -14,6 +14,8 @@ Created on 30 jun. 2016
 
 
 """
+import gzip
+import io
 import os
 
 from astroquery.utils.tap.conn.tapconn import TapConn
@@ -115,3 +117,29 @@ def test_login():
     assert r.get_method() == 'POST'
     assert r.get_context() == context
     assert r.get_body() == data
+
+
+def test_dump_to_file(tmp_path):
+    tap = TapConn(ishttps=False, host="testHost", server_context="server",
+                  tap_context="tap", connhandler=DummyConn("http"))
+    results_file = os.path.join(os.path.dirname(__file__), '..', '..',
+                                'xmlparser', 'tests', 'data',
+                                'test_job_results.xml')
+    with open(results_file, 'rb') as f:
+        content = f.read()
+
+    # the buffer is smaller than the response
+    output = tmp_path / 'results.vot'
+    tap.dump_to_file(output, io.BytesIO(content), buffer_size=1000)
+    assert output.read_bytes() == content
+
+    # compressed responses are saved as they are, unless decompressed
+    compressed = gzip.compress(content)
+    tap.dump_to_file(output, io.BytesIO(compressed), buffer_size=1000)
+    assert output.read_bytes() == compressed
+    tap.dump_to_file(output, io.BytesIO(compressed), buffer_size=1000,
+                     decompress=True)
+    assert output.read_bytes() == content
+
+    tap.dump_to_file(output, "error message")
+    assert output.read_text() == "error message"
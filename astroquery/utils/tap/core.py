@@ -13,9 +13,11 @@ European Space Agency (ESA)
 Created on 30 jun. 2016
 Modified on 1 jun. 2021 by mhsarmiento
 """
+from datetime import datetime
 from urllib.parse import urlencode
 
-from astroquery.utils.tap import taputils
+from astroquery.utils.tap import conf, taputils
+from astroquery.utils.tap.cache import TapResultCache, TapSchemaCache
 from astroquery.utils.tap.conn.tapconn import TapConn
 from astroquery.utils.tap.xmlparser.tableSaxParser import TableSaxParser
 from astroquery.utils.tap.model.job import Job
@@ -131,6 +133,7 @@ class Tap:
                           port=port,
                           sslport=sslport)
             self.__connHandler = tap
+        self.__url = tap.get_host_url()
         # if connectionHandler is set, use it (useful for testing)
         if connhandler is not None:
             self.__connHandler = connhandler
@@ -139,6 +142,7 @@ class Tap:
 
     def __internalInit(self):
         self.__connHandler = None
+        self.__url = None
         self.tap_client_id = f"aqtappy1-{VERSION}"
 
     def load_tables(self, *, verbose=False):
@@ -173,20 +177,10 @@ class Tap:
             raise ValueError("Table name is required")
         if verbose:
             print(f"Retrieving table '{table}'")
-        response = self.__connHandler.execute_tapget(f"tables?tables={table}",
-                                                     verbose=verbose)
-        if verbose:
-            print(response.status, response.reason)
-        self.__connHandler.check_launch_response_status(response,
-                                                        verbose,
-                                                        200)
-        if verbose:
-            print(f"Parsing table '{table}'...")
-        tsp = TableSaxParser()
-        tsp.parseData(response)
+        tables = self.__get_tables(f"tables?tables={table}", verbose=verbose)
         if verbose:
             print("Done.")
-        return tsp.get_table()
+        return tables[0] if tables else None
 
     def __load_tables(self, *, only_names=False, include_shared_tables=False,
                       verbose=False):
@@ -218,29 +212,61 @@ class Tap:
             addedItem = True
         log.info("Retrieving tables...")
         if flags != "":
-            response = self.__connHandler.execute_tapget(f"tables?{flags}", verbose=verbose)
+            tables = self.__get_tables(f"tables?{flags}", verbose=verbose)
         else:
-            response = self.__connHandler.execute_tapget("tables",
-                                                         verbose=verbose)
+            tables = self.__get_tables("tables", verbose=verbose)
+        if only_names:
+            # the columns are loaded table by table when accessed
+            for table in tables:
+                table.set_column_loader(self.load_table)
+        log.info("Done.")
+        return tables
+
+    def __get_tables(self, subcontext, *, verbose=False):
+        """Returns the tables of a VOSI tables request, revalidating the
+        tables in the schema cache (see `astroquery.utils.tap.conf`) with the
+        service instead of downloading them again if possible"""
+        cache, key, cached, headers = None, None, None, None
+        if conf.schema_cache:
+            cache = TapSchemaCache(timeout=conf.result_cache_timeout,
+                                   max_size=conf.result_cache_max_size * 2**20)
+            key = cache.get_key(self.__url, subcontext,
+                                user=self._get_cache_user())
+            cached = cache.get(key)
+        if cached is not None:
+            (etag, last_modified), tables = cached
+            headers = {}
+            if etag is not None:
+                headers['If-None-Match'] = etag
+            if last_modified is not None:
+                headers['If-Modified-Since'] = last_modified
+        response = self.__connHandler.execute_tapget(subcontext,
+                                                     verbose=verbose,
+                                                     headers=headers)
         if verbose:
             print(response.status, response.reason)
-        isError = self.__connHandler.check_launch_response_status(response,
-                                                                  verbose,
-                                                                  200)
-        if isError:
-            log.info(f"{response.status} {response.reason}")
-            raise requests.exceptions.HTTPError(response.reason)
-            return None
+        if cached is not None and response.status == 304:
+            response.read()
+            log.info("Cached tables are up to date.")
+            return tables
+        self.__connHandler.check_launch_response_status(response, verbose, 200)
         log.info("Parsing tables...")
         tsp = TableSaxParser()
         tsp.parseData(response)
-        log.info("Done.")
-        return tsp.get_tables()
+        tables = tsp.get_tables()
+        if cache is not None:
+            response_headers = response.getheaders() or []
+            etag = self.__connHandler.find_header(response_headers, 'ETag')
+            last_modified = self.__connHandler.find_header(response_headers,
+                                                           'Last-Modified')
+            if etag is not None or last_modified is not None:
+                cache.put(key, ((etag, last_modified), tables))
+        return tables
 
     def launch_job(self, query, *, name=None, output_file=None,
                    output_format="votable", verbose=False,
                    dump_to_file=False, upload_resource=None,
-                   upload_table_name=None, maxrec=None):
+                   upload_table_name=None, maxrec=None, decompress=False):
         """Launches a synchronous job
 
         Parameters
@@ -265,19 +291,40 @@ class Tap:
             This argument is required if upload_resource is provided.
         maxrec : int, optional, default None
             maximum number of rows to return (TAP ``MAXREC`` parameter)
+        decompress : bool, optional, default False
+            if True and dump_to_file is True, gzip compressed results are
+            decompressed while they are saved, and the '.gz' extension is not
+            added to the name of the output file
 
         Returns
         -------
         A Job object
         """
-        output_file_updated = taputils.get_suitable_output_file_name_for_current_output_format(output_file,
-                                                                                               output_format)
+        if dump_to_file and decompress:
+            output_file_updated = output_file
+        else:
+            output_file_updated = taputils.get_suitable_output_file_name_for_current_output_format(output_file,
+                                                                                                   output_format)
         query = taputils.set_top_in_query(query, 2000)
         if verbose:
             print(f"Launched query: '{query}'")
+        if upload_resource is not None and upload_table_name is None:
+            raise ValueError("Table name is required when a resource is uploaded")
+        cache, cache_key = None, None
+        if not dump_to_file:
+            cache, cache_key = self.__get_result_cache(query, output_format,
+                                                       upload_resource,
+                                                       upload_table_name,
+                                                       maxrec)
+        if cache is not None:
+            results = cache.get(cache_key)
+            if results is not None:
+                if verbose:
+                    print("Results found in the cache.")
+                return self.__get_cached_job(False, query, results,
+                                             output_file, output_file_updated,
+                                             output_format)
         if upload_resource is not None:
-            if upload_table_name is None:
-                raise ValueError("Table name is required when a resource is uploaded")
             response = self.__launchJobMultipart(query=query,
                                                  uploadResource=upload_resource,
                                                  uploadTableName=upload_table_name,
@@ -322,6 +369,8 @@ class Tap:
                                                                headers,
                                                                isError,
                                                                output_format)
+        if dump_to_file and decompress:
+            suitableOutputFile = taputils.get_decompressed_output_file(suitableOutputFile)
         job.outputFile = suitableOutputFile
         job.outputFileUser = output_file
         job.parameters['format'] = output_format
@@ -346,10 +395,14 @@ class Tap:
             if dump_to_file:
                 if verbose:
                     print(f"Saving results to: {suitableOutputFile}")
-                self.__connHandler.dump_to_file(suitableOutputFile, response)
+                self.__connHandler.dump_to_file(suitableOutputFile, response,
+                                                decompress=decompress,
+                                                verbose=verbose)
             else:
                 results = utils.read_http_response(response, output_format)
                 job.set_results(results)
+                if cache is not None:
+                    cache.put(cache_key, results)
             if verbose:
                 print("Query finished.")
             job._phase = 'COMPLETED'
@@ -359,7 +412,7 @@ class Tap:
                          output_format="votable", verbose=False,
                          dump_to_file=False, background=False,
                          upload_resource=None, upload_table_name=None,
-                         autorun=True, maxrec=None):
+                         autorun=True, maxrec=None, decompress=False):
         """Launches an asynchronous job
 
         Parameters
@@ -390,21 +443,42 @@ class Tap:
             so the framework can start the job.
         maxrec : int, optional, default None
             maximum number of rows to return (TAP ``MAXREC`` parameter)
+        decompress : bool, optional, default False
+            if True and dump_to_file is True, gzip compressed results are
+            decompressed while they are saved, and the '.gz' extension is not
+            added to the name of the output file
 
         Returns
         -------
         A Job object
         """
 
-        output_file_updated = taputils.get_suitable_output_file_name_for_current_output_format(output_file,
-                                                                                               output_format)
+        if dump_to_file and decompress:
+            output_file_updated = output_file
+        else:
+            output_file_updated = taputils.get_suitable_output_file_name_for_current_output_format(output_file,
+                                                                                                   output_format)
 
         if verbose:
             print(f"Launched query: '{query}'")
+        if upload_resource is not None and upload_table_name is None:
+            raise ValueError(
+                "Table name is required when a resource is uploaded")
+        cache, cache_key = None, None
+        if autorun and not background and not dump_to_file:
+            cache, cache_key = self.__get_result_cache(query, output_format,
+                                                       upload_resource,
+                                                       upload_table_name,
+                                                       maxrec)
+        if cache is not None:
+            results = cache.get(cache_key)
+            if results is not None:
+                if verbose:
+                    print("Results found in the cache.")
+                return self.__get_cached_job(True, query, results,
+                                             output_file, output_file_updated,
+                                             output_format)
         if upload_resource is not None:
-            if upload_table_name is None:
-                raise ValueError(
-                    "Table name is required when a resource is uploaded")
             response = self.__launchJobMultipart(query,
                                                  upload_resource,
                                                  upload_table_name,
@@ -434,6 +508,8 @@ class Tap:
                                                                headers,
                                                                isError,
                                                                output_format)
+        if dump_to_file and decompress:
+            suitableOutputFile = taputils.get_decompressed_output_file(suitableOutputFile)
         job.outputFile = suitableOutputFile
         job.outputFileUser = output_file
         job.set_response_status(response.status, response.reason)
@@ -464,9 +540,11 @@ class Tap:
                         print("Retrieving async. results...")
                     # saveResults or getResults will block (not background)
                     if dump_to_file:
-                        job.save_results(verbose=verbose)
+                        job.save_results(decompress=decompress, verbose=verbose)
                     else:
-                        job.get_results()
+                        results = job.get_results()
+                        if cache is not None:
+                            cache.put(cache_key, results)
                         log.info("Query finished.")
         return job
 
@@ -567,17 +645,21 @@ class Tap:
                 result = f"{result}&{k}={data[k]}"
         return result
 
-    def save_results(self, job, *, verbose=False):
+    def save_results(self, job, *, decompress=False, verbose=False):
         """Saves job results
 
         Parameters
         ----------
         job : Job, mandatory
             job
+        decompress : bool, optional, default False
+            if True, gzip compressed results are decompressed while they are
+            saved, and the '.gz' extension is not added to the name of the
+            output file
         verbose : bool, optional, default 'False'
             flag to display information about the process
         """
-        job.save_results(verbose=verbose)
+        job.save_results(decompress=decompress, verbose=verbose)
 
     def __launchJobMultipart(self, query, uploadResource, uploadTableName,
                              outputFormat, context, verbose, *, name=None,
@@ -643,6 +725,43 @@ class Tap:
             print(response.getheaders())
         return response
 
+    def _get_cache_user(self):
+        """Returns the user whose results are cached, None if anonymous"""
+        return None
+
+    def __get_result_cache(self, query, output_format, upload_resource,
+                           upload_table_name, maxrec):
+        """Returns the result cache and the key of the results of a job, or
+        (None, None) if the results are not cached (see
+        `astroquery.utils.tap.conf`)"""
+        if not conf.result_cache:
+            return None, None
+        cache = TapResultCache(timeout=conf.result_cache_timeout,
+                               max_size=conf.result_cache_max_size * 2**20)
+        key = cache.get_key(self.__url, query,
+                            output_format=output_format,
+                            upload_resource=upload_resource,
+                            upload_table_name=upload_table_name,
+                            maxrec=maxrec, user=self._get_cache_user())
+        return cache, key
+
+    def __get_cached_job(self, async_job, query, results, output_file,
+                         output_file_updated, output_format):
+        job = Job(async_job=async_job, query=query,
+                  connhandler=self.__connHandler)
+        if output_file_updated is None:
+            context = 'async' if async_job else 'sync'
+            date = datetime.now().strftime("%Y%m%d%H%M%S")
+            extension = self.__connHandler.get_suitable_extension_by_format(output_format)
+            output_file_updated = f"{context}_{date}{extension}"
+        job.outputFile = output_file_updated
+        job.outputFileUser = output_file
+        job.parameters['format'] = output_format
+        job.set_response_status(200, 'OK')
+        job.set_results(results)
+        job._phase = 'COMPLETED'
+        return job
+
     def __extract_sync_subcontext(self, location):
         pos = location.find('sync')
         if pos < 0:
@@ -800,6 +919,9 @@ class TapPlus(Tap):
         self.__pwd = None
         self.__isLoggedIn = False
 
+    def _get_cache_user(self):
+        return self.__user if self.__isLoggedIn else None
+
     def __set_client_id(self, client_id):
         if client_id:
             self.tap_client_id = client_id
@@ -253,13 +253,17 @@ class Job:
         self.results = results
         self.__resultInMemory = True
 
-    def save_results(self, *, verbose=False):
+    def save_results(self, *, decompress=False, verbose=False):
         """Saves job results
         If the job is asynchronous, this method will block until the results
         are available.
 
         Parameters
         ----------
+        decompress : bool, optional, default False
+            if True, gzip compressed results are decompressed while they are
+            saved, and the '.gz' extension is not added to the name of the
+            output file
         verbose : bool, optional, default 'False'
             flag to display information about the process
         """
@@ -292,12 +296,17 @@ class Job:
                     self.outputFile = taputils.get_suitable_output_file(
                         self.connHandler, True, None, response.getheaders(),
                         False, self.parameters['format'])
+                    if decompress:
+                        self.outputFile = taputils.get_decompressed_output_file(
+                            self.outputFile)
                     output = self.outputFile
                 else:
                     output = self.outputFileUser
                 if verbose:
                     print(f"Saving results to: {output}")
-                self.connHandler.dump_to_file(output, response)
+                self.connHandler.dump_to_file(output, response,
+                                              decompress=decompress,
+                                              verbose=verbose)
 
     def wait_for_job_end(self, *, verbose=False):
         """Waits until a job is finished
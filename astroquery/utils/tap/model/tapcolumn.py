@@ -20,6 +20,9 @@ class TapColumn:
     """TAP column object
     """
 
+    __slots__ = ('name', 'description', 'unit', 'ucd', 'utype', 'datatype',
+                 'arraysize', 'flag', 'flags')
+
     def __init__(self, flags):
         """
         Constructor
@@ -34,6 +37,15 @@ class TapColumn:
         self.flag = None
         self.flags = flags
 
+    @property
+    def data_type(self):
+        """Alias of datatype"""
+        return self.datatype
+
+    @data_type.setter
+    def data_type(self, data_type):
+        self.datatype = data_type
+
     def __str__(self):
         return f"TAP Column name: {self.name}" \
             f"\nDescription: {self.description}" \
@@ -44,3 +56,10 @@ class TapColumn:
             f"\nArraySize: {self.arraysize}" \
             f"\nFlag: {self.flag}" \
             f"\nFlags: {self.flags}"
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
@@ -20,14 +20,56 @@ class TapTableMeta:
     """TAP table metadata object
     """
 
+    __slots__ = ('name', 'schema', 'description', '_columns',
+                 '_column_loader')
+
     def __init__(self):
         """Constructor
         """
-        self.columns = []
+        self._columns = []
+        self._column_loader = None
         self.name = None
         self.schema = None
         self.description = None
 
+    @property
+    def columns(self):
+        """Table TAP columns, loaded on first access if the table was loaded
+        without them"""
+        if self._column_loader is not None:
+            # services either qualify the table names or not
+            name = self.name
+            if self.schema is not None and '.' not in str(name):
+                name = self.get_qualified_name()
+            self._columns = list(self._column_loader(name).columns)
+            self._column_loader = None
+        return self._columns
+
+    @columns.setter
+    def columns(self, columns):
+        self._columns = columns
+        self._column_loader = None
+
+    def set_column_loader(self, loader):
+        """Defers loading the columns until they are accessed
+
+        Parameters
+        ----------
+        loader : callable, mandatory
+            function returning the TAP table object with columns of a table
+            name (e.g. `~astroquery.utils.tap.TapPlus.load_table`)
+        """
+        self._column_loader = loader
+
+    def __getstate__(self):
+        # the loader is bound to a connection and is not persisted, nor are
+        # the columns loaded for it
+        return (self.name, self.schema, self.description, self._columns)
+
+    def __setstate__(self, state):
+        self.name, self.schema, self.description, self._columns = state
+        self._column_loader = None
+
     def get_qualified_name(self):
         """Returns the qualified TAP table name. I.e. schema+table
 
@@ -45,9 +87,9 @@ class TapTableMeta:
         tap_column : TAP Column object, mandatory
             table TAP column
         """
-        self.columns.append(tap_column)
+        self._columns.append(tap_column)
 
     def __str__(self):
         return f"TAP Table name: {self.get_qualified_name()}" \
             f"\nDescription: {self.description}" \
-            f"\nNum. columns: {len(self.columns)}"
+            f"\nNum. columns: {len(self._columns)}"
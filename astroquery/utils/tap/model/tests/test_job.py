@@ -74,6 +74,34 @@ def test_job_get_results(capsys, tmpdir):
     assert 'Saving results to:' in capsys.readouterr().out
 
 
+def test_job_save_results_decompress(monkeypatch):
+    job = Job(async_job=True)
+    jobid = "12345"
+    job.jobid = jobid
+    job.parameters['format'] = "votable"
+    responseCheckPhase = DummyResponse(200)
+    responseCheckPhase.set_data(method='GET', body='COMPLETED')
+    responseGetData = DummyResponse(200)
+    responseGetData.set_data(method="GET", body="results")
+    connHandler = DummyConnHandler()
+    # name of the compressed results in the response headers
+    connHandler.fileOutput = "result.vot.gz"
+    connHandler.set_response(f"async/{jobid}/phase", responseCheckPhase)
+    connHandler.set_response(f"async/{jobid}/results/result", responseGetData)
+    dumps = []
+    monkeypatch.setattr(connHandler, 'dump_to_file',
+                        lambda output, response, **kwargs: dumps.append((output, kwargs)))
+    job.connHandler = connHandler
+
+    job.save_results()
+    assert job.outputFile == "result.vot.gz"
+    assert dumps[-1] == ("result.vot.gz", {'decompress': False, 'verbose': False})
+
+    job.save_results(decompress=True)
+    assert job.outputFile == "result.vot"
+    assert dumps[-1] == ("result.vot", {'decompress': True, 'verbose': False})
+
+
 def test_job_phase():
     job = Job(async_job=True)
     jobid = "12345"
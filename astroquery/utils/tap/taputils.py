@@ -242,6 +242,23 @@ def get_suitable_output_file(conn_handler, async_job, output_file, headers,
     return file_name
 
 
+def get_decompressed_output_file(output_file):
+    """
+    Returns the name of the output file without the extension of the gzip
+    compression, for results decompressed while they are saved.
+
+    output_file : str, mandatory
+        file name
+
+    Returns
+    -------
+    A string with the file name without the trailing '.gz'.
+    """
+    if output_file is not None and output_file.endswith('.gz'):
+        return output_file[:-len('.gz')]
+    return output_file
+
+
 def get_suitable_output_file_name_for_current_output_format(output_file, output_format):
     """
     Renames the name given for the output_file if the results for current_output
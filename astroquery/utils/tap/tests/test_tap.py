@@ -12,6 +12,8 @@ European Space Agency (ESA)
 
 Created on 30 jun. 2016
 """
+import os
+import pickle
 from pathlib import Path
 from unittest.mock import patch
 from urllib.parse import quote_plus, urlencode
@@ -25,7 +27,8 @@ from astroquery.utils.tap.model.tapcolumn import TapColumn
 from astroquery.utils.tap.conn.tests.DummyConnHandler import DummyConnHandler
 from astroquery.utils.tap.conn.tests.DummyResponse import DummyResponse
 from astroquery.utils.tap.core import TapPlus
-from astroquery.utils.tap import taputils
+from astroquery.utils.tap import conf, taputils
+from astroquery.utils.tap.cache import TapResultCache, normalize_query
 
 
 TEST_DATA = {f.name: f.read_text() for f in Path(__file__).with_name("data").iterdir()}
@@ -135,6 +138,71 @@ def test_load_table():
     __check_column(col, 'Table1 Column2 desc', '', 'INTEGER', None)
 
 
+def test_load_tables_lazy_columns():
+    connHandler = DummyConnHandler()
+    tap = TapPlus(url="http://test:1111/tap", connhandler=connHandler)
+    responseLoadTables = DummyResponse(200)
+    responseLoadTables.set_data(method='GET', body=TEST_DATA["test_tables.xml"])
+    connHandler.set_response("tables?only_tables=true", responseLoadTables)
+    responseLoadTable = DummyResponse(200)
+    responseLoadTable.set_data(method='GET', body=TEST_DATA["test_table1.xml"])
+    connHandler.set_response("tables?tables=public.table1", responseLoadTable)
+
+    table = __find_table('public', 'table1', tap.load_tables(only_names=True))
+    assert connHandler.request == "tables?only_tables=true"
+    # printing or pickling the table does not load the columns
+    str(table)
+    pickle.dumps(table)
+    assert connHandler.request == "tables?only_tables=true"
+    columns = table.columns
+    assert connHandler.request == "tables?tables=public.table1"
+    assert [column.name for column in columns] == ['table1_col1', 'table1_col2']
+
+    # the columns are loaded once
+    connHandler.request = None
+    assert table.columns is columns
+    assert connHandler.request is None
+
+
+def test_load_tables_schema_cache(tmp_path):
+    connHandler = DummyConnHandler()
+    tap = TapPlus(url="http://test:1111/tap", connhandler=connHandler)
+    responseLoadTable = DummyResponse(200)
+    responseLoadTable.set_data(method='GET', body=TEST_DATA["test_tables.xml"],
+                               headers=[('ETag', '"v1"')])
+    connHandler.set_response("tables", responseLoadTable)
+
+    with patch('astroquery.utils.tap.cache.paths.get_cache_dir',
+               return_value=str(tmp_path)):
+        tables = tap.load_tables()
+        assert connHandler.requestHeaders is None
+        assert len(list(tmp_path.rglob('*.pickle'))) == 1
+
+        # the cached tables are revalidated
+        responseLoadTable.set_status_code(304)
+        cached = tap.load_tables()
+        assert connHandler.requestHeaders == {'If-None-Match': '"v1"'}
+        assert [t.get_qualified_name() for t in cached] == \
+            [t.get_qualified_name() for t in tables]
+        assert [len(t.columns) for t in cached] == [2, 3]
+        table = __find_table('public', 'table2', cached)
+        __check_column(__find_column('table2_col1', table.columns),
+                       'Table2 Column1 desc', '', 'VARCHAR', 'indexed')
+
+        # and downloaded again if they changed
+        responseLoadTable.set_status_code(200)
+        assert len(tap.load_tables()) == 2
+
+        with conf.set_temp('schema_cache', False):
+            tap.load_tables()
+            assert connHandler.requestHeaders is None
+
+        # the cached metadata expires like the cached results
+        with conf.set_temp('result_cache_timeout', -1):
+            tap.load_tables()
+            assert connHandler.requestHeaders is None
+
+
 def test_launch_sync_job():
     connHandler = DummyConnHandler()
     tap = TapPlus(url="http://test:1111/tap", connhandler=connHandler)
@@ -189,6 +257,118 @@ def test_launch_sync_job():
                            np.int32)
 
 
+def test_launch_sync_job_decompress(monkeypatch, tmp_path):
+    connHandler = DummyConnHandler()
+    tap = TapPlus(url="http://test:1111/tap", connhandler=connHandler)
+    responseLaunchJob = DummyResponse(200)
+    responseLaunchJob.set_data(method='POST', body=TEST_DATA["job_1.vot"])
+    query = 'select top 5 * from table'
+    dictTmp = {
+        "REQUEST": "doQuery",
+        "LANG": "ADQL",
+        "FORMAT": "votable",
+        "tapclient": str(tap.tap_client_id),
+        "PHASE": "RUN",
+        "QUERY": quote_plus(query)}
+    sortedKey = taputils.taputil_create_sorted_dict_key(dictTmp)
+    connHandler.set_response(f"sync?{sortedKey}", responseLaunchJob)
+    dumps = []
+    monkeypatch.setattr(connHandler, 'dump_to_file',
+                        lambda output, response, **kwargs: dumps.append((output, kwargs)))
+    output_file = str(tmp_path / "results.vot")
+
+    job = tap.launch_job(query, output_file=output_file, dump_to_file=True,
+                         decompress=True)
+    assert job.outputFile == output_file
+    assert dumps == [(output_file, {'decompress': True, 'verbose': False})]
+
+    with pytest.warns(UserWarning, match='compressed format'):
+        job = tap.launch_job(query, output_file=output_file, dump_to_file=True)
+    assert job.outputFile == output_file + '.gz'
+    assert dumps[1] == (output_file + '.gz', {'decompress': False, 'verbose': False})
+
+
+def test_get_decompressed_output_file():
+    assert taputils.get_decompressed_output_file("results.vot.gz") == "results.vot"
+    assert taputils.get_decompressed_output_file("results.vot") == "results.vot"
+    assert taputils.get_decompressed_output_file(None) is None
+
+
+def test_launch_sync_job_result_cache(tmp_path):
+    connHandler = DummyConnHandler()
+    tap = TapPlus(url="http://test:1111/tap", connhandler=connHandler)
+    responseLaunchJob = DummyResponse(200)
+    responseLaunchJob.set_data(method='POST', body=TEST_DATA["job_1.vot"])
+    query = 'select top 5 * from table'
+    dictTmp = {
+        "REQUEST": "doQuery",
+        "LANG": "ADQL",
+        "FORMAT": "votable",
+        "tapclient": str(tap.tap_client_id),
+        "PHASE": "RUN",
+        "QUERY": quote_plus(query)}
+    sortedKey = taputils.taputil_create_sorted_dict_key(dictTmp)
+    connHandler.set_response(f"sync?{sortedKey}", responseLaunchJob)
+    dictTmp['MAXREC'] = 10
+    sortedKey = taputils.taputil_create_sorted_dict_key(dictTmp)
+    connHandler.set_response(f"sync?{sortedKey}", responseLaunchJob)
+
+    with patch('astroquery.utils.tap.cache.paths.get_cache_dir',
+               return_value=str(tmp_path)), conf.set_temp('result_cache', True):
+        results = tap.launch_job(query).get_results()
+        assert len(list(tmp_path.rglob('*.pickle'))) == 1
+
+        # the server is not queried again, even if the layout of the query
+        # differs
+        responseLaunchJob.set_status_code(500)
+        job = tap.launch_job('select  top 5\n * from table;')
+        assert job.get_phase() == 'COMPLETED'
+        assert job.failed is False
+        assert (job.get_results() == results).all()
+
+        with pytest.raises(HTTPError):
+            tap.launch_job(query, maxrec=10)
+
+    with pytest.raises(HTTPError):
+        tap.launch_job(query)
+
+
+def test_result_cache(tmp_path):
+    assert normalize_query("select  *\n  from t where a = 'x  y' ; ") == \
+        "select * from t where a = 'x  y'"
+    key = TapResultCache.get_key('host:80/tap', 'select * from t',
+                                 output_format='votable')
+    assert key == TapResultCache.get_key('host:80/tap', 'select *  from t;',
+                                         output_format='votable')
+    assert key != TapResultCache.get_key('host:80/tap', 'select * from t',
+                                         output_format='csv')
+    assert key != TapResultCache.get_key('host:80/tap', 'select * from t',
+                                         output_format='votable', user='me')
+
+    cache = TapResultCache(location=tmp_path, timeout=60, max_size=None)
+    assert cache.get(key) is None
+    cache.put(key, [1, 2, 3])
+    assert cache.get(key) == [1, 2, 3]
+
+    # expired results are discarded
+    cache.timeout = -1
+    assert cache.get(key) is None
+    assert not list(tmp_path.iterdir())
+
+    # the least recently used results are evicted first
+    cache.timeout = None
+    cache.put('a', list(range(100)))
+    cache.put('b', list(range(100)))
+    size = tmp_path.joinpath('a.pickle').stat().st_size
+    os.utime(tmp_path.joinpath('a.pickle'), (0, 0))
+    cache.max_size = 2 * size
+    cache.put('c', list(range(100)))
+    assert sorted(path.stem for path in tmp_path.iterdir()) == ['b', 'c']
+
+    cache.clear()
+    assert not list(tmp_path.iterdir())
+
+
 def test_launch_sync_job_redirect():
     connHandler = DummyConnHandler()
     tap = TapPlus(url="http://test:1111/tap", connhandler=connHandler)
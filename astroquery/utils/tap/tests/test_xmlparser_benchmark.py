@@ -0,0 +1,90 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""
+=============
+TAP plus
+=============
+
+Benchmarks of the parsing of the UWS, VOSI and results fixtures
+"""
+import io
+import re
+from pathlib import Path
+
+import pytest
+
+from astroquery.utils.tap.xmlparser import utils
+from astroquery.utils.tap.xmlparser.jobListSaxParser import JobListSaxParser
+from astroquery.utils.tap.xmlparser.jobSaxParser import JobSaxParser
+from astroquery.utils.tap.xmlparser.tableSaxParser import TableSaxParser
+
+pytestmark = pytest.mark.benchmark
+
+DATA = Path(__file__).with_name("data")
+XMLPARSER_DATA = Path(__file__).parent.parent.joinpath("xmlparser", "tests", "data")
+
+# elements of the long documents, made of repeated elements of the fixtures
+N_JOBS = 10000
+N_TABLES = 4000
+
+
+def repeat_elements(content, tag, number):
+    """Returns the document with the elements from the first to the last
+    ``tag`` element repeated to make ``number`` elements"""
+    starts = [match.start() for match in re.finditer(b'<' + re.escape(tag) + rb'[\s>]', content)]
+    start = starts[0]
+    end = content.rindex(b'</' + tag + b'>') + len(tag) + 3
+    count = len(starts)
+    return (content[:start] + content[start:end] * (number // count)
+            + content[end:])
+
+
+def parse_jobs_list(content):
+    return JobListSaxParser(async_job=True).parseData(io.BytesIO(content))
+
+
+def parse_jobs(content):
+    return JobSaxParser(async_job=True).parseData(io.BytesIO(content))
+
+
+def parse_tables(content):
+    parser = TableSaxParser()
+    parser.parseData(io.BytesIO(content))
+    return parser.get_tables()
+
+
+@pytest.mark.parametrize(('parse', 'path', 'number'), [
+    (parse_jobs_list, DATA / "jobs_list.xml", 2),
+    (parse_jobs, XMLPARSER_DATA / "test_jobs_async.xml", 2),
+    (parse_tables, DATA / "test_tables.xml", 2),
+    (parse_tables, DATA / "test_table1.xml", 1),
+    (parse_tables, DATA / "test_table_rename.xml", 1),
+    (parse_tables, DATA / "test_table_update.xml", 1)],
+    ids=lambda value: getattr(value, 'name', None))
+def test_parse_fixture(measure, parse, path, number):
+    content = path.read_bytes()
+
+    result = measure(parse, content, repeat=1000)
+
+    assert len(result) == number
+
+
+def test_parse_results_fixture(measure):
+    content = (DATA / "job_1.vot").read_bytes()
+
+    result = measure(lambda: utils.read_http_response(io.BytesIO(content), 'votable'),
+                     repeat=100)
+
+    assert len(result) == 3
+
+
+@pytest.mark.parametrize(('parse', 'path', 'tag', 'number'), [
+    (parse_jobs_list, DATA / "jobs_list.xml", b'uws:jobref', N_JOBS),
+    (parse_jobs, XMLPARSER_DATA / "test_jobs_async.xml", b'uws:job', N_JOBS),
+    (parse_tables, DATA / "test_tables.xml", b'table', N_TABLES)],
+    ids=lambda value: getattr(value, 'name', None))
+def test_parse_long_document(measure, parse, path, tag, number):
+    content = repeat_elements(path.read_bytes(), tag, number)
+
+    result = measure(parse, content)
+
+    assert len(result) == number
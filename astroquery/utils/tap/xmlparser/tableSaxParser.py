@@ -15,20 +15,34 @@ Created on 30 jun. 2016
 
 """
 
-import xml.sax
-
 from astroquery.utils.tap.model.taptable import TapTableMeta
 from astroquery.utils.tap.model.tapcolumn import TapColumn
 from astroquery.utils.tap.xmlparser import utils as Utils
 
-READING_SCHEMA = 10
-READING_TABLE = 20
-READING_TABLE_COLUMN = 30
+VOSI_SCHEMA = "schema"
+VOSI_TABLE = "table"
+VOSI_COLUMN = "column"
+VOSI_NAME = "name"
+
+# VOSI elements (lower case names) -> TapTableMeta attributes
+TABLE_ATTRIBUTES = {
+    "name": "name",
+    "description": "description"}
 
+# VOSI elements (lower case names) -> TapColumn attributes
+COLUMN_ATTRIBUTES = {
+    "name": "name",
+    "description": "description",
+    "unit": "unit",
+    "ucd": "ucd",
+    "utype": "utype",
+    "datatype": "datatype",
+    "flag": "flag"}
 
-class TableSaxParser(xml.sax.ContentHandler):
+
+class TableSaxParser:
     '''
-    classdocs
+    VOSI tables parser
     '''
 
     def __init__(self):
@@ -38,135 +52,57 @@ class TableSaxParser(xml.sax.ContentHandler):
         self.__internal_init()
 
     def __internal_init(self):
-        self.__concatData = False
-        self.__charBuffer = []
         self.__tables = []
-        self.__status = 0
-        self.__currentSchemaName = None
-        self.__currentTable = None
-        self.__currentColumn = None
-
-    def __create_string_from_buffer(self):
-        return Utils.util_create_string_from_buffer(self.__charBuffer)
-
-    def __check_item_id(self, itemId, tmpValue):
-        if str(itemId).lower() == str(tmpValue).lower():
-            return True
-        return False
-
-    def __start_reading_data(self):
-        self.__concatData = True
-        del self.__charBuffer[:]
-
-    def __stop_reading_data(self):
-        self.__concatData = False
 
     def parseData(self, data):
         del self.__tables[:]
-        self.__status = READING_SCHEMA
-        xml.sax.parse(data, self)
+        # tables of the schema being read
+        tables = []
+        for element in Utils.util_iterparse(data):
+            name = Utils.util_get_local_name(element.tag)
+            if name == VOSI_TABLE:
+                tables.append(self.__create_table(element))
+                element.clear()
+            elif name == VOSI_SCHEMA:
+                schema = None
+                for child in element:
+                    if Utils.util_get_local_name(child.tag) == VOSI_NAME:
+                        schema = Utils.util_get_text(child)
+                        break
+                for table in tables:
+                    table.schema = schema
+                self.__tables.extend(tables)
+                tables = []
+                element.clear()
+        self.__tables.extend(tables)
         return self.__tables
 
-    def startElement(self, name, attrs):
-        if self.__status == READING_SCHEMA:
-            self.__reading_schema(name, attrs)
-        elif self.__status == READING_TABLE:
-            self.__reading_table(name, attrs)
-        elif self.__status == READING_TABLE_COLUMN:
-            self.__reading_table_column(name, attrs)
-
-    def endElement(self, name):
-        if self.__status == READING_SCHEMA:
-            self.__end_schema(name)
-        elif self.__status == READING_TABLE:
-            self.__end_table(name)
-        elif self.__status == READING_TABLE_COLUMN:
-            self.__end_table_column(name)
-
-    def characters(self, content):
-        if self.__concatData:
-            self.__charBuffer.append(content)
-
-    def __reading_schema(self, name, attrs):
-        if self.__check_item_id("name", name):
-            self.__start_reading_data()
-        if self.__check_item_id("table", name):
-            self.__status = READING_TABLE
-            self.__currentTable = TapTableMeta()
-            self.__currentTable.schema = self.__currentSchemaName
-
-    def __end_schema(self, name):
-        if self.__check_item_id("name", name):
-            self.__currentSchemaName = self.__create_string_from_buffer()
-            self.__stop_reading_data()
-
-    def __reading_table(self, name, attrs):
-        if self.__check_item_id("name", name):
-            self.__start_reading_data()
-        elif self.__check_item_id("description", name):
-            self.__start_reading_data()
-        elif self.__check_item_id("column", name):
-            self.__status = READING_TABLE_COLUMN
-            self.__currentColumn = TapColumn(attrs.getValue('esatapplus:flags'))
-
-    def __end_table(self, name):
-        if self.__check_item_id("name", name):
-            self.__stop_reading_data()
-            self.__currentTable.name = self.__create_string_from_buffer()
-        elif self.__check_item_id("description", name):
-            self.__stop_reading_data()
-            self.__currentTable.description = self.__create_string_from_buffer()
-        elif self.__check_item_id("table", name):
-            self.__tables.append(self.__currentTable)
-            self.__status = READING_SCHEMA
-
-    def __reading_table_column(self, name, attrs):
-        if self.__check_item_id("name", name):
-            self.__start_reading_data()
-        elif self.__check_item_id("description", name):
-            self.__start_reading_data()
-        elif self.__check_item_id("unit", name):
-            self.__start_reading_data()
-        elif self.__check_item_id("ucd", name):
-            self.__start_reading_data()
-        elif self.__check_item_id("utype", name):
-            self.__start_reading_data()
-        elif self.__check_item_id("datatype", name):
-            self.__start_reading_data()
-        elif self.__check_item_id("flag", name):
-            self.__start_reading_data()
-
-    def __end_table_column(self, name):
-        if self.__check_item_id("name", name):
-            self.__currentColumn.name = self.__create_string_from_buffer()
-            self.__stop_reading_data()
-        elif self.__check_item_id("description", name):
-            self.__currentColumn.description = self.__create_string_from_buffer()
-            self.__stop_reading_data()
-        elif self.__check_item_id("unit", name):
-            self.__currentColumn.unit = self.__create_string_from_buffer()
-            self.__stop_reading_data()
-        elif self.__check_item_id("ucd", name):
-            self.__currentColumn.ucd = self.__create_string_from_buffer()
-            self.__stop_reading_data()
-        elif self.__check_item_id("utype", name):
-            self.__currentColumn.utype = self.__create_string_from_buffer()
-            self.__stop_reading_data()
-        elif self.__check_item_id("datatype", name):
-            self.__currentColumn.data_type = self.__create_string_from_buffer()
-            self.__stop_reading_data()
-        elif self.__check_item_id("flag", name):
-            self.__currentColumn.flag = self.__create_string_from_buffer()
-            self.__stop_reading_data()
-        if self.__check_item_id("column", name):
-            self.__status = READING_TABLE
-            self.__currentTable.add_column(self.__currentColumn)
-
-    def __show_attributes(self, attrs):
-        return str(attrs.getNames())
-
-    def __nothing(self, name, attrs):
-        pass
+    @staticmethod
+    def __create_table(element):
+        table = TapTableMeta()
+        for child in element:
+            name = Utils.util_get_local_name(child.tag)
+            if name == VOSI_COLUMN:
+                table.add_column(TableSaxParser.__create_column(child))
+            else:
+                attribute = TABLE_ATTRIBUTES.get(name)
+                if attribute is not None:
+                    setattr(table, attribute, Utils.util_get_text(child))
+        return table
+
+    @staticmethod
+    def __create_column(element):
+        flags = None
+        for key, value in element.attrib.items():
+            if Utils.util_get_local_name(key) == "flags":
+                flags = value
+                break
+        column = TapColumn(flags)
+        for child in element:
+            attribute = COLUMN_ATTRIBUTES.get(Utils.util_get_local_name(child.tag))
+            if attribute is not None:
+                setattr(column, attribute, Utils.util_get_text(child))
+        return column
 
     def get_table(self):
         if len(self.__tables) < 1:
@@ -15,7 +15,14 @@ Created on 30 jun. 2016
 
 """
 
+import gzip
+import io
 import os
+
+import pytest
+from astropy import units as u
+from astropy.table import Table
+
 from astroquery.utils.tap.xmlparser.tableSaxParser import TableSaxParser
 from astroquery.utils.tap.xmlparser.jobListSaxParser import JobListSaxParser
 from astroquery.utils.tap.xmlparser.jobSaxParser import JobSaxParser
@@ -49,6 +56,28 @@ def test_jobs_parser():
     file.close()
 
 
+def test_jobs_parser_namespace():
+    # UWS elements are recognised by their namespace, not by their prefix
+    data = io.BytesIO(b"""<?xml version="1.0" encoding="UTF-8"?>
+<job xmlns="http://www.ivoa.net/xml/UWS/v1.0" xmlns:x="http://example.org">
+  <jobId>1479386030738O</jobId>
+  <ownerId>anonymous</ownerId>
+  <phase>COMPLETED</phase>
+  <parameters>
+    <parameter id="query"><![CDATA[select * from t where a < 1]]></parameter>
+    <parameter id="format">votable</parameter>
+  </parameters>
+  <jobInfo><x:name>other</x:name></jobInfo>
+</job>""")
+    jobs = JobSaxParser(async_job=True).parseData(data)
+    assert len(jobs) == 1
+    __check_job(jobs[0], "1479386030738O", "COMPLETED", "anonymous")
+    assert jobs[0].async_ is True
+    assert jobs[0].name is None
+    assert jobs[0].parameters == {'query': 'select * from t where a < 1',
+                                  'format': 'votable'}
+
+
 def test_table_list_parser():
     fileName = data_path('test_tables.xml')
     file = open(fileName, 'r')
@@ -74,6 +103,13 @@ def test_job_results_parser():
     file.close()
 
 
+def test_job_results_parser_gzip():
+    with open(data_path('test_job_results.xml'), 'rb') as file:
+        content = gzip.compress(file.read())
+    resultTable = utils.read_http_response(io.BytesIO(content), 'votable')
+    assert len(resultTable.columns) == 57
+
+
 def __check_table(table, baseName, numColumns, columnsData):
     qualifiedName = f"public.{baseName}"
     assert str(table.get_qualified_name()) == str(qualifiedName)
@@ -89,3 +125,18 @@ def __check_job(job, jobid, jobPhase, jobOwner):
     assert str(p) == str(jobPhase)
     o = job.ownerid
     assert str(o) == str(jobOwner)
+
+
+@pytest.mark.parametrize(('output_format', 'write_kwargs'), [
+    ('application/x-votable+xml;serialization=BINARY2',
+     {'format': 'votable', 'tabledata_format': 'binary2'}),
+    ('application/x-votable+xml', {'format': 'votable'}),
+    ('application/fits', {'format': 'fits'})])
+def test_job_results_parser_media_type(output_format, write_kwargs):
+    table = Table({'source_id': [1, 2, 3], 'ra': [0.5, 1.5, 2.5] * u.deg})
+    content = io.BytesIO()
+    table.write(content, **write_kwargs)
+    resultTable = utils.read_http_response(io.BytesIO(content.getvalue()),
+                                           output_format)
+    assert resultTable['source_id'].tolist() == [1, 2, 3]
+    assert resultTable['ra'].unit == u.deg
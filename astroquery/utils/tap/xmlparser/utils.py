@@ -14,28 +14,88 @@ Created on 30 jun. 2016
 
 
 """
+import functools
 import gzip
 import io
+from xml.etree import ElementTree
+
 from astropy import units as u
 from astropy.table import Table as APTable
 
+# astropy readers of the media types of the TAP RESPONSEFORMAT parameter, with
+# which standard services are asked for e.g. binary VOTables
+# ('application/x-votable+xml;serialization=BINARY2')
+_MEDIA_TYPE_FORMATS = {'application/x-votable+xml': 'votable',
+                       'text/xml': 'votable',
+                       'application/fits': 'fits',
+                       'text/csv': 'ascii.csv'}
+
 
 def util_create_string_from_buffer(buffer):
     return ''.join(map(str, buffer))
 
 
+@functools.lru_cache(maxsize=None)
+def util_get_local_name(tag, namespace=None):
+    """Returns the lower case name of an ElementTree tag without its namespace
+
+    The names are cached, so that each distinct tag of a document is only
+    split once.
+
+    Parameters
+    ----------
+    tag : str, mandatory
+        ElementTree tag ('{namespace uri}name')
+    namespace : str, optional, default None
+        part of the namespace URI the tag must belong to
+
+    Returns
+    -------
+    The name, or None if the tag does not belong to the namespace
+    """
+    uri, _, name = tag.rpartition('}')
+    if namespace is not None and namespace not in uri:
+        return None
+    return name.lower()
+
+
+def util_iterparse(data):
+    """Parses an XML document incrementally
+
+    Parameters
+    ----------
+    data : str or file object, mandatory
+        file name or file object (e.g. HTTP response), which is closed once
+        it is parsed
+
+    Returns
+    -------
+    An iterator over the elements, yielded as they end
+    """
+    try:
+        for _, element in ElementTree.iterparse(data):
+            yield element
+    finally:
+        if hasattr(data, 'close'):
+            data.close()
+
+
+def util_get_text(element):
+    """Returns the text of an element, an empty string if it has none"""
+    return element.text or ''
+
+
 def read_http_response(response, output_format, *, correct_units=True):
     astropy_format = get_suitable_astropy_format(output_format)
 
     # If we want to use astropy.table, we have to read the data
-    data = io.BytesIO(response.read())
+    data = response.read()
 
-    try:
-        result = APTable.read(io.BytesIO(gzip.decompress(data.read())), format=astropy_format)
-    except OSError:
-        # data is not a valid gzip file by BadGzipFile.
-        result = APTable.read(data, format=astropy_format)
-        pass
+    # Compressed results are recognised by the gzip magic number, rather
+    # than by attempting to decompress every response
+    if data[:2] == b'\x1f\x8b':
+        data = gzip.decompress(data)
+    result = APTable.read(io.BytesIO(data), format=astropy_format)
 
     if correct_units:
         modify_unrecognized_table_units(result)
@@ -50,7 +110,8 @@ def get_suitable_astropy_format(output_format):
         return 'ascii.csv'
     elif 'votable_plain' == output_format:
         return 'votable'
-    return output_format
+    media_type = output_format.split(';')[0].strip().lower()
+    return _MEDIA_TYPE_FORMATS.get(media_type, output_format)
 
 
 def modify_unrecognized_table_units(table):
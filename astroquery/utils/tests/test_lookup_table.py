@@ -0,0 +1,52 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+import re
+
+import pytest
+
+from ...utils.lookup_table import IndexedLookuptable, _required_literals
+
+SPECIES = ['H2O', 'HCCCH2OD', 'CO', '13CO', 'C17O', 'H2CO', 'CH3OH', 'H2C(CN)2',
+           'HC7N', 'c-C3H2', 'NH2CO2CH3 v=0 - Methyl Carbamate',
+           'CH3CHNH2COOH - I - α-Alanine']
+
+
+@pytest.mark.parametrize(('pattern', 'literals'),
+                         [(' CO ', [' CO ']),
+                          ('H2O$', ['H2O']),
+                          ('^CH3OH', ['CH3OH']),
+                          (r'H2C\(CN\)2', ['H2C(CN)2']),
+                          ('HC.N', ['HC', 'N']),
+                          ('CH3O?H', ['CH3', 'H']),
+                          ('C[0-9]+O', ['C', 'O']),
+                          (r'\bCO\b', ['CO']),
+                          (r'H\dO\s', ['H', 'O']),
+                          (r'H\x32O', []),
+                          (r'H\062O', []),
+                          (r'H\u0032O', []),
+                          (r'H\N{DIGIT TWO}O', []),
+                          (r'(C)O\1', []),
+                          ('H2O|CO', []),
+                          ('(?i)co', [])])
+def test_required_literals(pattern, literals):
+    assert _required_literals(pattern, 0) == literals
+
+
+@pytest.mark.parametrize('pattern', ['H2O', 'CO', 'CO$', '^CO', 'C.*O', 'H2O|CO',
+                                     r'H2C\(CN\)2', 'NH2CO2', 'α-Ala', 'ala', 'xyz', 'C',
+                                     r'H\x32O', r'H\062O', r'H\u0032O', r'\U00000048\dO',
+                                     r'\u03b1-Ala'])
+@pytest.mark.parametrize('flags', [0, re.IGNORECASE])
+def test_search_keys(pattern, flags):
+    table = IndexedLookuptable((name, ii) for ii, name in enumerate(SPECIES))
+    regex = re.compile(pattern, flags)
+    assert table._search_keys(pattern, flags) == [name for name in SPECIES
+                                                  if regex.search(name)]
+
+
+def test_index_cleared_on_update():
+    table = IndexedLookuptable((name, ii) for ii, name in enumerate(SPECIES))
+    assert table._search_keys('^H2CO') == ['H2CO']
+    table['H2CO+'] = 100
+    assert table._search_keys('^H2CO') == ['H2CO', 'H2CO+']
+    del table['H2CO']
+    assert table._search_keys('^H2CO') == ['H2CO+']
@@ -15,7 +15,7 @@ from astropy.table import Table
 import astropy.utils.data as aud
 from astropy.logger import log
 
-from ...utils import chunk_read, chunk_report, class_or_instance, commons
+from ...utils import chunk_read, chunk_report, class_or_instance, commons, conf
 from ...utils.process_asyncs import async_to_sync_docstr, async_to_sync
 from ...utils.docstr_chompers import remove_sections, prepend_docstr_nosections
 
@@ -431,6 +431,55 @@ def test_filecontainer_get(patch_getreadablefileobj):
     assert isinstance(ff, fits.HDUList)
 
 
+def test_filecontainer_get_memmap(patch_getreadablefileobj):
+    ffile = commons.FileContainer(fitsfilepath, encoding='binary')
+    ff = ffile.get_fits(memmap=True)
+    assert isinstance(ff, fits.HDUList)
+    assert ff._file.memmap
+    assert ffile.get_fits(memmap=True) is ff
+    ff.close()
+
+
+def test_get_fits_files(patch_getreadablefileobj):
+    ffiles = [commons.FileContainer(fitsfilepath, encoding='binary')
+              for i in range(3)]
+    hdulists = commons.get_fits_files(ffiles, max_workers=2, show_progress=False)
+    assert len(hdulists) == 3
+    assert all(isinstance(ff, fits.HDUList) for ff in hdulists)
+    assert [ffile._fits for ffile in ffiles] == hdulists
+
+
+def test_get_fits_files_progress(patch_getreadablefileobj, monkeypatch):
+    calls = []
+    get_fits = commons.FileContainer.get_fits
+
+    def mock_get_fits(self, **kwargs):
+        calls.append(kwargs)
+        return get_fits(self, **kwargs)
+
+    monkeypatch.setattr(commons.FileContainer, 'get_fits', mock_get_fits)
+    ffiles = [commons.FileContainer(fitsfilepath, encoding='binary')
+              for i in range(3)]
+
+    # only the overall progress is shown for concurrent downloads
+    commons.get_fits_files(ffiles)
+    assert calls == [dict(memmap=False, show_progress=False)] * 3
+
+    calls.clear()
+    with conf.set_temp('max_download_workers', 1):
+        commons.get_fits_files(ffiles)
+    assert calls == [dict(memmap=False)] * 3
+
+
+def test_filecontainer_get_memmap_after_read(patch_getreadablefileobj):
+    ffile = commons.FileContainer(fitsfilepath, encoding='binary')
+    ff = ffile.get_fits()
+    ff_memmap = ffile.get_fits(memmap=True)
+    assert ff_memmap is not ff
+    assert ff_memmap._file.memmap
+    ff_memmap.close()
+
+
 @pytest.mark.parametrize(('coordinates', 'expected'),
                          [("5h0m0s 0d0m0s", True),
                           ("m1", False)
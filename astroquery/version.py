@@ -0,0 +1,8 @@
+version = '0.4.7.dev'
+astropy_helpers_version = ''
+githash = ''
+major = 0
+minor = 4
+bugfix = 7
+release = False
+debug = False
@@ -42,6 +42,16 @@ class Conf(_config.ConfigNamespace):
         'Maximum number of rows that will be fetched from the result '
         '(set to -1 for unlimited).')
 
+    batch_size = _config.ConfigItem(
+        10000,
+        'Maximum number of targets sent in a single region query; queries '
+        'with more targets are split into several requests.')
+
+    max_concurrent_queries = _config.ConfigItem(
+        2,
+        'Maximum number of requests sent to VizieR at the same time when '
+        'a region query is split.')
+
 
 conf = Conf()
 
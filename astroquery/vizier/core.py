@@ -7,8 +7,11 @@ import json
 import copy
 import re
 
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
+import numpy as np
+
 import astropy.units as u
 import astropy.coordinates as coord
 import astropy.table as tbl
@@ -45,6 +48,9 @@ class VizierClass(BaseQuery):
         schema.Or([_str_schema], _str_schema, None),
         error="catalog must be a list of strings or a single string")
 
+    BATCH_SIZE = conf.batch_size
+    MAX_CONCURRENT_QUERIES = conf.max_concurrent_queries
+
     def __init__(self, *, columns=["*"], column_filters={}, catalog=None,
                  keywords=None, ucd="", timeout=conf.timeout,
                  vizier_server=conf.server, row_limit=conf.row_limit):
@@ -323,6 +329,93 @@ class VizierClass(BaseQuery):
             data=data_payload, timeout=self.TIMEOUT, cache=cache)
         return response
 
+    def query_region(self, coordinates, *, radius=None, inner_radius=None,
+                     width=None, height=None, catalog=None,
+                     get_query_payload=False, cache=True,
+                     return_type='votable', column_filters={},
+                     frame='fk5', verbose=False):
+        """
+        Queries a region around the specified coordinates.
+
+        At least one of ``radius`` or ``width`` must be specified.
+
+        Queries with more than ``BATCH_SIZE`` targets are split into several
+        requests, sent at most ``MAX_CONCURRENT_QUERIES`` at a time.  The
+        tables of each catalog are merged, with the ``_q`` column referring to
+        the position of the target in the whole input.
+
+        Parameters
+        ----------
+        coordinates : str, `astropy.coordinates` object, or `~astropy.table.Table`
+            The target around which to search. It may be specified as a
+            string in which case it is resolved using online services or as
+            the appropriate `astropy.coordinates` object. ICRS coordinates
+            may also be entered as a string.  If a table is used, each of
+            its rows will be queried, as long as it contains two columns
+            named ``_RAJ2000`` and ``_DEJ2000`` with proper angular units.
+        radius : convertible to `~astropy.coordinates.Angle`
+            The radius of the circular region to query.
+        inner_radius : convertible to `~astropy.coordinates.Angle`
+            When set in addition to ``radius``, the queried region becomes
+            annular, with outer radius ``radius`` and inner radius
+            ``inner_radius``.
+        width : convertible to `~astropy.coordinates.Angle`
+            The width of the square region to query.
+        height : convertible to `~astropy.coordinates.Angle`
+            When set in addition to ``width``, the queried region becomes
+            rectangular, with the specified ``width`` and ``height``.
+        catalog : str or list, optional
+            The catalog(s) which must be searched for this identifier.
+            If not specified, all matching catalogs will be searched.
+        column_filters: dict, optional
+            Constraints on columns of the result. The dictionary contains
+            the column name as keys, and the constraints as values.
+        frame : str, optional
+            The frame to use for the request. It should be 'fk5', 'icrs',
+            or 'galactic'. This choice influences the the orientation of
+            box requests.
+
+        Returns
+        -------
+        table_list : `astroquery.utils.TableList`
+            The tables of the results of each catalog.
+        """
+        response = self.query_region_async(
+            coordinates, radius=radius, inner_radius=inner_radius, width=width,
+            height=height, catalog=catalog, get_query_payload=get_query_payload,
+            cache=cache, return_type=return_type, column_filters=column_filters,
+            frame=frame)
+        if get_query_payload:
+            return response
+        if isinstance(response, list):
+            result = self._merge_results(
+                [self._parse_result(part, verbose=verbose) for part in response])
+        else:
+            result = self._parse_result(response, verbose=verbose)
+        self.table = result
+        return result
+
+    def _merge_results(self, results):
+        """
+        Merge the results of a query split in parts of ``BATCH_SIZE`` targets,
+        offsetting the ``_q`` column of each part by the number of targets
+        in the parts before it.
+        """
+        merged = OrderedDict()
+        for index, result in enumerate(results):
+            if result is None:
+                continue
+            for name, table in zip(result.keys(), result.values()):
+                if '_q' in table.colnames:
+                    table['_q'] += index * self.BATCH_SIZE
+                merged.setdefault(name, []).append(table)
+        for name, tables in merged.items():
+            table = tbl.vstack(tables, metadata_conflicts='silent') if len(tables) > 1 else tables[0]
+            if self.ROW_LIMIT > 0:
+                table = table[:self.ROW_LIMIT]
+            merged[name] = table
+        return commons.TableList(merged)
+
     def query_region_async(self, coordinates, *, radius=None, inner_radius=None,
                            width=None, height=None, catalog=None,
                            get_query_payload=False, cache=True,
@@ -367,8 +460,10 @@ class VizierClass(BaseQuery):
 
         Returns
         -------
-        response : `requests.Response`
-            The response of the HTTP request.
+        response : `requests.Response` or list of `requests.Response`
+            The response of the HTTP request. Queries with more than
+            ``BATCH_SIZE`` targets are split into several requests, and a
+            list of their responses (or payloads) is returned.
 
         """
         if frame not in ('galactic', 'fk5', 'icrs'):
@@ -381,45 +476,24 @@ class VizierClass(BaseQuery):
         if isinstance(coordinates, (commons.CoordClasses, str)):
             target = commons.parse_coordinates(coordinates).transform_to(frame)
 
+            if frame == 'galactic':
+                positions = _format_positions(target.l, target.b, prefix="G")
+            else:
+                positions = _format_positions(target.ra, target.dec)
+
             if not target.isscalar:
-                center["-c"] = []
-                for pos in target:
-                    if frame == 'galactic':
-                        glon_deg = pos.l.to_string(unit="deg", decimal=True, precision=8)
-                        glat_deg = pos.b.to_string(unit="deg", decimal=True, precision=8,
-                                                   alwayssign=True)
-                        center["-c"] += ["G{}{}".format(glon_deg, glat_deg)]
-                    else:
-                        ra_deg = pos.ra.to_string(unit="deg", decimal=True, precision=8)
-                        dec_deg = pos.dec.to_string(unit="deg", decimal=True,
-                                                    precision=8, alwayssign=True)
-                        center["-c"] += ["{}{}".format(ra_deg, dec_deg)]
+                center["-c"] = positions
                 columns += ["_q"]  # Always request reference to input table
             else:
-                if frame == 'galactic':
-                    glon = target.l.to_string(unit='deg', decimal=True, precision=8)
-                    glat = target.b.to_string(unit="deg", decimal=True, precision=8,
-                                              alwayssign=True)
-                    center["-c"] = "G{glon}{glat}".format(glon=glon, glat=glat)
-                else:
-                    ra = target.ra.to_string(unit='deg', decimal=True, precision=8)
-                    dec = target.dec.to_string(unit="deg", decimal=True, precision=8,
-                                               alwayssign=True)
-                    center["-c"] = "{ra}{dec}".format(ra=ra, dec=dec)
+                center["-c"] = positions[0]
         elif isinstance(coordinates, tbl.Table):
             if (("_RAJ2000" in coordinates.keys()) and ("_DEJ2000" in
                                                         coordinates.keys())):
-                center["-c"] = []
                 sky_coord = coord.SkyCoord(coordinates["_RAJ2000"],
                                            coordinates["_DEJ2000"],
                                            unit=(coordinates["_RAJ2000"].unit,
                                                  coordinates["_DEJ2000"].unit))
-                for (ra, dec) in zip(sky_coord.ra, sky_coord.dec):
-                    ra_deg = ra.to_string(unit="deg", decimal=True,
-                                          precision=8)
-                    dec_deg = dec.to_string(unit="deg", decimal=True,
-                                            precision=8, alwayssign=True)
-                    center["-c"] += ["{}{}".format(ra_deg, dec_deg)]
+                center["-c"] = _format_positions(sky_coord.ra, sky_coord.dec)
                 columns += ["_q"]  # Always request reference to input table
             else:
                 raise ValueError("Table must contain '_RAJ2000' and "
@@ -444,7 +518,24 @@ class VizierClass(BaseQuery):
             raise Exception(
                 "At least one of radius, width/height must be specified")
 
-        # Prepare payload
+        # Prepare payload, splitting long lists of targets into several requests
+        targets = center.get("-c")
+        if isinstance(targets, list) and self.BATCH_SIZE and len(targets) > self.BATCH_SIZE:
+            data_payloads = [
+                self._args_to_payload(center=dict(center, **{"-c": targets[i:i + self.BATCH_SIZE]}),
+                                      columns=columns, catalog=catalog, column_filters=column_filters)
+                for i in range(0, len(targets), self.BATCH_SIZE)]
+            if get_query_payload:
+                return data_payloads
+
+            def request(data_payload):
+                return self._request(
+                    method='POST', url=self._server_to_url(return_type=return_type),
+                    data=data_payload, timeout=self.TIMEOUT, cache=cache)
+
+            with ThreadPoolExecutor(max(1, self.MAX_CONCURRENT_QUERIES)) as executor:
+                return list(executor.map(request, data_payloads))
+
         data_payload = self._args_to_payload(center=center, columns=columns,
                                              catalog=catalog, column_filters=column_filters)
 
@@ -776,6 +867,27 @@ def _parse_vizier_votable(data, *, verbose=False, invalid='warn',
         return commons.TableList(table_dict)
 
 
+def _format_positions(lon, lat, *, prefix=""):
+    """
+    Format longitudes and latitudes as the positions of a VizieR ``-c``
+    parameter, in decimal degrees with 8 decimals and a signed latitude.
+
+    Parameters
+    ----------
+    lon, lat : `~astropy.coordinates.Angle`
+        Scalar or array angles.
+    prefix : str
+        Prefix for each position, ``"G"`` for galactic coordinates.
+
+    Returns
+    -------
+    positions : list of str
+    """
+    lon = np.char.mod('%.8f', np.atleast_1d(lon.to_value(u.deg)))
+    lat = np.char.mod('%+.8f', np.atleast_1d(lat.to_value(u.deg)))
+    return np.char.add(np.char.add(prefix, lon), lat).tolist()
+
+
 def _parse_angle(angle):
     """
     Returns the Vizier-formatted units and values for box/radius
@@ -263,3 +263,48 @@ class TestVizierClass:
     def test_column_filters_unicode(self):
         v = vizier.core.Vizier(column_filters={u'Vmag': u'>10'})
         assert len(v.column_filters) == 1
+
+
+def test_format_positions():
+    coords = SkyCoord(ra=[0, 10.68458, 359.999999999] * u.deg,
+                      dec=[-0.0, 41.26917, -89.5] * u.deg)
+    positions = vizier.core._format_positions(coords.ra, coords.dec)
+    expected = ["{}{}".format(pos.ra.to_string(unit="deg", decimal=True, precision=8),
+                              pos.dec.to_string(unit="deg", decimal=True, precision=8, alwayssign=True))
+                for pos in coords]
+    assert positions == expected
+    assert vizier.core._format_positions(coords[1].ra, coords[1].dec, prefix="G") == ["G10.68458000+41.26917000"]
+
+
+def test_query_region_table_positions(patch_post):
+    targets = Table({'_RAJ2000': [299.59, 299.9] * u.deg, '_DEJ2000': [35.201, -35.201] * u.deg})
+    payload = vizier.core.Vizier.query_region(targets, radius=5 * u.deg, catalog=["HIP"],
+                                              get_query_payload=True)
+    assert "-c=<<====AstroqueryList\n299.59000000+35.20100000\n299.90000000-35.20100000\n" in payload
+    assert "-out.add=_q" in payload
+
+
+def test_query_region_batches(patch_post):
+    viz = vizier.core.VizierClass()
+    viz.BATCH_SIZE = 1
+    payloads = viz.query_region(vector_skycoord, radius=5 * u.deg, catalog=["HIP", "NOMAD", "UCAC"],
+                                get_query_payload=True)
+    assert len(payloads) == 2
+    assert "\n299.59" in payloads[0] and "\n299.90" not in payloads[0]
+    assert "\n299.90" in payloads[1] and "\n299.59" not in payloads[1]
+
+    single = viz.query_region(scalar_skycoord, radius=5 * u.deg, catalog=["HIP", "NOMAD", "UCAC"])
+    result = viz.query_region(vector_skycoord, radius=5 * u.deg, catalog=["HIP", "NOMAD", "UCAC"])
+    assert result.keys() == single.keys()
+    assert [len(table) for table in result] == [2 * len(table) for table in single]
+
+
+def test_merge_results_offsets_q():
+    viz = vizier.core.VizierClass()
+    viz.BATCH_SIZE = 3
+    parts = [commons.TableList([('cat', Table({'_q': [1, 3]}))]),
+             commons.TableList([('cat', Table({'_q': [2]})), ('other', Table({'_q': [1]}))])]
+    result = viz._merge_results(parts)
+    assert result.keys() == ['cat', 'other']
+    assert list(result['cat']['_q']) == [1, 3, 5]
+    assert list(result['other']['_q']) == [4]
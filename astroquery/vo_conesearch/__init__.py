@@ -21,6 +21,19 @@ class Conf(_config.ConfigNamespace):
     fallback_url = _config.ConfigItem(
         'http://gsss.stsci.edu/webservices/vo/ConeSearch.aspx?CAT=GSC23&',
         'Just ignore database above and use STScI HST Guide Star Catalog.')
+    max_concurrent_queries = _config.ConfigItem(
+        1,
+        'Maximum number of services queried concurrently when several '
+        'catalogs are given. With the default of 1, they are queried '
+        'one after the other, in order.')
+    rank_services = _config.ConfigItem(
+        False,
+        'If True, record the latency, error rate and result size of each '
+        'service, and try the fastest healthy services first.')
+    max_error_rate = _config.ConfigItem(
+        0.5,
+        'With rank_services, services failing more often than this (after '
+        'at least 3 requests) are skipped, unless no other is available.')
     pedantic = _config.ConfigItem(
         False,
         'If True, raise an error when the result violates the spec, '
@@ -3,13 +3,13 @@
 
 # STDLIB
 import warnings
+from contextlib import closing
 
 # THIRD-PARTY
 import numpy as np
 
 # ASTROPY
 from astropy.io.votable.exceptions import vo_warn, W25
-from astropy.utils.console import color_print
 from astropy.utils.exceptions import AstropyUserWarning
 
 # LOCAL
@@ -81,7 +81,8 @@ class AsyncConeSearch(AsyncBase):
 
 def conesearch(center, radius, *, verb=1, catalog_db=None,
                verbose=True, cache=True, query_all=False,
-               return_astropy_table=True, use_names_over_ids=False):
+               return_astropy_table=True, use_names_over_ids=False,
+               max_workers=None):
     """
     Perform Cone Search and returns the result of the
     first successful query.
@@ -184,6 +185,14 @@ def conesearch(center, radius, *, verb=1, catalog_db=None,
         to be renamed by appending numbers to the end.  Otherwise
         (default), use the ID attributes as the column names.
 
+    max_workers : int or `None`
+        Maximum number of catalogs queried concurrently. If more than 1,
+        the result of the first catalog to respond successfully is
+        returned and the queries not started yet are cancelled; with
+        ``query_all``, the results are collected as they complete.
+        When not provided, uses
+        ``astroquery.vo_conesearch.conf.max_concurrent_queries``.
+
     Returns
     -------
     obj : `astropy.table.Table` or `astropy.io.votable.tree.Table`
@@ -205,33 +214,28 @@ def conesearch(center, radius, *, verb=1, catalog_db=None,
     else:
         result = None
 
-    for name, catalog in catalogs:
-        if isinstance(catalog, str):
-            if catalog.startswith('http'):
-                url = catalog
-            else:
-                remote_db = vos_catalog.get_remote_catalog_db(
-                    service_type, cache=cache, verbose=verbose)
-                catalog = remote_db.get_catalog(catalog)
-                url = catalog['url']
-        else:
-            url = catalog['url']
-
-        if verbose:  # pragma: no cover
-            color_print('Trying {0}'.format(url), 'green')
-
-        try:
-            r = ConeSearch.query_region(
-                center, radius, verb=verb, cache=cache, verbose=verbose,
-                service_url=url, return_astropy_table=return_astropy_table,
-                use_names_over_ids=use_names_over_ids)
-        except Exception as e:
-            err_msg = str(e)
-            vo_warn(W25, (url, err_msg))
-            if not query_all and 'ConnectTimeoutError' in err_msg:
-                n_timed_out += 1
-        else:
-            if r is not None:
+    if max_workers is None:
+        max_workers = conf.max_concurrent_queries
+
+    urls = vos_catalog._get_catalog_urls(service_type, catalogs, cache=cache,
+                                         verbose=verbose)
+
+    def query(url):
+        return ConeSearch.query_region(
+            center, radius, verb=verb, cache=cache, verbose=verbose,
+            service_url=url, return_astropy_table=return_astropy_table,
+            use_names_over_ids=use_names_over_ids)
+
+    with closing(vos_catalog._iter_service_requests(
+            query, urls, max_workers=max_workers,
+            verbose=verbose)) as results:
+        for url, r, e in results:
+            if e is not None:
+                err_msg = str(e)
+                vo_warn(W25, (url, err_msg))
+                if not query_all and 'ConnectTimeoutError' in err_msg:
+                    n_timed_out += 1
+            elif r is not None:
                 if query_all:
                     result[r.url] = r
                 else:
@@ -315,7 +319,9 @@ def search_all(*args, **kwargs):
     result : dict of `astropy.io.votable.tree.Table` objects
         A dictionary of tables from successful VO service requests,
         with keys being the access URLs. If none is successful,
-        an empty dictionary is returned.
+        an empty dictionary is returned. When the services are queried
+        concurrently (see ``max_workers`` in :func:`conesearch`), the
+        tables are in the order the services responded.
 
     Raises
     ------
@@ -277,3 +277,53 @@ def test_validate_coord(c, ans):
     """Valid coordinates should not raise an error."""
     result = _validate_coord(c)
     np.testing.assert_allclose(result, ans)
+
+
+class TestConcurrentSearch:
+    """Test concurrent Cone Search on mocked services."""
+
+    urls = ['http://slow.example.com/scs?', 'http://fast.example.com/scs?',
+            'http://broken.example.com/scs?', 'http://other.example.com/scs?']
+    delays = {'slow': 0.5, 'fast': 0.05, 'broken': 0, 'other': 0.1}
+
+    @pytest.fixture
+    def patch_query_region(self, monkeypatch):
+        calls = []
+
+        def query_region(center, radius, *, service_url, **kwargs):
+            calls.append(service_url)
+            name = service_url.split('//')[1].split('.')[0]
+            time.sleep(self.delays[name])
+            if name == 'broken':
+                raise VOSError('broken service')
+            result = Table({'name': [name]})
+            result.url = service_url
+            return result
+
+        monkeypatch.setattr(ConeSearch, 'query_region', query_region)
+        return calls
+
+    def test_first_success_serial(self, patch_query_region):
+        with pytest.warns(W25):
+            result = conesearch.conesearch(
+                SCS_CENTER, SCS_RADIUS, catalog_db=self.urls[2:],
+                verbose=False, max_workers=1)
+        assert result['name'][0] == 'other'
+        assert patch_query_region == self.urls[2:]
+
+    def test_first_success_concurrent(self, patch_query_region):
+        t_beg = time.time()
+        result = conesearch.conesearch(
+            SCS_CENTER, SCS_RADIUS, catalog_db=self.urls[:2],
+            verbose=False, max_workers=2)
+        assert result['name'][0] == 'fast'
+        # the slow service is not waited for
+        assert time.time() - t_beg < 0.4
+
+    def test_search_all_concurrent(self, patch_query_region):
+        with pytest.warns(W25):
+            result = conesearch.search_all(
+                SCS_CENTER, SCS_RADIUS, catalog_db=self.urls,
+                verbose=False, max_workers=4)
+        assert list(result) == [self.urls[1], self.urls[3], self.urls[0]]
+        assert sorted(patch_query_region) == sorted(self.urls)
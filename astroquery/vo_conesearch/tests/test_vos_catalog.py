@@ -15,13 +15,15 @@ import os
 import pytest
 
 # ASTROPY
+from astropy.table import Table
 from astropy.utils.data import get_pkg_data_filename
 
 # LOCAL
 from ..exceptions import (VOSError, MissingCatalog, DuplicateCatalogName,
                           DuplicateCatalogURL)
+from .. import vos_catalog
 from ..validator import conf as validator_conf
-from ..vos_catalog import VOSCatalog, VOSDatabase
+from ..vos_catalog import VOSCatalog, VOSDatabase, VOSStatistics
 
 __doctest_skip__ = ['*']
 
@@ -206,3 +208,62 @@ def test_db_from_registry():
 
     # Should have over 9k catalogs; Update test if this changes.
     assert len(db) > 9000
+
+
+class TestStatistics:
+    """Test recording and ranking of service statistics."""
+
+    urls = ['http://a.example.com/scs?', 'http://b.example.com/scs?',
+            'http://c.example.com/scs?', 'http://d.example.com/scs?']
+
+    def test_rank(self):
+        stats = VOSStatistics()
+        stats.record(self.urls[0], 2.0, size=10)
+        stats.record(self.urls[1], 0.5, size=10)
+        stats.record(self.urls[1], 1.0, error=True)
+        for i in range(3):
+            stats.record(self.urls[2], 0.1, error=True)
+
+        assert stats.error_rate(self.urls[1]) == 0.5
+        assert not stats.is_healthy(self.urls[2])
+        # b has expected latency 1 s, d has a baseline of 1.5 s and
+        # c keeps failing
+        assert stats.rank(self.urls, baselines={self.urls[3]: 1.5}) == [
+            self.urls[1], self.urls[3], self.urls[0]]
+        # services without statistics keep their order, after the others
+        assert stats.rank(self.urls[::-1]) == [
+            self.urls[1], self.urls[0], self.urls[3]]
+        # unhealthy services are kept when no other is available
+        assert stats.rank(self.urls[2:3]) == self.urls[2:3]
+
+    def test_persistence(self, tmp_path):
+        filename = tmp_path / 'stats.json'
+        stats = VOSStatistics(filename)
+        stats.record(self.urls[0], 1.0, size=3)
+        stats.record(self.urls[0], 2.0, size=5)
+        stats.save()
+
+        other = VOSStatistics(filename)
+        assert len(other) == 1
+        assert other[self.urls[0]] == {'nrequests': 2, 'nfailures': 0,
+                                       'latency': 1.3, 'size': 5}
+
+    def test_call_vo_service_ranking(self, monkeypatch):
+        stats = VOSStatistics()
+        stats.record(self.urls[1], 0.1, size=1)
+        monkeypatch.setattr(vos_catalog, '_service_statistics', stats)
+        monkeypatch.setattr(vos_catalog.conf, 'rank_services', True)
+        calls = []
+
+        def request(url, pedantic, kwargs, **kw):
+            calls.append(url)
+            return Table({'a': [1, 2]})
+
+        monkeypatch.setattr(vos_catalog, '_vo_service_request', request)
+        result = vos_catalog.call_vo_service('conesearch_good',
+                                             catalog_db=self.urls[:2],
+                                             verbose=False)
+        assert len(result) == 2
+        assert calls == [self.urls[1]]
+        assert stats[self.urls[1]]['nrequests'] == 2
+        assert stats[self.urls[1]]['size'] == 2
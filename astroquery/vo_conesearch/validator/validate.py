@@ -4,6 +4,7 @@
 # STDLIB
 import multiprocessing
 import os
+import time
 import warnings
 from collections import OrderedDict
 from pathlib import Path
@@ -239,6 +240,14 @@ def _do_validation(args):
     votable.table.reset_vo_warnings()
 
     r = result.Result(url, root=root, timeout=timeout)
+
+    # Time the download as a baseline latency for ranking the services,
+    # copied to the database as 'validate_elapsed'.
+    downloaded = os.path.exists(r.get_vo_xml_path())
+    t_beg = time.perf_counter()
+    r.download_xml_content()
+    if not downloaded and r['network_error'] is None:
+        r['elapsed'] = time.perf_counter() - t_beg
     r.validate_vo()
 
     _categorize_result(r)
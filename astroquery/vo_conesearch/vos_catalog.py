@@ -13,11 +13,17 @@ import json
 import os
 import re
 import socket
+import threading
+import time
 import urllib
 import warnings
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
 from copy import deepcopy
+from pathlib import Path
 
+from astropy.config import paths
 from astropy.io.votable import parse_single_table, table, tree
 from astropy.io.votable.exceptions import vo_raise, vo_warn, E19, W24, W25
 from astropy.utils.console import color_print
@@ -34,11 +40,15 @@ from ..utils.url_helpers import urljoin_keep_path
 # Import configurable items declared in __init__.py
 from . import conf
 
-__all__ = ['VOSBase', 'VOSCatalog', 'VOSDatabase', 'get_remote_catalog_db',
+__all__ = ['VOSBase', 'VOSCatalog', 'VOSDatabase', 'VOSStatistics',
+           'get_remote_catalog_db', 'get_service_statistics',
            'call_vo_service', 'list_catalogs']
 
 __dbversion__ = 1
 
+# Statistics shared by all service requests, see get_service_statistics()
+_service_statistics = None
+
 
 class VOSBase:
     """
@@ -628,6 +638,164 @@ class VOSDatabase(VOSBase):
         return db
 
 
+class VOSStatistics:
+    """
+    A class to record the performance of VO services.
+
+    For each access URL, the number of requests and of failures, the
+    mean latency of successful requests and the size of the last result
+    are kept, and used to rank the services by their expected latency.
+
+    Parameters
+    ----------
+    filename : str or `~pathlib.Path` or `None`
+        JSON file the statistics are read from and saved to.
+        If `None`, they are only kept in memory.
+
+    """
+    # weight of the latest latency in the moving average
+    _latency_weight = 0.3
+
+    # number of requests before a service can be deemed unhealthy
+    _min_requests = 3
+
+    def __init__(self, filename=None):
+        self.filename = filename
+        self._lock = threading.Lock()
+        self._stats = {}
+        if filename is not None and os.path.exists(filename):
+            with open(filename, encoding='utf8') as fd:
+                self._stats = json.load(fd)
+
+    def __len__(self):
+        return len(self._stats)
+
+    def __contains__(self, url):
+        return url in self._stats
+
+    def __getitem__(self, url):
+        """Statistics of the given access URL, as a dictionary."""
+        return dict(self._stats[url])
+
+    def record(self, url, elapsed, *, error=False, size=None):
+        """
+        Record a request to a service.
+
+        Parameters
+        ----------
+        url : str
+            Access URL.
+
+        elapsed : float
+            Duration of the request in seconds.
+
+        error : bool
+            Whether the request failed.
+
+        size : int or `None`
+            Number of rows returned.
+
+        """
+        with self._lock:
+            stats = self._stats.setdefault(
+                url, {'nrequests': 0, 'nfailures': 0, 'latency': None,
+                      'size': None})
+            stats['nrequests'] += 1
+            if error:
+                stats['nfailures'] += 1
+                return
+            if stats['latency'] is None:
+                stats['latency'] = elapsed
+            else:
+                stats['latency'] += self._latency_weight * (
+                    elapsed - stats['latency'])
+            if size is not None:
+                stats['size'] = size
+
+    def error_rate(self, url):
+        """Fraction of the requests to ``url`` that failed, or `None`."""
+        stats = self._stats.get(url)
+        if not stats or not stats['nrequests']:
+            return None
+        return stats['nfailures'] / stats['nrequests']
+
+    def is_healthy(self, url):
+        """Whether ``url`` fails at most ``conf.max_error_rate`` of the time."""
+        stats = self._stats.get(url)
+        if stats is None or stats['nrequests'] < self._min_requests:
+            return True
+        return self.error_rate(url) <= conf.max_error_rate
+
+    def rank(self, urls, *, baselines=None):
+        """
+        Order access URLs by increasing expected latency.
+
+        The expected latency is the mean latency divided by the success
+        rate, or the baseline latency if the service was never queried
+        successfully. Services without either keep their relative order,
+        after the others. Unhealthy services are left out, unless all of
+        them are.
+
+        Parameters
+        ----------
+        urls : list of str
+            Access URLs, in their original order.
+
+        baselines : dict or `None`
+            Baseline latency in seconds for some of the URLs, e.g., as
+            timed by the validator.
+
+        Returns
+        -------
+        urls : list of str
+            Ranked access URLs.
+
+        """
+        baselines = baselines or {}
+
+        def expected_latency(url):
+            stats = self._stats.get(url)
+            if stats is not None and stats['latency'] is not None:
+                return (0, stats['latency'] / (1 - self.error_rate(url)))
+            if baselines.get(url) is not None:
+                return (0, baselines[url])
+            return (1, 0)
+
+        ranked = sorted(urls, key=expected_latency)
+        healthy = [url for url in ranked if self.is_healthy(url)]
+        return healthy or ranked
+
+    def save(self):
+        """Write the statistics to ``filename``, if any."""
+        if self.filename is None:
+            return
+        with self._lock:
+            contents = json.dumps(self._stats, sort_keys=True, indent=4)
+        os.makedirs(os.path.dirname(os.path.abspath(self.filename)),
+                    exist_ok=True)
+        with open(self.filename, 'w', encoding='utf8') as fd:
+            fd.write(contents)
+
+
+def get_service_statistics():
+    """
+    Statistics recorded for VO service requests when
+    ``astroquery.vo_conesearch.conf.rank_services`` is `True`, persisted
+    in the astroquery cache directory.
+
+    Returns
+    -------
+    stats : `VOSStatistics`
+
+    """
+    global _service_statistics
+    if _service_statistics is None:
+        _service_statistics = VOSStatistics(Path(
+            paths.get_cache_dir(), 'astroquery', 'vo_conesearch',
+            'service_statistics.json'))
+    return _service_statistics
+
+
 def get_remote_catalog_db(dbname, *, cache=True, verbose=True):
     """
     Get a database of VO services (which is a JSON file) from a remote
@@ -700,6 +868,132 @@ def _get_catalogs(service_type, catalog_db, **kwargs):
     return catalogs
 
 
+def _get_catalog_urls(service_type, catalogs, *, cache=True, verbose=True):
+    """
+    Access URLs of the catalogs returned by :func:`_get_catalogs`.
+
+    With ``astroquery.vo_conesearch.conf.rank_services``, they are ranked
+    by :meth:`VOSStatistics.rank`, using the validation timings in the
+    catalogs, if any, as baseline.
+
+    """
+    urls = []
+    baselines = {}
+    for name, catalog in catalogs:
+        if isinstance(catalog, str):
+            if catalog.startswith('http'):
+                urls.append(catalog)
+                continue
+            remote_db = get_remote_catalog_db(service_type, cache=cache,
+                                              verbose=verbose)
+            catalog = remote_db.get_catalog(catalog)
+        urls.append(catalog['url'])
+        baselines[catalog['url']] = catalog.get('validate_elapsed')
+
+    if conf.rank_services:
+        urls = get_service_statistics().rank(urls, baselines=baselines)
+    return urls
+
+
+def _iter_service_requests(func, urls, *, max_workers=1, verbose=False):
+    """
+    Call ``func(url)`` for each of the ``urls``.
+
+    With ``max_workers`` of 1, the calls are made one after the other,
+    in order, and only as the results are consumed. Otherwise, up to
+    ``max_workers`` calls run concurrently and their results are yielded
+    in the order they complete; calls not started yet are cancelled when
+    the generator is closed, so that the first successful result can be
+    used without waiting for the slower services.
+
+    With ``astroquery.vo_conesearch.conf.rank_services``, the calls are
+    recorded in :func:`get_service_statistics`.
+
+    Parameters
+    ----------
+    func : callable
+        Service request taking the access URL as its only argument.
+
+    urls : list of str
+        Access URLs, by decreasing priority.
+
+    max_workers : int
+        Maximum number of concurrent calls.
+
+    verbose : bool
+        Verbose output.
+
+    Yields
+    ------
+    url : str
+        Access URL.
+
+    result : object or `None`
+        Value returned by ``func``, or `None` if it raised an exception.
+
+    exception : Exception or `None`
+        Exception raised by ``func``, if any.
+
+    """
+    stats = None
+    if conf.rank_services:
+        stats = get_service_statistics()
+        func = _record_statistics(func, stats)
+    try:
+        yield from _run_service_requests(func, urls, max_workers, verbose)
+    finally:
+        if stats is not None:
+            stats.save()
+
+
+def _run_service_requests(func, urls, max_workers, verbose):
+    """This is called by :func:`_iter_service_requests`."""
+    if max_workers <= 1:
+        for url in urls:
+            if verbose:  # pragma: no cover
+                color_print('Trying {0}'.format(url), 'green')
+            try:
+                result = func(url)
+            except Exception as e:
+                yield url, None, e
+            else:
+                yield url, result, None
+        return
+
+    executor = ThreadPoolExecutor(max_workers)
+    futures = {}
+    try:
+        for url in urls:
+            if verbose:  # pragma: no cover
+                color_print('Trying {0}'.format(url), 'green')
+            futures[executor.submit(func, url)] = url
+        for future in as_completed(futures):
+            e = future.exception()
+            yield futures[future], None if e else future.result(), e
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def _record_statistics(func, stats):
+    """Wrap a service request to record its duration in ``stats``."""
+    def timed_func(url):
+        t_beg = time.perf_counter()
+        try:
+            result = func(url)
+        except Exception:
+            stats.record(url, time.perf_counter() - t_beg, error=True)
+            raise
+        if result is None:
+            size = 0
+        else:
+            size = len(getattr(result, 'array', result))
+        stats.record(url, time.perf_counter() - t_beg, size=size)
+        return result
+    return timed_func
+
+
 def _vo_service_request(url, pedantic, kwargs, *, cache=True, verbose=False):
     """
     This is called by :func:`call_vo_service`.
@@ -800,7 +1094,7 @@ def vo_tab_parse(tab, url, kwargs):
 
 
 def call_vo_service(service_type, catalog_db=None, pedantic=None,
-                    verbose=True, cache=True, kwargs={}):
+                    verbose=True, cache=True, kwargs={}, max_workers=None):
     """
     Makes a generic VO service call.
 
@@ -855,6 +1149,13 @@ def call_vo_service(service_type, catalog_db=None, pedantic=None,
         No checking is done that the arguments are accepted by
         the service, etc.
 
+    max_workers : int or `None`
+        Maximum number of catalogs queried concurrently. If more than 1,
+        the result of the first catalog to respond successfully is
+        returned, rather than that of the first successful catalog in
+        order. When not provided, uses the configuration setting
+        ``astroquery.vo_conesearch.conf.max_concurrent_queries``.
+
     Returns
     -------
     obj : `astropy.io.votable.tree.Table`
@@ -872,26 +1173,22 @@ def call_vo_service(service_type, catalog_db=None, pedantic=None,
 
     if pedantic is None:  # pragma: no cover
         pedantic = conf.pedantic
+    if max_workers is None:
+        max_workers = conf.max_concurrent_queries
 
-    for name, catalog in catalogs:
-        if isinstance(catalog, str):
-            if catalog.startswith('http'):
-                url = catalog
-            else:
-                remote_db = get_remote_catalog_db(service_type, cache=cache,
-                                                  verbose=verbose)
-                catalog = remote_db.get_catalog(catalog)
-                url = catalog['url']
-        else:
-            url = catalog['url']
+    urls = _get_catalog_urls(service_type, catalogs, cache=cache,
+                             verbose=verbose)
 
-        if verbose:  # pragma: no cover
-            color_print('Trying {0}'.format(url), 'green')
+    def request(url):
+        return _vo_service_request(url, pedantic, kwargs, cache=cache,
+                                   verbose=verbose)
 
-        try:
-            return _vo_service_request(url, pedantic, kwargs, cache=cache,
-                                       verbose=verbose)
-        except Exception as e:
+    with closing(_iter_service_requests(
+            request, urls, max_workers=max_workers,
+            verbose=verbose)) as results:
+        for url, result, e in results:
+            if e is None:
+                return result
             vo_warn(W25, (url, str(e)))
             if hasattr(e, 'reason') and isinstance(e.reason, socket.timeout):
                 n_timed_out += 1
@@ -210,7 +210,7 @@ class BaseWFAUClass(QueryWithLogin):
 
         if get_query_payload:
             return readable_objs
-        return [obj.get_fits() for obj in readable_objs]
+        return commons.get_fits_files(readable_objs, show_progress=show_progress)
 
     def get_images_async(self, coordinates, *, waveband='all', frame_type='stack',
                          image_width=1 * u.arcmin, image_height=None,
@@ -14,6 +14,22 @@ class Conf(_config.ConfigNamespace):
         300,
         'time limit for connecting to xMatch server')
 
+    tables_ttl = _config.ConfigItem(
+        86400,
+        'Time in seconds after which the list of VizieR tables available '
+        'in xMatch is fetched again.')
+
+    upload_chunk_size = _config.ConfigItem(
+        500000,
+        'Maximum number of rows of an uploaded table sent in a single '
+        'request; larger tables are split into declination bands. '
+        'Set to 0 to disable splitting.')
+
+    max_concurrent_queries = _config.ConfigItem(
+        2,
+        'Maximum number of requests sent concurrently when an uploaded '
+        'table is split into several requests.')
+
 
 conf = Conf()
 
@@ -1,12 +1,18 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO, BytesIO
 
+import numpy as np
 from astropy.io import votable
 import astropy.units as u
-from astropy.table import Table
+from astropy.table import Table, vstack
 from requests import HTTPError
 
+from astroquery import cache_conf
 from astroquery.query import BaseQuery
 from astroquery.exceptions import InvalidQueryError
 from astroquery.utils import url_helpers, prepend_docstr_nosections, async_to_sync
@@ -23,10 +29,28 @@ except ImportError:
 class XMatchClass(BaseQuery):
     URL = conf.url
     TIMEOUT = conf.timeout
+    TABLES_TTL = conf.tables_ttl
+    UPLOAD_CHUNK_SIZE = conf.upload_chunk_size
+    MAX_CONCURRENT_QUERIES = conf.max_concurrent_queries
+
+    # names of the row index columns uploaded along with the positions of a
+    # `~astropy.table.Table` as ``cat1`` and ``cat2``, used to join the
+    # matches back to the tables
+    _INDEX_COLUMN = 'astroquery_index'
+    _INDEX_COLUMN2 = 'astroquery_index2'
+    # snapshot of the available VizieR tables in the cache directory
+    _TABLES_SNAPSHOT = 'vizier_tables.txt'
+
+    def __init__(self):
+        super().__init__()
+        self._available_tables = None
+        self._available_table_names = None
+        self._available_tables_time = None
 
     def query(self, cat1, cat2, max_distance, *,
               colRA1=None, colDec1=None, colRA2=None, colDec2=None,
-              area='allsky', cache=True, get_query_payload=False, **kwargs):
+              area='allsky', cache=True, get_query_payload=False,
+              upload_format='csv', **kwargs):
         """
         Query the `CDS cross-match service
         <http://cdsxmatch.u-strasbg.fr/xmatch>`_ by finding matches between
@@ -42,7 +66,7 @@ class XMatchClass(BaseQuery):
             If the table is uploaded or accessed through a URL, it must be
             in VOTable or CSV format with the positions in J2000
             equatorial frame and as decimal degrees numbers.
-        cat2 : str or file
+        cat2 : str, file or `~astropy.table.Table`
             Identifier of the second table. Follows the same rules as *cat1*.
         max_distance : `~astropy.units.Quantity`
             Maximum distance to look for counterparts.
@@ -64,26 +88,47 @@ class XMatchClass(BaseQuery):
             Default value is 'allsky' (no restriction). If a
             ``regions.CircleSkyRegion`` object is given, only sources in
             this region will be considered.
+        upload_format : {'csv', 'votable'}
+            Serialization of uploaded `~astropy.table.Table` objects.
+            ``'votable'`` sends a VOTable in the compact BINARY2 encoding,
+            which is smaller and faster to parse than CSV for large tables.
+            Default is ``'csv'``.
 
         Returns
         -------
         table : `~astropy.table.Table`
             Query results table
+
+        Notes
+        -----
+        If ``cat1`` or ``cat2`` is an `~astropy.table.Table`, only its
+        position columns are uploaded, along with a row index which is
+        used to join the matches back to the other columns of the table.
+        A ``cat1`` table with more than ``UPLOAD_CHUNK_SIZE`` rows is split
+        into declination bands, which are sent at most
+        ``MAX_CONCURRENT_QUERIES`` at a time, and the results are returned
+        in the order of the rows of ``cat1``.
         """
+        if (isinstance(cat1, Table) and colRA1 is not None and colDec1 is not None
+                or isinstance(cat2, Table) and colRA2 is not None and colDec2 is not None):
+            return self._query_table(cat1, cat2, max_distance, colRA1=colRA1, colDec1=colDec1,
+                                     colRA2=colRA2, colDec2=colDec2, area=area, cache=cache,
+                                     get_query_payload=get_query_payload,
+                                     upload_format=upload_format, **kwargs)
+
         response = self.query_async(cat1, cat2, max_distance, colRA1=colRA1, colDec1=colDec1,
                                     colRA2=colRA2, colDec2=colDec2, area=area, cache=cache,
                                     get_query_payload=get_query_payload,
-                                    **kwargs)
+                                    upload_format=upload_format, **kwargs)
         if get_query_payload:
             return response
 
-        content = BytesIO(response.content)
-        return Table.read(content, format='votable', use_names_over_ids=True)
+        return self._parse_result(response)
 
     @prepend_docstr_nosections("\n" + query.__doc__)
     def query_async(self, cat1, cat2, max_distance, *, colRA1=None, colDec1=None,
                     colRA2=None, colDec2=None, area='allsky', cache=True,
-                    get_query_payload=False, **kwargs):
+                    get_query_payload=False, upload_format='csv', **kwargs):
         """
         Returns
         -------
@@ -92,6 +137,8 @@ class XMatchClass(BaseQuery):
         """
         if max_distance > 180 * u.arcsec:
             raise ValueError('max_distance argument must not be greater than 180')
+        if upload_format not in ('csv', 'votable'):
+            raise ValueError("upload_format must be either 'csv' or 'votable'")
         payload = {'request': 'xmatch',
                    'distMaxArcsec': max_distance.to(u.arcsec).value,
                    'RESPONSEFORMAT': 'votable',
@@ -99,8 +146,8 @@ class XMatchClass(BaseQuery):
 
         kwargs = {}
 
-        self._prepare_sending_table(1, payload, kwargs, cat1, colRA1, colDec1)
-        self._prepare_sending_table(2, payload, kwargs, cat2, colRA2, colDec2)
+        self._prepare_sending_table(1, payload, kwargs, cat1, colRA1, colDec1, upload_format)
+        self._prepare_sending_table(2, payload, kwargs, cat2, colRA2, colDec2, upload_format)
         self._prepare_area(payload, area)
 
         if get_query_payload:
@@ -117,13 +164,100 @@ class XMatchClass(BaseQuery):
 
         return response
 
-    def _prepare_sending_table(self, cat_index, payload, kwargs, cat, colRA, colDec):
+    def _query_table(self, cat1, cat2, max_distance, *, colRA1, colDec1, colRA2, colDec2,
+                     area, cache, get_query_payload, upload_format, **kwargs):
+        '''Cross-match the `astropy.table.Table` ``cat1`` and/or ``cat2``,
+        uploading only their positions and row index, ``cat1`` in declination
+        bands of at most ``UPLOAD_CHUNK_SIZE`` rows, and join the matches
+        back to the tables.
+        '''
+        table1 = table2 = None
+        if isinstance(cat1, Table) and colRA1 is not None and colDec1 is not None:
+            table1 = cat1
+            cat1 = Table([table1[colRA1], table1[colDec1], np.arange(len(table1))],
+                         names=[colRA1, colDec1, self._INDEX_COLUMN])
+        if isinstance(cat2, Table) and colRA2 is not None and colDec2 is not None:
+            table2 = cat2
+            # the columns of the matches would not tell apart position
+            # columns of the same name in both uploaded tables
+            uploaded1 = cat1.colnames if table1 is not None else []
+            names2 = [f'{name}2' if name in uploaded1 else name for name in (colRA2, colDec2)]
+            cat2 = Table([table2[colRA2], table2[colDec2], np.arange(len(table2))],
+                         names=names2 + [self._INDEX_COLUMN2])
+            colRA2, colDec2 = names2
+
+        n_chunks = 1
+        if table1 is not None and self.UPLOAD_CHUNK_SIZE:
+            n_chunks = max(1, -(-len(cat1) // self.UPLOAD_CHUNK_SIZE))
+        if n_chunks > 1:
+            order = np.argsort(np.asarray(cat1[colDec1], dtype=float), kind='stable')
+            chunks = [cat1[rows] for rows in np.array_split(order, n_chunks)]
+            # look the table identifiers up once rather than from every thread
+            self.is_table_available(cat2)
+        else:
+            chunks = [cat1]
+
+        def query_chunk(chunk):
+            return self.query_async(chunk, cat2, max_distance, colRA1=colRA1, colDec1=colDec1,
+                                    colRA2=colRA2, colDec2=colDec2, area=area, cache=cache,
+                                    get_query_payload=get_query_payload,
+                                    upload_format=upload_format, **kwargs)
+
+        with ThreadPoolExecutor(max(1, self.MAX_CONCURRENT_QUERIES)) as executor:
+            responses = list(executor.map(query_chunk, chunks))
+
+        if get_query_payload:
+            return responses if n_chunks > 1 else responses[0]
+
+        results = [self._parse_result(response) for response in responses]
+        if n_chunks > 1:
+            result = vstack(results, metadata_conflicts='silent')
+            result = result[np.argsort(result[self._INDEX_COLUMN], kind='stable')]
+        else:
+            result = results[0]
+
+        if table1 is not None:
+            result = self._join_input_table(result, table1, colRA1, colDec1, self._INDEX_COLUMN)
+        if table2 is not None:
+            result = self._join_input_table(result, table2, colRA2, colDec2, self._INDEX_COLUMN2)
+        return result
+
+    def _join_input_table(self, result, table, colRA, colDec, index_column):
+        '''Replace the uploaded position and index columns of ``result`` by
+        the matched rows of ``table``, keeping the column order the service
+        uses for uploaded tables.
+        '''
+        uploaded = {colRA, colDec, index_column}
+        names = result.colnames
+        first = next((i for i, name in enumerate(names) if name in uploaded), len(names))
+        rows = table[np.asarray(result[index_column], dtype=int)]
+
+        columns = ([result[name] for name in names[:first] if name not in uploaded]
+                   + list(rows.itercols())
+                   + [result[name] for name in names[first:] if name not in uploaded])
+        joined = Table(meta=result.meta)
+        for column in columns:
+            joined.add_column(column, rename_duplicate=True, copy=False)
+        return joined
+
+    def _parse_result(self, response):
+        content = BytesIO(response.content)
+        return Table.read(content, format='votable', use_names_over_ids=True)
+
+    def _prepare_sending_table(self, cat_index, payload, kwargs, cat, colRA, colDec,
+                               upload_format='csv'):
         '''Check if table is a string, a `astropy.table.Table`, etc. and set
         query parameters accordingly.
         '''
         catstr = 'cat{0}'.format(cat_index)
         if isinstance(cat, str):
             payload[catstr] = cat
+        elif isinstance(cat, Table) and upload_format == 'votable':
+            # BINARY2 serialization is both smaller and faster to write
+            # and parse than the textual CSV
+            fp = BytesIO()
+            votable.from_table(cat).to_xml(fp, tabledata_format='binary2')
+            kwargs.setdefault('files', {})[catstr] = (f'{catstr}.xml', fp.getvalue())
         elif isinstance(cat, Table):
             # write the Table's content into a new, temporary CSV-file
             # so that it can be pointed to via the `files` option
@@ -131,10 +265,10 @@ class XMatchClass(BaseQuery):
             fp = StringIO()
             cat.write(fp, format='ascii.csv')
             fp.seek(0)
-            kwargs['files'] = {catstr: ('cat1.csv', fp.read())}
+            kwargs.setdefault('files', {})[catstr] = (f'{catstr}.csv', fp.read())
         else:
             # assume it's a file-like object, support duck-typing
-            kwargs['files'] = {catstr: ('cat1.csv', cat.read())}
+            kwargs.setdefault('files', {})[catstr] = (f'{catstr}.csv', cat.read())
 
         if not self.is_table_available(cat):
             if ((colRA is None) or (colDec is None)):
@@ -171,22 +305,70 @@ class XMatchClass(BaseQuery):
         if (table_id[:7] == 'vizier:'):
             table_id = table_id[7:]
 
-        return table_id in self.get_available_tables()
+        return table_id in self._get_available_tables()
 
     def get_available_tables(self, *, cache=True):
         """Get the list of the VizieR tables which are available in the
         xMatch service and return them as a list of strings.
 
+        The list is kept in memory and in a snapshot in the cache
+        directory, and is only fetched again from the service once it is
+        older than ``TABLES_TTL`` seconds, or if ``cache`` is False.
+
         """
-        response = self._request(
-            'GET',
-            url_helpers.urljoin_keep_path(self.URL, 'tables'),
-            {'action': 'getVizieRTableNames', 'RESPONSEFORMAT': 'txt'},
-            cache=cache,
-        )
-
-        content = response.text
-        return content.splitlines()
+        self._get_available_tables(cache=cache)
+        return list(self._available_table_names)
+
+    def clear_cache(self):
+        """Removes all cache files, including the snapshot of the available
+        VizieR tables."""
+        super().clear_cache()
+        (self.cache_location / self._TABLES_SNAPSHOT).unlink(missing_ok=True)
+        self._available_tables = None
+
+    def _get_available_tables(self, *, cache=True):
+        '''Return the available VizieR tables as a frozenset, from memory,
+        from the snapshot in the cache directory or from the service,
+        whichever is the first to be younger than ``TABLES_TTL`` seconds.
+        '''
+        now = time.time()
+        if (cache and self._available_tables is not None
+                and now - self._available_tables_time < self.TABLES_TTL):
+            return self._available_tables
+
+        names = None
+        snapshot = self.cache_location / self._TABLES_SNAPSHOT
+        if cache and cache_conf.cache_active:
+            try:
+                fetched = snapshot.stat().st_mtime
+            except OSError:
+                fetched = None
+            if fetched is not None and now - fetched < self.TABLES_TTL:
+                names = snapshot.read_text().splitlines()
+
+        if names is None:
+            response = self._request(
+                'GET',
+                url_helpers.urljoin_keep_path(self.URL, 'tables'),
+                {'action': 'getVizieRTableNames', 'RESPONSEFORMAT': 'txt'},
+                cache=False,
+            )
+            response.raise_for_status()
+            names = response.text.splitlines()
+            fetched = now
+            if cache_conf.cache_active:
+                self._write_tables_snapshot(snapshot, names)
+
+        self._available_table_names = names
+        self._available_tables = frozenset(names)
+        self._available_tables_time = fetched
+        return self._available_tables
+
+    def _write_tables_snapshot(self, snapshot, names):
+        '''Atomically replace the snapshot of the available VizieR tables.'''
+        with tempfile.NamedTemporaryFile('w', dir=snapshot.parent, delete=False) as fp:
+            fp.write('\n'.join(names))
+        os.replace(fp.name, snapshot)
 
 
 XMatch = XMatchClass()
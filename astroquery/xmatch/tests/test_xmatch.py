@@ -1,6 +1,8 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+from io import BytesIO
 from pathlib import Path
 
+import numpy as np
 import requests
 import pytest
 from astropy.io import ascii
@@ -8,7 +10,7 @@ from astropy.table import Table
 from astropy.units import arcsec
 
 from astroquery.utils.mocks import MockResponse
-from ...xmatch import XMatch
+from ...xmatch import XMatch, XMatchClass
 
 DATA_DIR = Path(__file__).parent / "data"
 DATA_FILES = {
@@ -32,6 +34,13 @@ class MockResponseXmatch(MockResponse):
         return self.content
 
 
+@pytest.fixture(autouse=True)
+def tmp_cache(monkeypatch, tmp_path):
+    # keep the snapshot of the available tables out of the user's cache
+    monkeypatch.setattr(XMatchClass, 'cache_location', property(lambda self: tmp_path))
+    return tmp_path
+
+
 @pytest.fixture
 def patch_request(request):
     mp = request.getfixturevalue("monkeypatch")
@@ -71,6 +80,37 @@ def test_xmatch_is_avail_table(monkeypatch):
     assert not xm.is_table_available('blablabla')
 
 
+def test_available_tables_ttl_and_snapshot(monkeypatch, tmp_cache):
+    calls = []
+
+    def counting_request(method, url, data, **kwargs):
+        calls.append(kwargs.get('cache'))
+        return request_mockreturn(method, url, data, **kwargs)
+
+    xm = XMatch()
+    monkeypatch.setattr(xm, '_request', counting_request)
+    assert xm.is_table_available('II/311/wise')
+    assert not xm.is_table_available('blablabla')
+    assert len(calls) == 1
+    assert (tmp_cache / 'vizier_tables.txt').exists()
+
+    # a fresh instance reads the snapshot instead of querying the service
+    other = XMatch()
+    monkeypatch.setattr(other, '_request', counting_request)
+    assert other.get_available_tables() == xm.get_available_tables()
+    assert len(calls) == 1
+
+    # refreshed once expired, or when asked explicitly
+    monkeypatch.setattr(xm, 'TABLES_TTL', 0)
+    assert xm.is_table_available('II/246/out')
+    assert len(calls) == 2
+    other.get_available_tables(cache=False)
+    assert len(calls) == 3
+
+    other.clear_cache()
+    assert not (tmp_cache / 'vizier_tables.txt').exists()
+
+
 def test_xmatch_query_local(monkeypatch):
     xm = XMatch()
     monkeypatch.setattr(xm, '_request', request_mockreturn)
@@ -104,3 +144,122 @@ def test_xmatch_query_cat1_table_local(monkeypatch):
         'errHalfMaj', 'errHalfMin', 'errPosAng', 'Jmag', 'Hmag', 'Kmag',
         'e_Jmag', 'e_Hmag', 'e_Kmag', 'Qfl', 'Rfl', 'X', 'MeasureJD']
     assert len(table) == 11
+
+
+class MockXMatchServer:
+    """Match every uploaded row, except the ones with an odd index, to a
+    single counterpart and record the uploaded tables."""
+
+    def __init__(self):
+        self.uploads = []
+
+    def __call__(self, method, url, data, **kwargs):
+        if method == 'GET':
+            return request_mockreturn(method, url, data, **kwargs)
+
+        filename, content = kwargs['files']['cat1']
+        if filename.endswith('.xml'):
+            uploaded = Table.read(BytesIO(content), format='votable')
+        else:
+            uploaded = Table.read(content, format='ascii.csv')
+        self.uploads.append(uploaded)
+
+        matched = uploaded[uploaded['astroquery_index'] % 2 == 0]
+        result = Table([np.full(len(matched), 0.5), matched['ra'], matched['dec'],
+                        matched['astroquery_index'],
+                        [f'J{index:03d}' for index in matched['astroquery_index']]],
+                       names=['angDist', 'ra', 'dec', 'astroquery_index', 'designation'])
+        fp = BytesIO()
+        result.write(fp, format='votable')
+        return MockResponse(content=fp.getvalue())
+
+
+@pytest.fixture
+def input_table():
+    return Table([np.linspace(10, 20, 10), np.linspace(50, -50, 10), np.arange(10),
+                  [f'star{i}' for i in range(10)]],
+                 names=['ra', 'dec', 'my_id', 'name'])
+
+
+def test_xmatch_query_table_uploads_positions(monkeypatch, input_table):
+    xm = XMatch()
+    server = MockXMatchServer()
+    monkeypatch.setattr(xm, '_request', server)
+
+    table = xm.query(cat1=input_table, cat2='vizier:II/246/out', max_distance=5 * arcsec,
+                     colRA1='ra', colDec1='dec')
+
+    assert len(server.uploads) == 1
+    assert server.uploads[0].colnames == ['ra', 'dec', 'astroquery_index']
+    assert table.colnames == ['angDist', 'ra', 'dec', 'my_id', 'name', 'designation']
+    assert list(table['my_id']) == [0, 2, 4, 6, 8]
+    assert list(table['name']) == ['star0', 'star2', 'star4', 'star6', 'star8']
+
+
+def test_xmatch_query_table_chunks(monkeypatch, input_table):
+    xm = XMatch()
+    server = MockXMatchServer()
+    monkeypatch.setattr(xm, '_request', server)
+    monkeypatch.setattr(xm, 'UPLOAD_CHUNK_SIZE', 3)
+
+    payloads = xm.query(cat1=input_table, cat2='vizier:II/246/out', max_distance=5 * arcsec,
+                        colRA1='ra', colDec1='dec', get_query_payload=True)
+    assert len(payloads) == 4
+    assert not server.uploads
+
+    table = xm.query(cat1=input_table, cat2='vizier:II/246/out', max_distance=5 * arcsec,
+                     colRA1='ra', colDec1='dec', upload_format='votable')
+
+    assert sorted(len(upload) for upload in server.uploads) == [2, 2, 3, 3]
+    # the uploads are declination bands
+    assert sorted(server.uploads[0]['dec']) == sorted(
+        input_table['dec'][server.uploads[0]['astroquery_index']])
+    bands = sorted((min(upload['dec']), max(upload['dec'])) for upload in server.uploads)
+    assert all(low[1] < high[0] for low, high in zip(bands, bands[1:]))
+    # the results are joined back in the input order
+    assert list(table['my_id']) == [0, 2, 4, 6, 8]
+    assert list(table['designation']) == ['J000', 'J002', 'J004', 'J006', 'J008']
+
+
+@pytest.mark.parametrize('upload_format', ['csv', 'votable'])
+def test_xmatch_query_two_tables(monkeypatch, input_table, upload_format):
+    uploads = {}
+
+    def server(method, url, data, **kwargs):
+        # match each row of cat1 with the row of cat2 with the same index
+        for catstr, (filename, content) in kwargs['files'].items():
+            assert filename == f'{catstr}.{"xml" if upload_format == "votable" else "csv"}'
+            if upload_format == 'votable':
+                uploads[catstr] = Table.read(BytesIO(content), format='votable')
+            else:
+                uploads[catstr] = Table.read(content, format='ascii.csv')
+        cat1, cat2 = uploads['cat1'], uploads['cat2']
+        assert (data['colRA2'], data['colDec2']) == ('ra2', 'dec2')
+        result = Table([np.full(len(cat1), 0.5)], names=['angDist'])
+        for column in (*cat1.itercols(), *cat2.itercols()):
+            result[column.name] = column
+        fp = BytesIO()
+        result.write(fp, format='votable')
+        return MockResponse(content=fp.getvalue())
+
+    xm = XMatch()
+    monkeypatch.setattr(xm, '_request', server)
+    other = input_table.copy()
+    other['name'] = [f'other{i}' for i in range(10)]
+
+    table = xm.query(cat1=input_table, cat2=other, max_distance=5 * arcsec,
+                     colRA1='ra', colDec1='dec', colRA2='ra', colDec2='dec',
+                     upload_format=upload_format)
+
+    assert uploads['cat1'].colnames == ['ra', 'dec', 'astroquery_index']
+    assert uploads['cat2'].colnames == ['ra2', 'dec2', 'astroquery_index2']
+    assert table.colnames == ['angDist', 'ra', 'dec', 'my_id', 'name',
+                              'ra_1', 'dec_1', 'my_id_1', 'name_1']
+    assert list(table['name']) == [f'star{i}' for i in range(10)]
+    assert list(table['name_1']) == [f'other{i}' for i in range(10)]
+
+
+def test_xmatch_query_invalid_upload_format(input_table):
+    with pytest.raises(ValueError, match='upload_format'):
+        XMatch().query_async(input_table, 'vizier:II/246/out', 5 * arcsec,
+                             colRA1='ra', colDec1='dec', upload_format='fits')